@@ -28,7 +28,11 @@
 
 import re
 import os
-from tempfile import mkstemp
+import csv
+import zipfile
+from shutil import rmtree
+from tempfile import mkstemp, mkdtemp
+from argparse import ArgumentParser
 import itertools
 
 import mx
@@ -59,6 +63,9 @@ _IMAGE_JMH_BENCHMARK_ARGS = [
     '-Dnative-image.benchmark.extra-profile-run-arg=-i5',
 
     '-Dnative-image.benchmark.benchmark-suite-name=jmh',
+
+    # The image does not depend on the selected benchmarks, reuse it as long as the jars do not change.
+    '-Dnative-image.benchmark.reuse-image=true',
 ]
 
 
@@ -175,6 +182,84 @@ build_jvmci_vm_variants('server', 'graal-core', ['-server', '-XX:+EnableJVMCI',
 mx_benchmark.add_java_vm(JvmciJdkVm('client', 'default', ['-server', '-XX:-EnableJVMCI', '-XX:-UseJVMCICompiler', '-XX:TieredStopAtLevel=1']), suite=_suite, priority=1)
 mx_benchmark.add_java_vm(JvmciJdkVm('client', 'hosted', ['-server', '-XX:+EnableJVMCI', '-XX:TieredStopAtLevel=1']), suite=_suite, priority=1)
 
+def _create_debug_values_parser():
+    parser = ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--timers", default=None, help="Comma-separated Graal timers to report instead of the default set.")
+    parser.add_argument("--counters", default=None, help="Comma-separated Graal counters to report instead of the default set.")
+    parser.add_argument("--mem-use-trackers", default=None, help="Comma-separated Graal memory use trackers to report instead of the default set.")
+    return parser
+
+
+mx_benchmark.parsers["debug_values_parser"] = mx_benchmark.ParserEntry(
+    _create_debug_values_parser(),
+    "\n\nFlags for benchmark suites reporting Graal timers, counters and memory use trackers:\n"
+)
+
+
+class AggregatedMetrics(object):
+    """The values written to a -Dgraal.AggregatedMetricsFile, read in a single pass and indexed by name.
+
+    Values of the same metric in the per-isolate files (<root>@<isolate>.csv) are summed up, as done by
+    `mx collate-metrics`. Loaded files are cached by their size and modification time, so all rules
+    reading the metrics of one benchmark execution share one instance.
+    """
+    _cache = {}
+
+    def __init__(self, files):
+        self.values = {}
+        self.units = {}
+        self.names = []
+        for path in files:
+            with open(path) as fp:
+                for row in csv.reader(fp, delimiter=';', quotechar='"', escapechar='\\'):
+                    if not row:
+                        continue
+                    if len(row) != 3:
+                        mx.abort('{}: expected 3 semicolon separated values: {}'.format(path, row))
+                    name, value, unit = row
+                    if name not in self.values:
+                        self.names.append(name)
+                        self.values[name] = 0
+                    self.values[name] += int(value)
+                    self.units[name] = unit
+
+    @staticmethod
+    def files(filename):
+        directory = os.path.dirname(os.path.abspath(filename))
+        isolate_re = re.compile(re.escape(os.path.basename(filename)[:-len('.csv')]) + r'@\d+\.csv$')
+        isolates = sorted(os.path.join(directory, e) for e in os.listdir(directory) if isolate_re.match(e))
+        return ([filename] if os.path.exists(filename) else []) + isolates
+
+    @staticmethod
+    def load(filename):
+        files = AggregatedMetrics.files(filename)
+        key = tuple((f, os.path.getmtime(f), os.path.getsize(f)) for f in files)
+        metrics = AggregatedMetrics._cache.get(filename)
+        if metrics is None or metrics[0] != key:
+            metrics = (key, AggregatedMetrics(files))
+            AggregatedMetrics._cache[filename] = metrics
+        return metrics[1]
+
+    @staticmethod
+    def remove(filename):
+        for f in AggregatedMetrics.files(filename):
+            os.remove(f)
+        AggregatedMetrics._cache.pop(filename, None)
+
+    @staticmethod
+    def clear(filename):
+        """Empties `filename` and removes its per-isolate files, which the next execution would add to."""
+        for f in AggregatedMetrics.files(filename):
+            if f != filename:
+                os.remove(f)
+        open(filename, 'w').close()
+        AggregatedMetrics._cache.pop(filename, None)
+
+    def rows(self, names=None):
+        """Returns the rows for `names`, or for all metrics in file order."""
+        return [{'name': n, 'value': str(self.values[n]), 'unit': self.units[n]} for n in (self.names if names is None else names) if n in self.values]
+
+
 class DebugValueBenchmarkMixin(object):
 
     def before(self, bmSuiteArgs):
@@ -184,9 +269,14 @@ class DebugValueBenchmarkMixin(object):
         super(DebugValueBenchmarkMixin, self).before(bmSuiteArgs)
 
     def after(self, bmSuiteArgs):
-        os.remove(self._debug_values_file)
+        AggregatedMetrics.remove(self._debug_values_file)
         super(DebugValueBenchmarkMixin, self).after(bmSuiteArgs)
 
+    def run(self, benchmarks, bmSuiteArgs):
+        # the metrics of the benchmarks executed before must not be attributed to this one
+        AggregatedMetrics.clear(self._debug_values_file)
+        return super(DebugValueBenchmarkMixin, self).run(benchmarks, bmSuiteArgs)
+
     def vmArgs(self, bmSuiteArgs):
         vmArgs = ['-Dgraal.AggregatedMetricsFile=' + self.get_csv_filename()] +\
                   super(DebugValueBenchmarkMixin, self).vmArgs(bmSuiteArgs)
@@ -206,13 +296,24 @@ class DebugValueBenchmarkMixin(object):
     def get_csv_filename(self):
         return self._debug_values_file
 
+    def debugValueNames(self, bmSuiteArgs, option, default):
+        """Returns the names selected with `option` on the command line, or `default`."""
+        selected = getattr(mx_benchmark.parsers["debug_values_parser"].parser.parse_known_args(bmSuiteArgs)[0], option)
+        return [n for n in selected.split(',') if n] if selected is not None else default
+
+    def parserNames(self):
+        return super(DebugValueBenchmarkMixin, self).parserNames() + ["debug_values_parser"]
+
 
-class DebugValueRule(mx_benchmark.CSVFixedFileRule):
-    def __init__(self, debug_value_file, benchmark, bench_suite, metric_name, filter_fn, vm_flags, metric_unit=("<unit>", str)):
-        # pylint: disable=expression-not-assigned
+class DebugValueRule(mx_benchmark.BaseRule):
+    """Rule for the metrics of an AggregatedMetricsFile.
+
+    If `names` is given, only these metrics are looked up in the index of the loaded file, otherwise
+    all rows are passed to `filter_fn`.
+    """
+    def __init__(self, debug_value_file, benchmark, bench_suite, metric_name, filter_fn, vm_flags, metric_unit=("<unit>", str), names=None):
         super(DebugValueRule, self).__init__(
-            filename=debug_value_file,
-            colnames=['name', 'value', 'unit'],
+            pattern=None,
             replacement={
                 "benchmark": benchmark,
                 "bench-suite": bench_suite,
@@ -227,10 +328,15 @@ class DebugValueRule(mx_benchmark.CSVFixedFileRule):
                 "metric.score-function": "id",
                 "metric.better": "lower",
                 "metric.iteration": 0
-            },
-            filter_fn=filter_fn,
-            delimiter=';', quotechar='"', escapechar='\\'
-        ),
+            }
+        )
+        self.debug_value_file = debug_value_file
+        self.filter_fn = filter_fn
+        self.names = names
+
+    def parseResults(self, text):
+        rows = AggregatedMetrics.load(self.debug_value_file).rows(self.names)
+        return [r for r in (self.filter_fn(row) for row in rows) if r is not None]
 
 
 class TimingBenchmarkMixin(DebugValueBenchmarkMixin):
@@ -252,22 +358,25 @@ class TimingBenchmarkMixin(DebugValueBenchmarkMixin):
     name_re = re.compile(r"(?P<name>\w+)_Accm")
 
     @staticmethod
-    def timerArgs():
-        return ["-Dgraal.Timers=" + ','.join(TimingBenchmarkMixin.timers)]
+    def timerArgs(timers=None):
+        return ["-Dgraal.Timers=" + ','.join(TimingBenchmarkMixin.timers if timers is None else timers)]
+
+    def selectedTimers(self, bmSuiteArgs):
+        return self.debugValueNames(bmSuiteArgs, "timers", TimingBenchmarkMixin.timers)
 
     def vmArgs(self, bmSuiteArgs):
-        vmArgs = TimingBenchmarkMixin.timerArgs() + super(TimingBenchmarkMixin, self).vmArgs(bmSuiteArgs)
+        vmArgs = TimingBenchmarkMixin.timerArgs(self.selectedTimers(bmSuiteArgs)) + super(TimingBenchmarkMixin, self).vmArgs(bmSuiteArgs)
         return vmArgs
 
     def name(self):
         return self.benchSuiteName() + "-timing"
 
     @staticmethod
-    def filterResult(r):
+    def filterResult(r, timers=None):
         m = TimingBenchmarkMixin.name_re.match(r['name'])
         if m:
             name = m.groupdict()['name']
-            if name in TimingBenchmarkMixin.timers:
+            if name in (TimingBenchmarkMixin.timers if timers is None else timers):
                 r['name'] = name
                 return r
         return None
@@ -278,6 +387,7 @@ class TimingBenchmarkMixin(DebugValueBenchmarkMixin):
         return super(TimingBenchmarkMixin, self).shorten_vm_flags(filtered_args)
 
     def rules(self, out, benchmarks, bmSuiteArgs):
+        timers = self.selectedTimers(bmSuiteArgs)
         return [
                    DebugValueRule(
                        debug_value_file=self.get_csv_filename(),
@@ -285,7 +395,8 @@ class TimingBenchmarkMixin(DebugValueBenchmarkMixin):
                        bench_suite=self.benchSuiteName(),
                        metric_name="compile-time",
                        vm_flags=self.shorten_vm_flags(self.vmArgs(bmSuiteArgs)),
-                       filter_fn=TimingBenchmarkMixin.filterResult,
+                       filter_fn=lambda r: TimingBenchmarkMixin.filterResult(r, timers),
+                       names=[t + "_Accm" for t in timers],
                    ),
                ] + super(TimingBenchmarkMixin, self).rules(out, benchmarks, bmSuiteArgs)
 
@@ -301,16 +412,19 @@ class CounterBenchmarkMixin(DebugValueBenchmarkMixin):
     ]
 
     @staticmethod
-    def counterArgs():
-        return "-Dgraal.Counters=" + ','.join(CounterBenchmarkMixin.counters)
+    def counterArgs(counters=None):
+        return "-Dgraal.Counters=" + ','.join(CounterBenchmarkMixin.counters if counters is None else counters)
+
+    def selectedCounters(self, bmSuiteArgs):
+        return self.debugValueNames(bmSuiteArgs, "counters", CounterBenchmarkMixin.counters)
 
     def vmArgs(self, bmSuiteArgs):
-        vmArgs = [CounterBenchmarkMixin.counterArgs()] + super(CounterBenchmarkMixin, self).vmArgs(bmSuiteArgs)
+        vmArgs = [CounterBenchmarkMixin.counterArgs(self.selectedCounters(bmSuiteArgs))] + super(CounterBenchmarkMixin, self).vmArgs(bmSuiteArgs)
         return vmArgs
 
     @staticmethod
-    def filterResult(r):
-        return r if r['name'] in CounterBenchmarkMixin.counters else None
+    def filterResult(r, counters=None):
+        return r if r['name'] in (CounterBenchmarkMixin.counters if counters is None else counters) else None
 
     def shorten_vm_flags(self, args):
         # not need for timer names
@@ -318,6 +432,7 @@ class CounterBenchmarkMixin(DebugValueBenchmarkMixin):
         return super(CounterBenchmarkMixin, self).shorten_vm_flags(filtered_args)
 
     def rules(self, out, benchmarks, bmSuiteArgs):
+        counters = self.selectedCounters(bmSuiteArgs)
         return [
             DebugValueRule(
                 debug_value_file=self.get_csv_filename(),
@@ -326,7 +441,8 @@ class CounterBenchmarkMixin(DebugValueBenchmarkMixin):
                 metric_name="count",
                 metric_unit="#",
                 vm_flags=self.shorten_vm_flags(self.vmArgs(bmSuiteArgs)),
-                filter_fn=CounterBenchmarkMixin.filterResult,
+                filter_fn=lambda r: CounterBenchmarkMixin.filterResult(r, counters),
+                names=counters,
             ),
         ] + super(CounterBenchmarkMixin, self).rules(out, benchmarks, bmSuiteArgs)
 
@@ -346,19 +462,22 @@ class MemUseTrackerBenchmarkMixin(DebugValueBenchmarkMixin):
     name_re = re.compile(r"(?P<name>\w+)_Accm")
 
     @staticmethod
-    def counterArgs():
-        return "-Dgraal.MemUseTrackers=" + ','.join(MemUseTrackerBenchmarkMixin.trackers)
+    def counterArgs(trackers=None):
+        return "-Dgraal.MemUseTrackers=" + ','.join(MemUseTrackerBenchmarkMixin.trackers if trackers is None else trackers)
+
+    def selectedTrackers(self, bmSuiteArgs):
+        return self.debugValueNames(bmSuiteArgs, "mem_use_trackers", MemUseTrackerBenchmarkMixin.trackers)
 
     def vmArgs(self, bmSuiteArgs):
-        vmArgs = [MemUseTrackerBenchmarkMixin.counterArgs()] + super(MemUseTrackerBenchmarkMixin, self).vmArgs(bmSuiteArgs)
+        vmArgs = [MemUseTrackerBenchmarkMixin.counterArgs(self.selectedTrackers(bmSuiteArgs))] + super(MemUseTrackerBenchmarkMixin, self).vmArgs(bmSuiteArgs)
         return vmArgs
 
     @staticmethod
-    def filterResult(r):
+    def filterResult(r, trackers=None):
         m = MemUseTrackerBenchmarkMixin.name_re.match(r['name'])
         if m:
             name = m.groupdict()['name']
-            if name in MemUseTrackerBenchmarkMixin.trackers:
+            if name in (MemUseTrackerBenchmarkMixin.trackers if trackers is None else trackers):
                 r['name'] = name
                 return r
         return None
@@ -369,6 +488,7 @@ class MemUseTrackerBenchmarkMixin(DebugValueBenchmarkMixin):
         return super(MemUseTrackerBenchmarkMixin, self).shorten_vm_flags(filtered_args)
 
     def rules(self, out, benchmarks, bmSuiteArgs):
+        trackers = self.selectedTrackers(bmSuiteArgs)
         return [
             DebugValueRule(
                 debug_value_file=self.get_csv_filename(),
@@ -377,7 +497,8 @@ class MemUseTrackerBenchmarkMixin(DebugValueBenchmarkMixin):
                 metric_name="allocated-memory",
                 metric_unit="B",
                 vm_flags=self.shorten_vm_flags(self.vmArgs(bmSuiteArgs)),
-                filter_fn=MemUseTrackerBenchmarkMixin.filterResult,
+                filter_fn=lambda r: MemUseTrackerBenchmarkMixin.filterResult(r, trackers),
+                names=[t + "_Accm" for t in trackers],
             ),
         ] + super(MemUseTrackerBenchmarkMixin, self).rules(out, benchmarks, bmSuiteArgs)
 
@@ -465,7 +586,171 @@ class JMHJarGraalCoreBenchmarkSuite(mx_benchmark.JMHJarBenchmarkSuite):
 mx_benchmark.add_bm_suite(JMHJarGraalCoreBenchmarkSuite())
 
 
-class JMHDistGraalCoreBenchmarkSuite(mx_benchmark.JMHDistBenchmarkSuite):
+def _create_jmh_dist_batching_parser():
+    parser = ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--jmh-merge-dists", action="store_true",
+                        help="Run the benchmarks of all selected JMH distributions in as few JMH invocations as possible "
+                             "instead of one invocation per distribution.")
+    parser.add_argument("--jmh-shard", default=None, metavar="<index>/<count>",
+                        help="Only run the <index>-th (starting at 0) of <count> deterministic partitions of the benchmarks. "
+                             "Implies --jmh-merge-dists.")
+    return parser
+
+
+mx_benchmark.parsers["jmh_dist_batching_parser"] = mx_benchmark.ParserEntry(
+    _create_jmh_dist_batching_parser(),
+    "\n\nFlags for JMH distribution benchmark suites:\n"
+)
+
+
+class JMHDistBatchingMixin(object):
+    """Runs the benchmarks of several JMH distributions in one JMH invocation.
+
+    Distributions with the same main class are merged: the runtime JVM arguments are built for all of
+    them, with a directory holding the concatenated META-INF/BenchmarkList and META-INF/CompilerHints of
+    all of them first on the class path, which is what JMH reads the benchmarks from. With --jmh-shard,
+    only the entries of the requested partition are kept in that BenchmarkList. Partitions are made by
+    dealing out the sorted benchmark names, so every machine computes the same ones. The datapoints of a
+    merged run keep the bench-suite of the distribution the benchmark comes from.
+    """
+
+    _jmh_resources = ['META-INF/BenchmarkList', 'META-INF/CompilerHints']
+    _jmh_entry_separator = '===,==='
+
+    mergedRun = None
+
+    def jmhDistBatchingArgs(self, bmSuiteArgs):
+        args = mx_benchmark.parsers["jmh_dist_batching_parser"].parser.parse_known_args(bmSuiteArgs)[0]
+        args.shard = None
+        if args.jmh_shard is not None:
+            m = re.match(r'^(\d+)/(\d+)$', args.jmh_shard)
+            if not m or int(m.group(1)) >= int(m.group(2)):
+                mx.abort("Invalid JMH shard '{0}', expected <index>/<count> with 0 <= <index> < <count>".format(args.jmh_shard))
+            args.shard = (int(m.group(1)), int(m.group(2)))
+            args.jmh_merge_dists = True
+        return args
+
+    def mergedDistributionGroups(self):
+        """Returns the selected distributions, grouped by the main class JMH is started with."""
+        groups = {}
+        for dist in mx.sorted_dists():
+            if self.filter_distribution(dist):
+                groups.setdefault(getattr(dist, 'mainClass', None) or 'org.openjdk.jmh.Main', []).append(dist)
+        return sorted(groups.items())
+
+    @staticmethod
+    def _benchmark_name(entry):
+        # a BenchmarkList entry starts with the benchmark class, the generated class and the benchmark method
+        parts = entry.split(JMHDistBatchingMixin._jmh_entry_separator)
+        return parts[0] + '.' + parts[2] if len(parts) > 2 else entry
+
+    def shardEntries(self, entries, shard):
+        if shard is None:
+            return entries
+        index, count = shard
+        names = sorted(set(JMHDistBatchingMixin._benchmark_name(e) for e in entries))
+        selected = set(names[index::count])
+        return [e for e in entries if JMHDistBatchingMixin._benchmark_name(e) in selected]
+
+    def _writeMergedResources(self, dists, shard, directory):
+        """Writes the JMH resources of `dists` to `directory`.
+
+        Returns the number of benchmark entries and the name of the distribution of each benchmark.
+        """
+        contents = dict((resource, []) for resource in JMHDistBatchingMixin._jmh_resources)
+        owners = {}
+        for dist in dists:
+            with zipfile.ZipFile(dist.path) as jar:
+                names = set(jar.namelist())
+                for resource in JMHDistBatchingMixin._jmh_resources:
+                    if resource in names:
+                        lines = [line for line in jar.read(resource).decode('utf-8').splitlines() if line.strip()]
+                        contents[resource].extend(lines)
+                        if resource == 'META-INF/BenchmarkList':
+                            for line in lines:
+                                owners.setdefault(JMHDistBatchingMixin._benchmark_name(line), dist.name)
+        benchmarks = self.shardEntries(contents['META-INF/BenchmarkList'], shard)
+        contents['META-INF/BenchmarkList'] = benchmarks
+        os.makedirs(os.path.join(directory, 'META-INF'))
+        for resource, lines in contents.items():
+            with open(os.path.join(directory, resource), 'w') as fp:
+                fp.write(''.join(line + '\n' for line in lines))
+        return len(benchmarks), owners
+
+    def _distBenchSuiteName(self, dist, bmSuiteArgs):
+        """Returns the bench-suite the datapoints of `dist` have when it is run on its own."""
+        current, self.dist = self.dist, dist
+        try:
+            return super(JMHDistBatchingMixin, self).benchSuiteName(bmSuiteArgs)
+        finally:
+            self.dist = current
+
+    def run(self, benchmarks, bmSuiteArgs):
+        args = self.jmhDistBatchingArgs(bmSuiteArgs)
+        if not args.jmh_merge_dists or self.dist:
+            return super(JMHDistBatchingMixin, self).run(benchmarks, bmSuiteArgs)
+        results = []
+        for mainClass, dists in self.mergedDistributionGroups():
+            directory = mkdtemp(prefix='jmh-merged-')
+            try:
+                count, owners = self._writeMergedResources(dists, args.shard, directory)
+                if count == 0:
+                    mx.log("No benchmarks of {0} in this shard".format(', '.join(d.name for d in dists)))
+                    continue
+                mx.logv("Running the benchmarks of {0} in one JMH invocation".format(', '.join(d.name for d in dists)))
+                self.mergedRun = (os.path.abspath(directory), [d.name for d in dists], mainClass)
+                self.dist = dists[0].name
+                mergedResults = super(JMHDistBatchingMixin, self).run(benchmarks, bmSuiteArgs)
+                suiteNames = {}
+                for datapoint in mergedResults:
+                    dist = owners.get(datapoint.get("benchmark"))
+                    if dist:
+                        if dist not in suiteNames:
+                            suiteNames[dist] = self._distBenchSuiteName(dist, bmSuiteArgs)
+                        datapoint["bench-suite"] = suiteNames[dist]
+                results += mergedResults
+            finally:
+                self.mergedRun = None
+                self.dist = None
+                rmtree(directory, ignore_errors=True)
+        return results
+
+    @staticmethod
+    def _without_classpath(args):
+        result = []
+        skip = False
+        for arg in args:
+            if skip:
+                skip = False
+            elif arg in ('-cp', '-classpath', '--class-path'):
+                skip = True
+            else:
+                result.append(arg)
+        return result
+
+    def vmArgs(self, bmSuiteArgs):
+        vmArgs = super(JMHDistBatchingMixin, self).vmArgs(bmSuiteArgs)
+        if self.mergedRun:
+            # the arguments of the first distribution are replaced by the ones of all merged distributions
+            directory, dists, _ = self.mergedRun
+            vmArgs = mx.get_runtime_jvm_args(dists, cp_prefix=directory) + JMHDistBatchingMixin._without_classpath(vmArgs)
+        return vmArgs
+
+    def getJMHEntry(self, bmSuiteArgs):
+        if self.mergedRun:
+            return [self.mergedRun[2]]
+        return super(JMHDistBatchingMixin, self).getJMHEntry(bmSuiteArgs)
+
+    def benchSuiteName(self, bmSuiteArgs=None):
+        if self.mergedRun:
+            return self.name()
+        return super(JMHDistBatchingMixin, self).benchSuiteName(bmSuiteArgs)
+
+    def parserNames(self):
+        return super(JMHDistBatchingMixin, self).parserNames() + ["jmh_dist_batching_parser"]
+
+
+class JMHDistGraalCoreBenchmarkSuite(JMHDistBatchingMixin, mx_benchmark.JMHDistBenchmarkSuite):
 
     def extraVmArgs(self):
         return super(JMHDistGraalCoreBenchmarkSuite, self).extraVmArgs() + ['-Dnative-image.benchmark.benchmark-name=' + self.name()] + _IMAGE_JMH_BENCHMARK_ARGS
@@ -481,13 +766,15 @@ class JMHDistGraalCoreBenchmarkSuite(mx_benchmark.JMHDistBenchmarkSuite):
 
     def filter_distribution(self, dist):
         return super(JMHDistGraalCoreBenchmarkSuite, self).filter_distribution(dist) and \
-               not any(JMHDistWhiteboxBenchmarkSuite.whitebox_dependency(dist))
+               not JMHDistWhiteboxBenchmarkSuite.is_whitebox(dist)
 
 
 mx_benchmark.add_bm_suite(JMHDistGraalCoreBenchmarkSuite())
 
 
-class JMHDistWhiteboxBenchmarkSuite(mx_benchmark.JMHDistBenchmarkSuite):
+class JMHDistWhiteboxBenchmarkSuite(JMHDistBatchingMixin, mx_benchmark.JMHDistBenchmarkSuite):
+
+    _whitebox_dists = {}
 
     def name(self):
         return "jmh-whitebox"
@@ -505,9 +792,17 @@ class JMHDistWhiteboxBenchmarkSuite(mx_benchmark.JMHDistBenchmarkSuite):
             (dep.name.startswith('org.graalvm.compiler') for dep in dist.archived_deps())
         )
 
+    @staticmethod
+    def is_whitebox(dist):
+        whitebox = JMHDistWhiteboxBenchmarkSuite._whitebox_dists.get(dist.name)
+        if whitebox is None:
+            whitebox = any(JMHDistWhiteboxBenchmarkSuite.whitebox_dependency(dist))
+            JMHDistWhiteboxBenchmarkSuite._whitebox_dists[dist.name] = whitebox
+        return whitebox
+
     def filter_distribution(self, dist):
         return super(JMHDistWhiteboxBenchmarkSuite, self).filter_distribution(dist) and \
-               any(JMHDistWhiteboxBenchmarkSuite.whitebox_dependency(dist))
+               JMHDistWhiteboxBenchmarkSuite.is_whitebox(dist)
 
     def extraVmArgs(self):
         if mx_compiler.isJDK8:
@@ -522,6 +817,8 @@ class JMHDistWhiteboxBenchmarkSuite(mx_benchmark.JMHDistBenchmarkSuite):
         return extra + super(JMHDistWhiteboxBenchmarkSuite, self).extraVmArgs()
 
     def getJMHEntry(self, bmSuiteArgs):
+        if self.mergedRun:
+            return super(JMHDistWhiteboxBenchmarkSuite, self).getJMHEntry(bmSuiteArgs)
         assert self.dist
         return [mx.distribution(self.dist).mainClass]
 
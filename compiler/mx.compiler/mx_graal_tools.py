@@ -32,6 +32,7 @@ import os
 import shutil
 import re
 import sys
+import bisect
 from os.path import join, exists
 from argparse import ArgumentParser, REMAINDER
 
@@ -167,6 +168,60 @@ def hsdis(args, copyToDir=None):
             except IOError as e:
                 mx.warn('Could not copy {} to {}: {}'.format(path, dest, str(e)))
 
+class _SymbolMap(object):
+    """
+    The symbols of an address to symbol map, sorted by address.
+
+    If `ranges` is true, an address within the span of a symbol, which ends at the address of the
+    next symbol, is resolved to the symbol plus the offset into it.
+    """
+
+    def __init__(self, mapFile, ranges=False):
+        symbols = dict()
+        with open(mapFile) as fp:
+            for l in fp:
+                addressAndSymbol = l.rstrip('\r\n').split(' ', 1)
+                if len(addressAndSymbol) == 2:
+                    address, symbol = addressAndSymbol
+                    if address.startswith('0x'):
+                        symbols[_long(address, 16)] = symbol
+        self.symbols = symbols
+        self.addresses = sorted(symbols)
+        self.ranges = ranges
+
+    def lookup(self, address):
+        sym = self.symbols.get(address)
+        if sym or not self.ranges:
+            return sym
+        i = bisect.bisect_right(self.addresses, address) - 1
+        if 0 <= i < len(self.addresses) - 1:
+            start = self.addresses[i]
+            return '{}+0x{:x}'.format(self.symbols[start], address - start)
+        return None
+
+    def symbolize(self, f, outputFile):
+        """
+        Writes `f` with the addresses replaced by their symbols to `outputFile`, one line at a time.
+        Returns whether any address was replaced, `outputFile` is only kept in that case.
+        """
+        addressRE = re.compile(r'0[xX]([A-Fa-f0-9]+)')
+        updated = [False]
+
+        def replace(m):
+            sym = self.lookup(_long(m.group(0), 16))
+            if sym:
+                updated[0] = True
+                return sym
+            return m.group(0)
+
+        with mx.SafeFileCreation(outputFile) as sfc:
+            with open(f) as fp, open(sfc.tmpPath, 'w') as out:
+                for l in fp:
+                    out.write(addressRE.sub(replace, l))
+            if not updated[0]:
+                os.remove(sfc.tmpPath)
+        return updated[0]
+
 def hcfdis(args):
     """disassemble HexCodeFiles embedded in text files
 
@@ -175,6 +230,8 @@ def hcfdis(args):
 
     parser = ArgumentParser(prog='mx hcfdis')
     parser.add_argument('-m', '--map', help='address to symbol map applied to disassembler output')
+    parser.add_argument('--ranges', action='store_true', help='also resolve addresses within a symbol of the map to <symbol>+<offset>')
+    parser.add_argument('--in-place', action='store_true', help='replace the files with their symbolized version instead of writing new_<file>')
     parser.add_argument('files', nargs=REMAINDER, metavar='files...')
 
     args = parser.parse_args(args)
@@ -183,36 +240,12 @@ def hcfdis(args):
     mx.run_java(['-cp', path, 'com.oracle.max.hcfdis.HexCodeFileDis'] + args.files)
 
     if args.map is not None:
-        addressRE = re.compile(r'0[xX]([A-Fa-f0-9]+)')
-        with open(args.map) as fp:
-            lines = fp.read().splitlines()
-        symbols = dict()
-        for l in lines:
-            addressAndSymbol = l.split(' ', 1)
-            if len(addressAndSymbol) == 2:
-                address, symbol = addressAndSymbol
-                if address.startswith('0x'):
-                    address = _long(address, 16)
-                    symbols[address] = symbol
+        symbols = _SymbolMap(args.map, args.ranges)
+
         for f in args.files:
-            with open(f) as fp:
-                lines = fp.read().splitlines()
-            updated = False
-            for i in range(0, len(lines)):
-                l = lines[i]
-                for m in addressRE.finditer(l):
-                    sval = m.group(0)
-                    val = _long(sval, 16)
-                    sym = symbols.get(val)
-                    if sym:
-                        l = l.replace(sval, sym)
-                        updated = True
-                        lines[i] = l
-            if updated:
-                mx.log('updating ' + f)
-                with open('new_' + f, "w") as fp:
-                    for l in lines:
-                        print(l, file=fp)
+            outputFile = f if args.in_place else join(os.path.dirname(f), 'new_' + os.path.basename(f))
+            if symbols.symbolize(f, outputFile):
+                mx.log('updating ' + outputFile)
 
 def jol(args):
     """Java Object Layout"""
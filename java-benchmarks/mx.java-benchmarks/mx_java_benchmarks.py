@@ -29,11 +29,21 @@
 import sys
 import re
 import argparse
+import bisect
+import glob
 import os
 from os.path import join, exists
 import json
+import subprocess
+import threading
+import time
+import calendar
 from shutil import rmtree
-from tempfile import mkdtemp, mkstemp
+try:
+    from shutil import which
+except ImportError:
+    from distutils.spawn import find_executable as which  # pylint: disable=deprecated-module
+from tempfile import mkdtemp, mkstemp, TemporaryFile
 
 import mx
 import mx_benchmark
@@ -148,7 +158,8 @@ class TemporaryWorkdirMixin(mx_benchmark.VmBenchmarkSuite):
         self.workdir = mkdtemp(prefix=self.name() + '-work.', dir='.')
 
     def workingDirectory(self, benchmarks, bmSuiteArgs):
-        return self.workdir
+        # forks running in parallel have their own directory inside the scratch directory
+        return getattr(_fork_local, "workdir", None) or self.workdir
 
     def after(self, bmSuiteArgs):
         if hasattr(self, "keepScratchDir") and self.keepScratchDir:
@@ -161,15 +172,649 @@ class TemporaryWorkdirMixin(mx_benchmark.VmBenchmarkSuite):
         try:
             super(TemporaryWorkdirMixin, self).repairDatapointsAndFail(benchmarks, bmSuiteArgs, partialResults, message)
         finally:
-            if self.workdir:
+            if getattr(_fork_local, "workdir", None):
+                # the fork's directory is not reused, keeping it does not affect the other forks
+                mx.warn("Keeping scratch directory after failed benchmark: {0}".format(_fork_local.workdir))
+                _fork_local.keepWorkdir = True
+            elif self.workdir:
                 # keep old workdir for investigation, create a new one for further benchmarking
                 mx.warn("Keeping scratch directory after failed benchmark: {0}".format(self.workdir))
                 self._create_tmp_workdir()
 
+    def createForkWorkdir(self, fork):
+        """Gives the calling thread, which runs a parallel fork, its own scratch directory."""
+        _fork_local.keepWorkdir = False
+        _fork_local.workdir = mkdtemp(prefix="{0}-work.fork{1}.".format(self.name(), fork), dir='.') if self.workdir else None
+
+    def removeForkWorkdir(self):
+        workdir = getattr(_fork_local, "workdir", None)
+        _fork_local.workdir = None
+        if workdir and not _fork_local.keepWorkdir:
+            if self.keepScratchDir:
+                mx.warn("Scratch directory NOT deleted (--keep-scratch): {0}".format(workdir))
+            else:
+                rmtree(workdir)
+
     def parserNames(self):
         return super(TemporaryWorkdirMixin, self).parserNames() + ["temporary_workdir_parser"]
 
 
+def _create_batching_parser():
+    parser = argparse.ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--batch", action="store_true", help="Run all selected benchmarks in a single VM instead of one VM per benchmark. "
+                        "Select the benchmarks with 'suite' or 'suite:a,b'; 'suite:*' runs one VM per benchmark and is rejected.")
+    return parser
+
+
+mx_benchmark.parsers["batching_parser"] = ParserEntry(
+    _create_batching_parser(),
+    "\n\nFlags for benchmark suites that can run several benchmarks in one VM:\n"
+)
+
+
+class BatchingBenchmarkMixin(object):
+    """Opt-in support for running several benchmarks of a suite in one VM (--batch).
+
+    In batched mode, datapoints are attributed by the benchmark name printed by the harness, and the
+    averaging of the latest iterations is done per benchmark. Batching needs the whole suite or an explicit
+    list of benchmarks: `mx benchmark` expands `suite:*` into one run per benchmark before the suite sees it.
+    """
+    def batchingArgs(self, bmSuiteArgs):
+        return mx_benchmark.parsers["batching_parser"].parser.parse_known_args(bmSuiteArgs)[0]
+
+    def isBatched(self, benchmarks, bmSuiteArgs):
+        if not self.batchingArgs(bmSuiteArgs).batch:
+            return False
+        if benchmarks is not None and len(benchmarks) == 1:
+            mx.abort("--batch runs several benchmarks in one VM but only {0} was selected. "
+                     "Use '{1}' or '{1}:a,b' instead of '{1}:*', which runs one VM per benchmark.".format(benchmarks[0], self.name()))
+        return benchmarks is None or len(benchmarks) > 1
+
+    def batchedBenchmarks(self, benchmarks, bmSuiteArgs):
+        return benchmarks if benchmarks is not None else self.benchmarkList(bmSuiteArgs)
+
+    def addAverageAcrossLatestResultsPerBenchmark(self, results):
+        for benchmark in sorted(set(r["benchmark"] for r in results)):
+            benchmarkResults = [r for r in results if r["benchmark"] == benchmark]
+            count = len(benchmarkResults)
+            self.addAverageAcrossLatestResults(benchmarkResults)
+            results.extend(benchmarkResults[count:])
+
+    def parserNames(self):
+        return super(BatchingBenchmarkMixin, self).parserNames() + ["batching_parser"]
+
+
+def _create_forking_parser():
+    parser = argparse.ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--forks", type=int, default=1, help="Number of VM invocations for each benchmark selection (default: 1).")
+    parser.add_argument("--parallel-forks", type=int, default=1,
+                        help="Maximum number of forks running at the same time, each pinned to its own cores of one NUMA node (default: 1). "
+                             "Only benchmarks with a known thread footprint are run in parallel, all others keep the machine for themselves.")
+    return parser
+
+
+mx_benchmark.parsers["forking_parser"] = ParserEntry(
+    _create_forking_parser(),
+    "\n\nFlags for benchmark suites that can repeat a benchmark in several VMs:\n"
+)
+
+
+_fork_local = threading.local()
+
+
+def _numa_node_cpus():
+    """Returns the CPUs available to this process grouped by NUMA node."""
+    available = os.sched_getaffinity(0)
+    nodes = []
+    nodeRoot = "/sys/devices/system/node"
+    if os.path.isdir(nodeRoot):
+        for node in sorted(n for n in os.listdir(nodeRoot) if re.match(r"^node[0-9]+$", n)):
+            with open(join(nodeRoot, node, "cpulist")) as fp:
+                cpus = set()
+                for part in fp.read().strip().split(","):
+                    if part:
+                        bounds = part.split("-")
+                        cpus.update(range(int(bounds[0]), int(bounds[-1]) + 1))
+            cpus &= available
+            if cpus:
+                nodes.append(sorted(cpus))
+    return nodes or [sorted(available)]
+
+
+# cores for a benchmark with a single application thread: one for that thread, one for the compiler and GC threads
+_singleThreadedFootprint = 2
+
+
+class ForkingBenchmarkMixin(object):
+    """Runs a benchmark selection in several VMs (--forks), optionally at the same time (--parallel-forks).
+
+    Parallel forks are only used for benchmarks whose `threadFootprint` is known. Each fork is pinned
+    to that many cores of a single NUMA node, the cores of concurrently running forks are disjoint,
+    and suites with a `TemporaryWorkdirMixin` give each fork its own scratch directory next to the
+    suite's one.
+    """
+    def forkingArgs(self, bmSuiteArgs):
+        return mx_benchmark.parsers["forking_parser"].parser.parse_known_args(bmSuiteArgs)[0]
+
+    def threadFootprint(self, benchmarks, bmSuiteArgs):
+        """Returns the number of cores used by one fork running `benchmarks`, or None if the fork must
+        have the machine for itself."""
+        return None
+
+    def forkSlots(self, forks, benchmarks, bmSuiteArgs):
+        """Returns the disjoint CPU sets for concurrently running forks, or None to run them sequentially."""
+        parallel = self.forkingArgs(bmSuiteArgs).parallel_forks
+        if parallel < 1:
+            mx.abort("The number of parallel forks must be positive, got: {0}".format(parallel))
+        if parallel == 1 or forks == 1:
+            return None
+        footprint = self.threadFootprint(benchmarks, bmSuiteArgs)
+        if footprint is None:
+            mx.log("Running forks of {0} sequentially, the benchmark has no known thread footprint".format(benchmarks))
+            return None
+        if not hasattr(os, "sched_setaffinity"):
+            mx.warn("Running forks sequentially, pinning forks to cores is not supported on this platform")
+            return None
+        nodeSlots = [[cpus[i:i + footprint] for i in range(0, len(cpus) - footprint + 1, footprint)] for cpus in _numa_node_cpus()]
+        # take the slots from the nodes round-robin so that a few forks spread over all memory controllers
+        slots = []
+        for i in range(max(len(n) for n in nodeSlots)):
+            slots += [n[i] for n in nodeSlots if i < len(n)]
+        if len(slots) < 2:
+            return None
+        return slots[:min(parallel, forks)]
+
+    def runForks(self, runOnce, benchmarks, bmSuiteArgs):
+        forks = self.forkingArgs(bmSuiteArgs).forks
+        if forks < 1:
+            mx.abort("The number of forks must be positive, got: {0}".format(forks))
+        forkResults = [None] * forks
+        slots = self.forkSlots(forks, benchmarks, bmSuiteArgs)
+        if slots is None:
+            for fork in range(forks):
+                forkResults[fork] = runOnce(benchmarks, bmSuiteArgs)
+        else:
+            self._runParallelForks(runOnce, benchmarks, bmSuiteArgs, slots, forkResults)
+        results = []
+        for fork in range(forks):
+            if forks > 1:
+                for datapoint in forkResults[fork]:
+                    datapoint["metric.fork-number"] = fork
+            results += forkResults[fork]
+        return results
+
+    def _runParallelForks(self, runOnce, benchmarks, bmSuiteArgs, slots, forkResults):
+        pending = list(range(len(forkResults)))
+        lock = threading.Lock()
+        errors = []
+
+        def _worker(cpus):
+            # the affinity of the calling thread is inherited by the VMs it starts
+            os.sched_setaffinity(0, cpus)
+            while True:
+                with lock:
+                    if errors or not pending:
+                        return
+                    fork = pending.pop(0)
+                try:
+                    mx.logv("Running fork {0} of {1} on CPUs {2}".format(fork, benchmarks, cpus))
+                    if isinstance(self, TemporaryWorkdirMixin):
+                        self.createForkWorkdir(fork)
+                    forkResults[fork] = runOnce(benchmarks, bmSuiteArgs)
+                except BaseException as e: # pylint: disable=broad-except
+                    with lock:
+                        errors.append(e)
+                    return
+                finally:
+                    if isinstance(self, TemporaryWorkdirMixin):
+                        self.removeForkWorkdir()
+
+        threads = [threading.Thread(target=_worker, args=(cpus,)) for cpus in slots]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+
+    def parserNames(self):
+        return super(ForkingBenchmarkMixin, self).parserNames() + ["forking_parser"]
+
+
+def _create_steady_state_parser():
+    parser = argparse.ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--steady-state", action="store_true",
+                        help="Report the average of the iterations after the detected steady state instead of the average of a fixed number of latest iterations. "
+                             "Suites whose harness supports it stop early once the iteration times are stable and run longer if they are not.")
+    parser.add_argument("--steady-state-window", type=int, default=5, help="Number of consecutive iterations that must be stable (default: 5).")
+    parser.add_argument("--steady-state-cov", type=float, default=2.0,
+                        help="Coefficient of variation in percent below which a window of iterations is stable (default: 2.0).")
+    parser.add_argument("--steady-state-max-factor", type=float, default=2.0,
+                        help="Upper bound for the number of iterations as a multiple of the configured count, for harnesses that can stop early (default: 2.0).")
+    return parser
+
+
+mx_benchmark.parsers["steady_state_parser"] = ParserEntry(
+    _create_steady_state_parser(),
+    "\n\nFlags for benchmark suites with statistical steady-state detection:\n"
+)
+
+
+# two-sided 95% quantiles of the Student's t-distribution by degrees of freedom
+_t95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+
+def _mean_and_stddev(values):
+    mean = float(sum(values)) / len(values)
+    if len(values) < 2:
+        return mean, 0.0
+    return mean, (sum((v - mean) ** 2 for v in values) / (len(values) - 1)) ** 0.5
+
+
+def steady_state_start(values, window, cov):
+    """Returns the index of the first value after the last change point, i.e., the earliest index
+    from which on every window of `window` consecutive values has a coefficient of variation of
+    at most `cov` percent. Returns None if the latest window is not stable."""
+    start = None
+    for i in range(len(values) - window, -1, -1):
+        mean, stddev = _mean_and_stddev(values[i:i + window])
+        if mean <= 0 or 100.0 * stddev / mean > cov:
+            break
+        start = i
+    return start
+
+
+def confidence_interval(values):
+    """Returns the mean of `values` and the half-width of its 95% confidence interval."""
+    mean, stddev = _mean_and_stddev(values)
+    if len(values) < 2:
+        return mean, 0.0
+    df = len(values) - 1
+    t = _t95[df - 1] if df <= len(_t95) else 1.96
+    return mean, t * stddev / len(values) ** 0.5
+
+
+class SteadyStateBenchmarkMixin(mx_benchmark.VmBenchmarkSuite):
+    """Opt-in (--steady-state) replacement of the fixed-count averaging of AveragingBenchmarkMixin.
+
+    The warmup iterations of each benchmark are scanned for the last change point, the score is the
+    average of the iterations after it, and the bounds of its 95% confidence interval are reported as
+    separate datapoints. Benchmarks that never become stable fall back to the fixed-count average.
+    """
+    def steadyStateArgs(self, bmSuiteArgs):
+        args = mx_benchmark.parsers["steady_state_parser"].parser.parse_known_args(bmSuiteArgs)[0]
+        if args.steady_state_window < 2:
+            mx.abort("The steady-state window must span at least 2 iterations, got: {0}".format(args.steady_state_window))
+        return args
+
+    def isSteadyState(self, bmSuiteArgs):
+        return self.steadyStateArgs(bmSuiteArgs).steady_state
+
+    def maxSteadyStateIterations(self, iterations, bmSuiteArgs):
+        return max(iterations, int(iterations * self.steadyStateArgs(bmSuiteArgs).steady_state_max_factor + 0.5))
+
+    def addSteadyStateResults(self, results, bmSuiteArgs, metricName="time"):
+        args = self.steadyStateArgs(bmSuiteArgs)
+        for benchmark in sorted(set(r["benchmark"] for r in results)):
+            warmupResults = sorted((r for r in results if r["benchmark"] == benchmark and r["metric.name"] == "warmup"),
+                                   key=lambda r: r["metric.iteration"])
+            if not warmupResults:
+                continue
+            values = [r["metric.value"] for r in warmupResults]
+            start = steady_state_start(values, args.steady_state_window, args.steady_state_cov)
+            if start is None:
+                mx.warn("{0} did not reach a steady state within {1} iterations (window {2}, CoV {3}%), averaging the latest iterations".format(
+                    benchmark, len(values), args.steady_state_window, args.steady_state_cov))
+                benchmarkResults = [r for r in results if r["benchmark"] == benchmark]
+                count = len(benchmarkResults)
+                self.addAverageAcrossLatestResults(benchmarkResults, metricName)
+                results.extend(benchmarkResults[count:])
+                continue
+            mean, halfWidth = confidence_interval(values[start:])
+            for name, value in [(metricName, mean), (metricName + "-ci-lower", mean - halfWidth), (metricName + "-ci-upper", mean + halfWidth)]:
+                datapoint = warmupResults[0].copy()
+                datapoint["metric.name"] = name
+                datapoint["metric.value"] = value
+                datapoint["metric.iteration"] = 0
+                datapoint["metric.average-over"] = len(values) - start
+                results.append(datapoint)
+            datapoint = warmupResults[0].copy()
+            datapoint.update({
+                "metric.name": "steady-state-iteration",
+                "metric.value": warmupResults[start]["metric.iteration"],
+                "metric.unit": "#",
+                "metric.iteration": 0,
+            })
+            results.append(datapoint)
+
+    def parserNames(self):
+        return super(SteadyStateBenchmarkMixin, self).parserNames() + ["steady_state_parser"]
+
+
+def _vm_run_dimensions(suite, vm, bmSuiteArgs, vmDims):
+    """Returns the dimensions that VmBenchmarkSuite.runAndReturnStdOut adds to the datapoints of a
+    run, for the suites in this file that start the VM themselves."""
+    vm.extract_vm_info(suite.vmArgs(bmSuiteArgs))
+    host_vm = vm.host_vm() if isinstance(vm, mx_benchmark.GuestVm) else None
+    dims = {
+        "host-vm": host_vm.name() if host_vm else vm.name(),
+        "host-vm-config": suite.host_vm_config_name(host_vm, vm),
+        "guest-vm": vm.name() if host_vm else "none",
+        "guest-vm-config": suite.guest_vm_config_name(host_vm, vm),
+    }
+    dims.update(vmDims)
+    return dims
+
+
+def _validation_patterns(suite, benchmarks, bmSuiteArgs):
+    """Returns the patterns that validateStdoutWithDimensions looks for in the output."""
+    return suite.successPatterns() + suite.failurePatterns() + suite.flakySuccessPatterns() + suite.flakySkipPatterns(benchmarks, bmSuiteArgs)
+
+
+def _create_streaming_output_parser():
+    parser = argparse.ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--stream-output", action="store_true",
+                        help="Evaluate the result rules while the benchmark runs and log each datapoint as soon as it is produced. "
+                             "Only the output lines matched by the rules are kept in memory.")
+    return parser
+
+
+mx_benchmark.parsers["streaming_output_parser"] = ParserEntry(
+    _create_streaming_output_parser(),
+    "\n\nFlags for benchmark suites with live result parsing:\n"
+)
+
+
+def _spans_lines(pattern):
+    """Returns whether a regular expression can match across a line break."""
+    flags = pattern.flags if hasattr(pattern, "flags") else 0
+    text = pattern.pattern if hasattr(pattern, "pattern") else pattern
+    return "\n" in text or r"\n" in text or bool(flags & re.DOTALL)
+
+
+class _StreamingRuleCapture(object):
+    """Output callback that evaluates StdOutRules line by line.
+
+    The `$iteration` variable counts the matches of each rule, as it does when the rule parses the
+    whole output. The datapoints found this way are logged, and the time at which each warmup
+    datapoint was printed is recorded in `warmupTimes`.
+
+    The output is spooled to a temporary file, and only the lines matched by a rule or by one of
+    `patterns` (the success and failure patterns of the suite) are kept in memory. Rules and patterns
+    that can span several lines are evaluated once the run is over, on chunks of `chunkLines` lines
+    of the file that overlap by `overlapLines` lines, and only the text of their matches is kept.
+    `data` is this reduced output, in which the rules find the same matches as in the complete
+    output, so memory stays bounded by what the rules match.
+    """
+    chunkLines = 10000
+    overlapLines = 1000
+
+    def __init__(self, rules, patterns):
+        self.rules = []
+        self.patterns = []
+        self.multiLinePatterns = []
+        for rule in rules:
+            if isinstance(rule, mx_benchmark.StdOutRule):
+                pattern = re.compile(rule.pattern, re.MULTILINE) if isinstance(rule.pattern, str) else rule.pattern
+                if _spans_lines(pattern):
+                    self.multiLinePatterns.append(pattern)
+                else:
+                    self.rules.append([rule, pattern, 0])
+        for pattern in patterns:
+            pattern = re.compile(pattern, re.MULTILINE) if isinstance(pattern, str) else pattern
+            (self.multiLinePatterns if _spans_lines(pattern) else self.patterns).append(pattern)
+        self.partial = ""
+        self.output = TemporaryFile(mode="w+") if self.multiLinePatterns else None
+        self.kept = []
+        self.datapoints = 0
+        self.warmupTimes = []
+
+    def __call__(self, data):
+        if self.output:
+            self.output.write(data)
+        lines = (self.partial + data).split("\n")
+        self.partial = lines.pop()
+        for line in lines:
+            self._line(line)
+
+    def _line(self, line):
+        mx.log(line)
+        keep = any(pattern.search(line) for pattern in self.patterns)
+        for entry in self.rules:
+            rule, pattern, count = entry
+            if not pattern.search(line):
+                continue
+            keep = True
+            replacement = {}
+            for key, value in rule.replacement.items():
+                if isinstance(value, tuple) and "$iteration" in value[0]:
+                    value = (value[0].replace("$iteration", str(count)), value[1])
+                replacement[key] = value
+            for datapoint in mx_benchmark.StdOutRule(rule.pattern, replacement).parse(line):
+                self.datapoints += 1
+                if datapoint.get("metric.name") == "warmup":
+                    self.warmupTimes.append((datapoint.get("benchmark"), time.time()))
+                mx.log("Datapoint {0}: {1} {2} = {3} {4}".format(self.datapoints, datapoint.get("benchmark"), datapoint.get("metric.name"),
+                                                                  datapoint.get("metric.value"), datapoint.get("metric.unit", "")))
+            entry[2] = count + 1
+        if keep:
+            self.kept.append(line)
+
+    def _multiLineMatches(self):
+        """Yields the text of the matches of the multi-line patterns, in the order of the output.
+
+        A match is taken from the first chunk in which it starts before the overlap with the next
+        chunk, so matches spanning up to `overlapLines` lines are found exactly once.
+        """
+        self.output.seek(0)
+        chunk = []
+        for line in self.output:
+            chunk.append(line)
+            if len(chunk) == self.chunkLines:
+                for match in self._chunkMatches(chunk, self.chunkLines - self.overlapLines):
+                    yield match
+                chunk = chunk[-self.overlapLines:]
+        for match in self._chunkMatches(chunk, len(chunk)):
+            yield match
+
+    def _chunkMatches(self, chunk, limit):
+        starts = [0]
+        for line in chunk:
+            starts.append(starts[-1] + len(line))
+        text = "".join(chunk)
+        matches = []
+        for pattern in self.multiLinePatterns:
+            matches += [m for m in pattern.finditer(text) if bisect.bisect_right(starts, m.start()) - 1 < limit]
+        return [m.group(0) for m in sorted(matches, key=lambda m: m.start())]
+
+    @property
+    def data(self):
+        if self.partial:
+            self._line(self.partial)
+            self.partial = ""
+        lines = self.kept
+        if self.output:
+            lines = lines + list(self._multiLineMatches())
+            self.output.close()
+            self.output = None
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class StreamingOutputMixin(mx_benchmark.VmBenchmarkSuite):
+    """Opt-in (--stream-output) evaluation of the suite's and the VM's StdOutRules while the benchmark
+    is running.
+
+    Datapoints are logged as the iterations complete, which gives live feedback for long runs. Only
+    the output lines matched by the rules and by the success and failure patterns are kept, and the
+    reported datapoints come from parsing them after the run, as without streaming (see
+    _StreamingRuleCapture).
+    """
+    def isStreamingOutput(self, bmSuiteArgs):
+        return mx_benchmark.parsers["streaming_output_parser"].parser.parse_known_args(bmSuiteArgs)[0].stream_output
+
+    def runAndReturnStdOut(self, benchmarks, bmSuiteArgs):
+        vm = self.get_vm_registry().get_vm_from_suite_args(bmSuiteArgs)
+        if not self.isStreamingOutput(bmSuiteArgs) or not hasattr(vm, "run_vm"):
+            return super(StreamingOutputMixin, self).runAndReturnStdOut(benchmarks, bmSuiteArgs)
+        cwd = self.workingDirectory(benchmarks, bmSuiteArgs)
+        args = self.createCommandLineArgs(benchmarks, bmSuiteArgs)
+        if args is None:
+            return 0, "", {}
+        args = vm.post_process_command_line_args(args)
+        mx.log("Running {0} with args: {1}".format(vm.name(), args))
+        out = _StreamingRuleCapture(self.rules("", benchmarks, bmSuiteArgs) + vm.rules("", benchmarks, bmSuiteArgs),
+                                    self.outputPatterns(benchmarks, bmSuiteArgs))
+        code = vm.run_vm(args, out=out, err=out, cwd=cwd, nonZeroIsFatal=False)
+        _fork_local.warmupTimes = out.warmupTimes
+        out = out.data
+        return code, out, _vm_run_dimensions(self, vm, bmSuiteArgs, vm.dimensions(cwd, args, code, out))
+
+    def outputPatterns(self, benchmarks, bmSuiteArgs):
+        """The patterns of output lines that are needed after the run, besides those of the rules."""
+        return _validation_patterns(self, benchmarks, bmSuiteArgs)
+
+    def parserNames(self):
+        return super(StreamingOutputMixin, self).parserNames() + ["streaming_output_parser"]
+
+
+def _create_telemetry_parser():
+    parser = argparse.ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--telemetry", action="store_true",
+                        help="Record GC, thread allocation and compilation events with Flight Recorder and report them per iteration (requires JDK 11+).")
+    return parser
+
+
+mx_benchmark.parsers["telemetry_parser"] = ParserEntry(
+    _create_telemetry_parser(),
+    "\n\nFlags for benchmark suites with per-iteration telemetry:\n"
+)
+
+
+_jfr_timestamp = re.compile(r"^(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)(\.\d+)?(Z|([+-])(\d+):(\d+))?$")
+_jfr_duration = re.compile(r"^PT(?:(-?\d+)H)?(?:(-?\d+)M)?(?:(-?[0-9.]+)S)?$")
+
+
+def _parse_jfr_timestamp(value):
+    """Converts an ISO-8601 timestamp printed by `jfr print --json` to seconds since the epoch."""
+    m = _jfr_timestamp.match(value)
+    if not m:
+        mx.abort("Unexpected timestamp in Flight Recorder output: " + value)
+    seconds = calendar.timegm(tuple(int(m.group(i)) for i in range(1, 7))) + float(m.group(7) or 0)
+    if m.group(9):
+        offset = 3600 * int(m.group(10)) + 60 * int(m.group(11))
+        seconds -= offset if m.group(9) == "+" else -offset
+    return seconds
+
+
+def _parse_jfr_duration(value):
+    """Converts an ISO-8601 duration printed by `jfr print --json` to milliseconds."""
+    m = _jfr_duration.match(value)
+    if not m:
+        mx.abort("Unexpected duration in Flight Recorder output: " + value)
+    return 1000.0 * (3600 * int(m.group(1) or 0) + 60 * int(m.group(2) or 0) + float(m.group(3) or 0))
+
+
+class TelemetryBenchmarkMixin(mx_benchmark.VmBenchmarkSuite):
+    """Opt-in (--telemetry) per-iteration GC, allocation and compilation metrics.
+
+    The VM records the events listed in telemetry.jfc into the working directory. After the run, they
+    are attributed to the iteration during which they started, using the times at which the warmup
+    datapoints were printed, and reported as extra metrics with the iteration of that datapoint:
+    gc-count, gc-pause-time, allocated-memory, compiled-methods and compile-time. The allocated memory
+    is the growth of the per-thread allocation counters, which are sampled every 100 ms, so it is
+    attributed to iterations at that granularity. Telemetry implies --stream-output, which provides the
+    times.
+    """
+    recordingName = "telemetry.jfr"
+
+    def isTelemetry(self, bmSuiteArgs):
+        return mx_benchmark.parsers["telemetry_parser"].parser.parse_known_args(bmSuiteArgs)[0].telemetry
+
+    def isStreamingOutput(self, bmSuiteArgs):
+        return self.isTelemetry(bmSuiteArgs) or super(TelemetryBenchmarkMixin, self).isStreamingOutput(bmSuiteArgs)
+
+    def vmArgs(self, bmSuiteArgs):
+        vmArgs = super(TelemetryBenchmarkMixin, self).vmArgs(bmSuiteArgs)
+        if self.isTelemetry(bmSuiteArgs):
+            if java_home_jdk().javaCompliance < '11':
+                mx.abort("--telemetry requires Flight Recorder of JDK 11 or later")
+            vmArgs = vmArgs + ["-XX:StartFlightRecording=filename={0},settings={1},dumponexit=true".format(
+                self.recordingName, join(_suite.mxDir, "telemetry.jfc"))]
+        return vmArgs
+
+    def readTelemetryEvents(self, recording):
+        jfr = join(java_home_jdk().home, "bin", mx.exe_suffix("jfr"))
+        out = mx.OutputCapture()
+        mx.run([jfr, "print", "--json", "--events", "jdk.GarbageCollection,jdk.ThreadAllocationStatistics,jdk.Compilation", recording], out=out)
+        return json.loads(out.data)["recording"]["events"]
+
+    def addTelemetryResults(self, results, benchmarks, bmSuiteArgs):
+        if not self.isTelemetry(bmSuiteArgs):
+            return
+        recording = join(self.workingDirectory(benchmarks, bmSuiteArgs) or ".", self.recordingName)
+        warmupTimes = getattr(_fork_local, "warmupTimes", None)
+        if not exists(recording) or not warmupTimes:
+            mx.warn("No telemetry recorded for {0}".format(benchmarks))
+            return
+        try:
+            events = self.readTelemetryEvents(recording)
+        finally:
+            os.remove(recording)
+
+        # one window per warmup datapoint, from the previous warmup datapoint of any benchmark
+        windows = [{"benchmark": benchmark, "end": end, "gc-count": 0, "gc-pause-time": 0.0, "allocated-memory": 0,
+                    "compiled-methods": 0, "compile-time": 0.0} for benchmark, end in warmupTimes]
+
+        ends = [w["end"] for w in windows]
+
+        def _window(event):
+            i = bisect.bisect_left(ends, _parse_jfr_timestamp(event["values"]["startTime"]))
+            return windows[i] if i < len(windows) else None
+
+        # the allocation counters are cumulative per thread, a window gets their growth since the previous sample
+        allocatedByThread = {}
+        for event in sorted(events, key=lambda e: e["values"]["startTime"]):
+            values = event["values"]
+            if event["type"] == "jdk.ThreadAllocationStatistics":
+                thread = values["thread"]
+                key = thread.get("javaThreadId") or thread.get("osThreadId")
+                allocated = values["allocated"]
+                w = _window(event)
+                if w:
+                    w["allocated-memory"] += max(0, allocated - allocatedByThread.get(key, 0))
+                allocatedByThread[key] = allocated
+                continue
+            w = _window(event)
+            if w is None:
+                continue
+            if event["type"] == "jdk.GarbageCollection":
+                w["gc-count"] += 1
+                w["gc-pause-time"] += _parse_jfr_duration(values["sumOfPauses"])
+            elif event["type"] == "jdk.Compilation":
+                w["compiled-methods"] += 1
+                w["compile-time"] += _parse_jfr_duration(values["duration"])
+
+        units = {"gc-count": "#", "gc-pause-time": "ms", "allocated-memory": "B", "compiled-methods": "#", "compile-time": "ms"}
+        for benchmark in sorted(set(w["benchmark"] for w in windows)):
+            warmupResults = sorted((r for r in results if r["benchmark"] == benchmark and r["metric.name"] == "warmup"),
+                                   key=lambda r: r["metric.iteration"])
+            for datapoint, w in zip(warmupResults, [w for w in windows if w["benchmark"] == benchmark]):
+                for name in sorted(units):
+                    telemetry = datapoint.copy()
+                    telemetry.update({
+                        "metric.name": name,
+                        "metric.value": w[name],
+                        "metric.unit": units[name],
+                        "metric.better": "lower",
+                    })
+                    results.append(telemetry)
+
+    def parserNames(self):
+        return super(TelemetryBenchmarkMixin, self).parserNames() + ["telemetry_parser"]
+
+
 class ShopCartBenchmarkSuite(mx_benchmark.JMeterBenchmarkSuite):
     """Benchmark suite for the ShopCart benchmark."""
 
@@ -202,10 +847,13 @@ class ShopCartBenchmarkSuite(mx_benchmark.JMeterBenchmarkSuite):
 mx_benchmark.add_bm_suite(ShopCartBenchmarkSuite())
 
 
-class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin, TemporaryWorkdirMixin):
+class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin, BatchingBenchmarkMixin, ForkingBenchmarkMixin, SteadyStateBenchmarkMixin, TelemetryBenchmarkMixin, StreamingOutputMixin, TemporaryWorkdirMixin):
     """Base benchmark suite for DaCapo-based benchmarks.
 
-    This suite can only run a single benchmark in one VM invocation.
+    This suite runs a single benchmark in one VM invocation unless --batch is specified. In batched
+    mode, all benchmarks run with the highest iteration count configured for any of them. With
+    --steady-state, the harness's convergence mode decides when to stop, bounded by a multiple of the
+    configured iteration count.
     """
     def group(self):
         return "Graal"
@@ -234,6 +882,16 @@ class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Ave
     def daCapoIterations(self):
         raise NotImplementedError()
 
+    def daCapoSingleThreaded(self):
+        """Benchmarks with a single application thread, which can run in parallel forks."""
+        return frozenset()
+
+    def threadFootprint(self, benchmarks, bmSuiteArgs):
+        benchmarks = self.batchedBenchmarks(benchmarks, bmSuiteArgs)
+        if all(benchname in self.daCapoSingleThreaded() for benchname in benchmarks):
+            return _singleThreadedFootprint
+        return None
+
     def validateEnvironment(self):
         if not self.daCapoPath():
             raise RuntimeError(
@@ -260,33 +918,63 @@ class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Ave
                 iterations = iterations + self.getExtraIterationCount(iterations)
                 return ["-n", str(iterations)] + remaining
 
+    def batchedRunArgs(self, benchmarks, bmSuiteArgs):
+        """Returns the benchmarks to run in one VM and the run arguments for them."""
+        if not self.isBatched(benchmarks, bmSuiteArgs):
+            return benchmarks, self.postprocessRunArgs(benchmarks[0], self.runArgs(bmSuiteArgs))
+        runnable = []
+        runArgs = None
+        for benchname in self.batchedBenchmarks(benchmarks, bmSuiteArgs):
+            benchRunArgs = self.postprocessRunArgs(benchname, self.runArgs(bmSuiteArgs))
+            if benchRunArgs is None:
+                mx.warn("Skipping {0} in batched run, no iteration count configured".format(benchname))
+                continue
+            runnable.append(benchname)
+            if runArgs is None or int(benchRunArgs[benchRunArgs.index("-n") + 1]) > int(runArgs[runArgs.index("-n") + 1]):
+                runArgs = benchRunArgs
+        return runnable, runArgs
+
     def createCommandLineArgs(self, benchmarks, bmSuiteArgs):
-        if benchmarks is None:
-            raise RuntimeError(
-                "Suite runs only a single benchmark.")
-        if len(benchmarks) != 1:
-            raise RuntimeError(
-                "Suite runs only a single benchmark, got: {0}".format(benchmarks))
-        runArgs = self.postprocessRunArgs(benchmarks[0], self.runArgs(bmSuiteArgs))
+        if not self.isBatched(benchmarks, bmSuiteArgs):
+            if benchmarks is None:
+                raise RuntimeError(
+                    "Suite runs only a single benchmark unless --batch is specified.")
+            if len(benchmarks) != 1:
+                raise RuntimeError(
+                    "Suite runs only a single benchmark unless --batch is specified, got: {0}".format(benchmarks))
+        benchmarks, runArgs = self.batchedRunArgs(benchmarks, bmSuiteArgs)
         if runArgs is None:
             return None
         return (
                 self.vmArgs(bmSuiteArgs) + ["-jar"] + [self.daCapoPath()] +
-                [benchmarks[0]] + runArgs)
+                benchmarks + runArgs + self.convergenceArgs(runArgs, bmSuiteArgs))
+
+    def convergenceArgs(self, runArgs, bmSuiteArgs):
+        """Harness arguments that let the benchmark run until its iteration times converge."""
+        if not self.isSteadyState(bmSuiteArgs):
+            return []
+        args = self.steadyStateArgs(bmSuiteArgs)
+        iterations = int(runArgs[runArgs.index("-n") + 1])
+        return [
+            "-C",
+            "--window", str(args.steady_state_window),
+            "--variance", str(args.steady_state_cov),
+            "--max-iterations", str(self.maxSteadyStateIterations(iterations, bmSuiteArgs))
+        ]
 
     def repairDatapoints(self, benchmarks, bmSuiteArgs, partialResults):
-        parser = argparse.ArgumentParser(add_help=False)
-        parser.add_argument("-n", default=None)
-        args, _ = parser.parse_known_args(self.runArgs(bmSuiteArgs))
-        if args.n and args.n.isdigit():
-            iterations = int(args.n)
-        else:
-            iterations = self.daCapoIterations()[benchmarks[0]]
-            iterations = iterations + self.getExtraIterationCount(iterations)
+        benchmarks, runArgs = self.batchedRunArgs(benchmarks, bmSuiteArgs)
+        if runArgs is None:
+            return
+        iterations = int(runArgs[runArgs.index("-n") + 1])
+        for benchname in benchmarks:
+            self._repairBenchmarkDatapoints(benchname, iterations, bmSuiteArgs, partialResults)
+
+    def _repairBenchmarkDatapoints(self, benchname, iterations, bmSuiteArgs, partialResults):
         for i in range(0, iterations):
-            if next((p for p in partialResults if p["metric.iteration"] == i), None) is None:
+            if next((p for p in partialResults if p["benchmark"] == benchname and p["metric.iteration"] == i), None) is None:
                 datapoint = {
-                    "benchmark": benchmarks[0],
+                    "benchmark": benchname,
                     "bench-suite": self.benchSuiteName(),
                     "vm": "jvmci",
                     "config.name": "default",
@@ -301,7 +989,7 @@ class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Ave
                 }
                 partialResults.append(datapoint)
         datapoint = {
-            "benchmark": benchmarks[0],
+            "benchmark": benchname,
             "bench-suite": self.benchSuiteName(),
             "vm": "jvmci",
             "config.name": "default",
@@ -348,10 +1036,19 @@ class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Ave
         return mx_benchmark.Rule.crop_back("...")(' '.join(args))
 
     def rules(self, out, benchmarks, bmSuiteArgs):
-        runArgs = self.postprocessRunArgs(benchmarks[0], self.runArgs(bmSuiteArgs))
+        _, runArgs = self.batchedRunArgs(benchmarks, bmSuiteArgs)
         if runArgs is None:
             return []
-        totalIterations = int(runArgs[runArgs.index("-n") + 1])
+        if self.isSteadyState(bmSuiteArgs):
+            # the number of iterations is decided by the harness, numbered in _numberFinalIterations
+            finalIteration = -1
+        else:
+            finalIteration = int(runArgs[runArgs.index("-n") + 1]) - 1
+        if self.isBatched(benchmarks, bmSuiteArgs):
+            # the rule's match counter spans all benchmarks, use the warmup number printed by the harness
+            warmupIteration = ("<iteration>", lambda n: int(n) - 1)
+        else:
+            warmupIteration = ("$iteration", int)
         return [
             mx_benchmark.StdOutRule(
                 r"===== " + re.escape(self.daCapoSuiteTitle()) + " (?P<benchmark>[a-zA-Z0-9_]+) PASSED in (?P<time>[0-9]+) msec =====", # pylint: disable=line-too-long
@@ -384,11 +1081,11 @@ class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Ave
                     "metric.type": "numeric",
                     "metric.score-function": "id",
                     "metric.better": "lower",
-                    "metric.iteration": totalIterations - 1
+                    "metric.iteration": finalIteration
                 }
             ),
             mx_benchmark.StdOutRule(
-                r"===== " + re.escape(self.daCapoSuiteTitle()) + " (?P<benchmark>[a-zA-Z0-9_]+) completed warmup [0-9]+ in (?P<time>[0-9]+) msec =====", # pylint: disable=line-too-long
+                r"===== " + re.escape(self.daCapoSuiteTitle()) + " (?P<benchmark>[a-zA-Z0-9_]+) completed warmup (?P<iteration>[0-9]+) in (?P<time>[0-9]+) msec =====", # pylint: disable=line-too-long
                 {
                     "benchmark": ("<benchmark>", str),
                     "bench-suite": self.benchSuiteName(),
@@ -401,15 +1098,31 @@ class BaseDaCapoBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Ave
                     "metric.type": "numeric",
                     "metric.score-function": "id",
                     "metric.better": "lower",
-                    "metric.iteration": ("$iteration", int)
+                    "metric.iteration": warmupIteration
                 }
             )
         ]
 
     def run(self, benchmarks, bmSuiteArgs):
-        results = super(BaseDaCapoBenchmarkSuite, self).run(benchmarks, bmSuiteArgs)
-        self.addAverageAcrossLatestResults(results)
-        return results
+        def _runOnce(benchmarks, bmSuiteArgs):
+            results = super(BaseDaCapoBenchmarkSuite, self).run(benchmarks, bmSuiteArgs)
+            if self.isSteadyState(bmSuiteArgs):
+                self._numberFinalIterations(results)
+            self.addTelemetryResults(results, benchmarks, bmSuiteArgs)
+            if self.isSteadyState(bmSuiteArgs):
+                self.addSteadyStateResults(results, bmSuiteArgs)
+            elif self.isBatched(benchmarks, bmSuiteArgs):
+                self.addAverageAcrossLatestResultsPerBenchmark(results)
+            else:
+                self.addAverageAcrossLatestResults(results)
+            return results
+        return self.runForks(_runOnce, benchmarks, bmSuiteArgs)
+
+    def _numberFinalIterations(self, results):
+        for datapoint in results:
+            if datapoint["metric.name"] == "warmup" and datapoint["metric.iteration"] == -1:
+                datapoint["metric.iteration"] = 1 + max([-1] + [r["metric.iteration"] for r in results
+                                                               if r["metric.name"] == "warmup" and r["benchmark"] == datapoint["benchmark"]])
 
 
 _daCapoIterations = {
@@ -430,6 +1143,9 @@ _daCapoIterations = {
 }
 
 
+_daCapoSingleThreaded = frozenset(["batik", "fop", "jython", "luindex"])
+
+
 class DaCapoBenchmarkSuite(BaseDaCapoBenchmarkSuite): #pylint: disable=too-many-ancestors
     """DaCapo 9.12 (Bach) benchmark suite implementation."""
 
@@ -451,6 +1167,9 @@ class DaCapoBenchmarkSuite(BaseDaCapoBenchmarkSuite): #pylint: disable=too-many-
     def daCapoIterations(self):
         return _daCapoIterations
 
+    def daCapoSingleThreaded(self):
+        return _daCapoSingleThreaded
+
     def flakySuccessPatterns(self):
         return [
             re.compile(
@@ -878,6 +1597,334 @@ class HeapSettingsMixin(object):
         return vmArgs + heap_args
 
 
+def _create_specjbb_parser():
+    parser = argparse.ArgumentParser(add_help=False, usage=mx_benchmark._mx_benchmark_usage_example + " -- <options> -- ...")
+    parser.add_argument("--topology", choices=["composite", "multi"], default="composite",
+                        help="Run SPECjbb in one composite JVM or with a separate controller, transaction injectors and backends (default: composite).")
+    parser.add_argument("--groups", type=int, default=1, help="Number of transaction injector/backend groups of the multi-JVM topology (default: 1).")
+    parser.add_argument("--sweep", action="append", default=[], metavar="NAME=FLAGS",
+                        help="Run the benchmark once per configuration with FLAGS added to the options of the measured VM, reported with config.name NAME.")
+    parser.add_argument("--sweep-baseline", type=float, default=None,
+                        help="max-jOPS of the baseline configuration (default: the result of the first configuration of the sweep).")
+    parser.add_argument("--sweep-abort-below", type=float, default=0.9,
+                        help="Stop a multi-JVM run early once an injection rate step fails below this fraction of the baseline max-jOPS (default: 0.9).")
+    return parser
+
+
+mx_benchmark.parsers["specjbb_parser"] = ParserEntry(
+    _create_specjbb_parser(),
+    "\n\nFlags for the SPECjbb2013 and SPECjbb2015 benchmark suites:\n"
+)
+
+
+class _SpecJbbAbort(Exception):
+    def __init__(self, message, out, dims):
+        super(_SpecJbbAbort, self).__init__(message)
+        self.out = out
+        self.dims = dims
+
+
+class SpecJbbRtCurveRule(mx_benchmark.BaseRule):
+    """Rule for the response-time curve of a SPECjbb2013 or SPECjbb2015 run.
+
+    When the controller is done, the reporter writes the response-time percentiles of every
+    injection rate step to `data/rt-curve` in the report directory of the run, which is found
+    through the binary log file printed by the controller. Each step and percentile becomes one
+    `rt-curve` datapoint, with the percentile (e.g., `p99`, `min` or `max`) as `metric.object` and
+    the step as `metric.iteration`. The injection rate of each step is reported as `rt-curve-ir`
+    with the same iteration.
+    """
+    binaryLogPattern = re.compile(r"Binary log file is (?P<log>\S+)")
+    percentilePattern = re.compile(r"^(?:p\s*)?(?P<p>[0-9]+(?:\.[0-9]+)?)(?:\s*-?\s*(?:th|st|nd|rd))?(?:\s+percentile)?$", re.IGNORECASE)
+    unitPattern = re.compile(r"\((?P<unit>us|ms|ns|s)\)")
+
+    def __init__(self, cwd):
+        super(SpecJbbRtCurveRule, self).__init__(
+            pattern=None,
+            replacement={
+                "benchmark": "default",
+                "vm": "jvmci",
+                "config.name": "default",
+                "metric.name": ("<name>", str),
+                "metric.object": ("<object>", str),
+                "metric.value": ("<value>", float),
+                "metric.unit": ("<unit>", str),
+                "metric.type": "numeric",
+                "metric.score-function": "id",
+                "metric.better": ("<better>", str),
+                "metric.iteration": ("<step>", int)
+            }
+        )
+        self.cwd = cwd
+
+    def rtCurveFile(self, text):
+        logs = [m.group("log") for m in self.binaryLogPattern.finditer(text)]
+        if not logs:
+            return None
+        runDir = os.path.dirname(join(self.cwd, logs[-1]))
+        files = sorted(glob.glob(join(runDir, "report-*", "data", "rt-curve", "*.txt")))
+        overall = [f for f in files if "overall" in os.path.basename(f).lower()]
+        return (overall or files)[-1] if files else None
+
+    def parseResults(self, text):
+        rtCurveFile = self.rtCurveFile(text)
+        if rtCurveFile is None:
+            mx.warn("No SPECjbb RT-curve data found, was the reporter skipped?")
+            return []
+        with open(rtCurveFile) as fp:
+            lines = [l.strip().lstrip("#").strip() for l in fp]
+        results = []
+        columns = None
+        unit = "us"
+        steps = 0
+        for line in lines:
+            fields = [f.strip() for f in re.split(r"[,;\t]", line)]
+            if columns is None:
+                if "percentile" in line.lower() or any(f.lower() in ("min", "max") or re.match(r"^p[0-9]", f) for f in fields[1:]):
+                    columns = [self._percentileName(f) for f in fields]
+                    m = self.unitPattern.search(line)
+                    unit = m.group("unit") if m else unit
+                continue
+            values = [self._number(f) for f in fields]
+            if len(values) != len(columns) or values[0] is None:
+                continue
+            step = str(steps)
+            steps += 1
+            results.append({"name": "rt-curve-ir", "object": "ir", "value": str(values[0]), "unit": "jops", "better": "higher", "step": step})
+            for name, value in zip(columns[1:], values[1:]):
+                if name is not None and value is not None:
+                    results.append({"name": "rt-curve", "object": name, "value": str(value), "unit": unit, "better": "lower", "step": step})
+        if not results:
+            mx.warn("No response-time percentiles found in " + rtCurveFile)
+        return results
+
+    def _percentileName(self, column):
+        column = self.unitPattern.sub("", column).strip()
+        if column.lower() in ("min", "max"):
+            return column.lower()
+        m = self.percentilePattern.match(column)
+        return "p" + m.group("p") if m else None
+
+    @staticmethod
+    def _number(field):
+        try:
+            return float(field)
+        except ValueError:
+            return None
+
+
+class SpecJbbMultiJvmMixin(mx_benchmark.VmBenchmarkSuite):
+    """Multi-JVM topology and configuration sweeps for SPECjbb2013 and SPECjbb2015.
+
+    With --topology multi, the controller and the transaction injectors run on the default JDK, and
+    only the backends run on the benchmarked VM. Each injector/backend group is pinned to its own
+    cores, taken from one NUMA node per group where possible.
+
+    With --sweep, the benchmark is run once per configuration. In the multi-JVM topology, a
+    configuration is stopped as soon as the controller reports an injection rate step below
+    --sweep-abort-below times the baseline max-jOPS as failed, since max-jOPS can then no longer
+    reach the baseline.
+
+    Besides max-jOPS and critical-jOPS, every run reports the injection rate of each step and the
+    response-time percentiles of the RT-curve (see SpecJbbRtCurveRule).
+    """
+    _sweepVmArgs = []
+    stepPattern = r"\(rIR:aIR:PR = (?P<rir>[0-9]+):(?P<air>[0-9]+):(?P<pr>[0-9]+)\)(?:.*\[(?P<verdict>[A-Za-z ]+)\])?"
+
+    def specJbbArgs(self, bmSuiteArgs):
+        return mx_benchmark.parsers["specjbb_parser"].parser.parse_known_args(bmSuiteArgs)[0]
+
+    def specJbbModuleArgs(self):
+        """VM options needed to run the SPECjbb jar on the default JDK."""
+        return []
+
+    def vmArgs(self, bmSuiteArgs):
+        return super(SpecJbbMultiJvmMixin, self).vmArgs(bmSuiteArgs) + self._sweepVmArgs
+
+    def specJbbStepRules(self, bmSuiteArgs):
+        """Rules for the injection rate of every step reported by the controller and for the RT-curve."""
+        rules = [SpecJbbRtCurveRule(self.workingDirectory(None, bmSuiteArgs))]
+        for name, group in [("ir-requested", "<rir>"), ("ir-actual", "<air>")]:
+            rules.append(mx_benchmark.StdOutRule(self.stepPattern, {
+                "benchmark": "default",
+                "vm": "jvmci",
+                "config.name": "default",
+                "metric.name": name,
+                "metric.value": (group, float),
+                "metric.unit": "jops",
+                "metric.type": "numeric",
+                "metric.score-function": "id",
+                "metric.better": "higher",
+                "metric.iteration": ("$iteration", int)
+            }))
+        return rules
+
+    def runSweep(self, runOnce, benchmarks, bmSuiteArgs):
+        args = self.specJbbArgs(bmSuiteArgs)
+        if not args.sweep:
+            return runOnce(benchmarks, bmSuiteArgs)
+        baseline = args.sweep_baseline
+        results = []
+        for config in args.sweep:
+            name, _, flags = config.partition("=")
+            if not name:
+                mx.abort("Sweep configurations are specified as NAME=FLAGS, got: " + config)
+            self._sweepVmArgs = flags.split()
+            self._sweepAbortBelow = baseline * args.sweep_abort_below if baseline else None
+            try:
+                configResults = runOnce(benchmarks, bmSuiteArgs)
+            except _SpecJbbAbort as e:
+                mx.log("Configuration {0} stopped early: {1}".format(name, e))
+                configResults = self.abortedResults(e, benchmarks, bmSuiteArgs)
+            finally:
+                self._sweepVmArgs = []
+                self._sweepAbortBelow = None
+            for datapoint in configResults:
+                datapoint["config.name"] = name
+                if baseline is None and datapoint.get("metric.name") == "max":
+                    baseline = datapoint["metric.value"]
+            results += configResults
+        return results
+
+    def outputPatterns(self, benchmarks, bmSuiteArgs):
+        """The patterns of output lines that are needed after the run, besides those of the rules."""
+        return _validation_patterns(self, benchmarks, bmSuiteArgs) + [SpecJbbRtCurveRule.binaryLogPattern]
+
+    def abortedResults(self, abort, benchmarks, bmSuiteArgs):
+        """The datapoints of a configuration stopped early, with the dimensions of a regular run.
+
+        The output of such a run lacks the success pattern, so it cannot go through
+        validateStdoutWithDimensions. The steps reported until then are still parsed with the rules
+        of the suite and the VM, and a `sweep-aborted` datapoint marks the configuration.
+        """
+        vm = self.get_vm_registry().get_vm_from_suite_args(bmSuiteArgs)
+        results = []
+        for rule in self.rules(abort.out, benchmarks, bmSuiteArgs) + vm.rules(abort.out, benchmarks, bmSuiteArgs):
+            for datapoint in rule.parse(abort.out):
+                datapoint.update(abort.dims)
+                results.append(datapoint)
+        abortedDatapoint = {
+            "benchmark": "default",
+            "vm": "jvmci",
+            "config.name": "default",
+            "metric.name": "sweep-aborted",
+            "metric.value": 1,
+            "metric.unit": "#",
+            "metric.type": "numeric",
+            "metric.score-function": "id",
+            "metric.better": "lower",
+            "metric.iteration": 0
+        }
+        abortedDatapoint.update(abort.dims)
+        results.append(abortedDatapoint)
+        return results
+
+    def _groupCpus(self, groups):
+        if not hasattr(os, "sched_setaffinity"):
+            mx.warn("Not pinning SPECjbb groups, pinning processes to cores is not supported on this platform")
+            return [None] * groups
+        nodes = _numa_node_cpus()
+        cpus = []
+        for g in range(groups):
+            node = nodes[g % len(nodes)]
+            share = (groups - 1 - g % len(nodes)) // len(nodes) + 1  # groups sharing this node
+            size = max(1, len(node) // share)
+            index = g // len(nodes)
+            cpus.append(node[index * size:(index + 1) * size] or node)
+        return cpus
+
+    def runAndReturnStdOut(self, benchmarks, bmSuiteArgs):
+        args = self.specJbbArgs(bmSuiteArgs)
+        if args.topology != "multi":
+            return super(SpecJbbMultiJvmMixin, self).runAndReturnStdOut(benchmarks, bmSuiteArgs)
+        if benchmarks is not None:
+            mx.abort("No benchmark should be specified for the selected suite.")
+        if args.groups < 1:
+            mx.abort("The number of groups must be positive, got: {0}".format(args.groups))
+        vm = self.get_vm_registry().get_vm_from_suite_args(bmSuiteArgs)
+        cwd = self.workingDirectory(benchmarks, bmSuiteArgs)
+        java = [java_home_jdk().java] + self.specJbbModuleArgs()
+        jar = self.specJbbClassPath()
+        controller = java + ["-Dspecjbb.group.count={0}".format(args.groups), "-Dspecjbb.txi.pergroup.count=1",
+                             "-jar", jar, "-m", "multicontroller"] + self.runArgs(bmSuiteArgs)
+        injectors = []
+        backends = []
+        try:
+            for g, cpus in enumerate(self._groupCpus(args.groups)):
+                group = "GRP{0}".format(g + 1)
+                injector = self._pinned(cpus) + java + ["-jar", jar, "-m", "txinjector", "-G", group, "-J", "JVM{0}".format(2 * g + 1)]
+                mx.logv("Starting transaction injector of {0} on CPUs {1}: {2}".format(group, cpus, " ".join(injector)))
+                injectors.append(subprocess.Popen(injector, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True))
+                threading.Thread(target=self._logOutput, args=(injectors[-1], group)).start()
+                backendArgs = vm.post_process_command_line_args(
+                    self.vmArgs(bmSuiteArgs) + self.specJbbModuleArgs() + ["-jar", jar, "-m", "backend", "-G", group, "-J", "JVM{0}".format(2 * g + 2)])
+                backends.append(self._startBackend(vm, group, cpus, backendArgs, cwd))
+            return self._runController(vm, controller, backends[0].args, cwd, benchmarks, bmSuiteArgs)
+        finally:
+            for injector in injectors:
+                if injector.poll() is None:
+                    injector.terminate()
+            for backend in backends:
+                backend.join(60)
+                if backend.is_alive():
+                    mx.warn("SPECjbb backend {0} did not terminate after the controller".format(backend.name))
+
+    def _pinned(self, cpus):
+        """Returns the command prefix that pins a process started while other threads are running."""
+        if not cpus:
+            return []
+        if not which("taskset"):
+            mx.warn("Not pinning SPECjbb transaction injectors, taskset is not available")
+            return []
+        return ["taskset", "-c", ",".join(str(cpu) for cpu in cpus)]
+
+    def _logOutput(self, proc, group):
+        for line in iter(proc.stdout.readline, ""):
+            mx.logv("[" + group + " injector] " + line.rstrip())
+        proc.stdout.close()
+
+    def _startBackend(self, vm, group, cpus, args, cwd):
+        def _run():
+            if cpus:
+                # the affinity of this thread is inherited by the VM it starts
+                os.sched_setaffinity(0, cpus)
+            code = vm.run_vm(args, out=lambda line: mx.logv("[" + group + "] " + line.rstrip()), err=None, cwd=cwd, nonZeroIsFatal=False)
+            if code != 0:
+                mx.warn("SPECjbb backend {0} exited with {1}".format(group, code))
+        mx.log("Starting backend of {0} on CPUs {1} with args: {2}".format(group, cpus, args))
+        backend = threading.Thread(target=_run, name=group)
+        backend.args = args
+        backend.start()
+        return backend
+
+    def _runController(self, vm, controller, backendArgs, cwd, benchmarks, bmSuiteArgs):
+        mx.log("Running SPECjbb controller: " + " ".join(controller))
+        capture = _StreamingRuleCapture(self.rules("", benchmarks, bmSuiteArgs) + vm.rules("", benchmarks, bmSuiteArgs),
+                                        self.outputPatterns(benchmarks, bmSuiteArgs))
+        step = re.compile(self.stepPattern)
+        abortBelow = getattr(self, "_sweepAbortBelow", None)
+        proc = subprocess.Popen(controller, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        aborted = None
+        for line in iter(proc.stdout.readline, ""):
+            capture(line)
+            m = step.search(line)
+            # the controller reports the verdict of each step, e.g., [OK] or [FAILED]
+            if abortBelow and m and (m.group("verdict") or "").strip().upper().startswith("FAIL") and float(m.group("rir")) < abortBelow:
+                aborted = "controller reported step with injection rate {0} as failed, below {1} jOPS".format(m.group("rir"), abortBelow)
+                proc.terminate()
+                break
+        proc.stdout.close()
+        code = proc.wait()
+        out = capture.data
+        dims = _vm_run_dimensions(self, vm, bmSuiteArgs, vm.dimensions(cwd, backendArgs, code, out))
+        if aborted:
+            raise _SpecJbbAbort(aborted, out, dims)
+        return code, out, dims
+
+    def parserNames(self):
+        return super(SpecJbbMultiJvmMixin, self).parserNames() + ["specjbb_parser"]
+
+
 class SpecJbb2005BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMixin):
     """SPECjbb2005 benchmark suite implementation.
 
@@ -1023,7 +2070,7 @@ class SpecJbb2005BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMix
 mx_benchmark.add_bm_suite(SpecJbb2005BenchmarkSuite())
 
 
-class SpecJbb2013BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMixin):
+class SpecJbb2013BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMixin, SpecJbbMultiJvmMixin):
     """SPECjbb2013 benchmark suite implementation.
 
     This suite has only a single benchmark, and does not allow setting a specific
@@ -1093,7 +2140,7 @@ class SpecJbb2013BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMix
 
     def rules(self, out, benchmarks, bmSuiteArgs):
         result_pattern = r"^RUN RESULT: hbIR \(max attempted\) = [0-9]+, hbIR \(settled\) = [0-9]+, max-jOPS = (?P<max>[0-9]+), critical-jOPS = (?P<critical>[0-9]+)$" # pylint: disable=line-too-long
-        return [
+        return self.specJbbStepRules(bmSuiteArgs) + [
             mx_benchmark.StdOutRule(
                 result_pattern,
                 {
@@ -1126,11 +2173,14 @@ class SpecJbb2013BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMix
             )
         ]
 
+    def run(self, benchmarks, bmSuiteArgs):
+        return self.runSweep(super(SpecJbb2013BenchmarkSuite, self).run, benchmarks, bmSuiteArgs)
+
 
 mx_benchmark.add_bm_suite(SpecJbb2013BenchmarkSuite())
 
 
-class SpecJbb2015BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMixin):
+class SpecJbb2015BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMixin, SpecJbbMultiJvmMixin, StreamingOutputMixin):
     """SPECjbb2015 benchmark suite implementation.
 
     This suite has only a single benchmark, and does not allow setting a specific
@@ -1177,17 +2227,20 @@ class SpecJbb2015BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMix
     def createCommandLineArgs(self, benchmarks, bmSuiteArgs):
         if benchmarks is not None:
             mx.abort("No benchmark should be specified for the selected suite.")
-        vmArgs = self.vmArgs(bmSuiteArgs)
+        vmArgs = self.vmArgs(bmSuiteArgs) + self.specJbbModuleArgs()
+        runArgs = self.runArgs(bmSuiteArgs)
+        return vmArgs + ["-jar", self.specJbbClassPath(), "-m", "composite"] + runArgs
+
+    def specJbbModuleArgs(self):
         if java_home_jdk().javaCompliance >= '9':
             if java_home_jdk().javaCompliance < '11':
-                vmArgs += ["--add-modules", "java.xml.bind"]
+                return ["--add-modules", "java.xml.bind"]
             else: # >= '11'
                 # JEP-320: Remove the Java EE and CORBA Modules in JDK11 http://openjdk.java.net/jeps/320
                 cp = []
                 mx.library("JAXB_IMPL_2.1.17").walk_deps(visit=lambda d, _: cp.append(d.get_path(resolve=True)))
-                vmArgs += ["--module-path", ":".join(cp), "--add-modules=jaxb.api,jaxb.impl,activation", "--add-opens=java.base/java.lang=jaxb.impl"]
-        runArgs = self.runArgs(bmSuiteArgs)
-        return vmArgs + ["-jar", self.specJbbClassPath(), "-m", "composite"] + runArgs
+                return ["--module-path", ":".join(cp), "--add-modules=jaxb.api,jaxb.impl,activation", "--add-opens=java.base/java.lang=jaxb.impl"]
+        return []
 
     def benchmarkList(self, bmSuiteArgs):
         return ["default"]
@@ -1211,7 +2264,7 @@ class SpecJbb2015BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMix
 
     def rules(self, out, benchmarks, bmSuiteArgs):
         result_pattern = r"^RUN RESULT: hbIR \(max attempted\) = [0-9]+, hbIR \(settled\) = [0-9]+, max-jOPS = (?P<max>[0-9]+), critical-jOPS = (?P<critical>[0-9]+)$" # pylint: disable=line-too-long
-        return [
+        return self.specJbbStepRules(bmSuiteArgs) + [
             mx_benchmark.StdOutRule(
                 result_pattern,
                 {
@@ -1244,6 +2297,9 @@ class SpecJbb2015BenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, HeapSettingsMix
             )
         ]
 
+    def run(self, benchmarks, bmSuiteArgs):
+        return self.runSweep(super(SpecJbb2015BenchmarkSuite, self).run, benchmarks, bmSuiteArgs)
+
 
 mx_benchmark.add_bm_suite(SpecJbb2015BenchmarkSuite())
 
@@ -1277,8 +2333,11 @@ _renaissanceConfig = {
 }
 
 
-class RenaissanceBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin, TemporaryWorkdirMixin):
+class RenaissanceBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin, BatchingBenchmarkMixin, ForkingBenchmarkMixin, SteadyStateBenchmarkMixin, TelemetryBenchmarkMixin, StreamingOutputMixin, TemporaryWorkdirMixin):
     """Renaissance benchmark suite implementation.
+
+    This suite runs a single benchmark per VM instance unless --batch is specified. In batched mode,
+    all benchmarks run with the highest repetition count configured for any of them.
     """
     def name(self):
         return "renaissance"
@@ -1338,17 +2397,19 @@ class RenaissanceBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Av
 
     def createCommandLineArgs(self, benchmarks, bmSuiteArgs):
         benchArg = ""
-        if benchmarks is None:
-            mx.abort("Suite can only run a single benchmark per VM instance.")
-        elif len(benchmarks) == 0:
+        if benchmarks is None and not self.isBatched(benchmarks, bmSuiteArgs):
+            mx.abort("Suite can only run a single benchmark per VM instance unless --batch is specified.")
+        elif benchmarks is not None and len(benchmarks) == 0:
             mx.abort("Must specify at least one benchmark.")
-        else:
-            benchArg = ",".join(benchmarks)
-        runArgs = self.postprocessRunArgs(benchmarks[0], self.runArgs(bmSuiteArgs))
+        benchmarks = self.batchedBenchmarks(benchmarks, bmSuiteArgs)
+        benchArg = ",".join(benchmarks)
+        # all benchmarks in one VM share the repetition count, use the highest one
+        runArgs = max((self.postprocessRunArgs(benchname, self.runArgs(bmSuiteArgs)) for benchname in benchmarks),
+                      key=lambda args: int(args[1]) if args[:1] == ["-r"] else -1)
         return (self.vmArgs(bmSuiteArgs) + ["-jar", self.renaissancePath()] + runArgs + [benchArg])
 
     def benchmarkList(self, bmSuiteArgs):
-        return sorted(_renaissanceConfig.keys())
+        return sorted(self.renaissanceIterations().keys())
 
     def successPatterns(self):
         return []
@@ -1383,9 +2444,17 @@ class RenaissanceBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Av
         ]
 
     def run(self, benchmarks, bmSuiteArgs):
-        results = super(RenaissanceBenchmarkSuite, self).run(benchmarks, bmSuiteArgs)
-        self.addAverageAcrossLatestResults(results)
-        return results
+        def _runOnce(benchmarks, bmSuiteArgs):
+            results = super(RenaissanceBenchmarkSuite, self).run(benchmarks, bmSuiteArgs)
+            self.addTelemetryResults(results, benchmarks, bmSuiteArgs)
+            if self.isSteadyState(bmSuiteArgs):
+                self.addSteadyStateResults(results, bmSuiteArgs)
+            elif self.isBatched(benchmarks, bmSuiteArgs):
+                self.addAverageAcrossLatestResultsPerBenchmark(results)
+            else:
+                self.addAverageAcrossLatestResults(results)
+            return results
+        return self.runForks(_runOnce, benchmarks, bmSuiteArgs)
 
 
 mx_benchmark.add_bm_suite(RenaissanceBenchmarkSuite())
@@ -1494,7 +2563,7 @@ class RenaissanceLegacyBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchm
 mx_benchmark.add_bm_suite(RenaissanceLegacyBenchmarkSuite())
 
 
-class SparkSqlPerfBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin, TemporaryWorkdirMixin):
+class SparkSqlPerfBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin, StreamingOutputMixin, TemporaryWorkdirMixin):
     """Benchmark suite for the spark-sql-perf benchmarks.
     """
     def name(self):
@@ -1548,16 +2617,34 @@ class SparkSqlPerfBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.A
         return []
 
     def decodeStackedJson(self, content):
+        """Yields the JSON documents concatenated in `content`, which is either a string or a file
+        that is read in chunks so that only the document being decoded is kept in memory."""
+        read = getattr(content, "read", None)
+        buf = "" if read else content
+        eof = read is None
         notWhitespace = re.compile(r'[^\s]')
+        decoder = json.JSONDecoder()
         pos = 0
         while True:
-            match = notWhitespace.search(content, pos)
-            if not match:
+            match = notWhitespace.search(buf, pos)
+            if match:
+                try:
+                    part, pos = decoder.raw_decode(buf, match.start())
+                    yield part
+                    continue
+                except ValueError:
+                    if eof:
+                        raise
+                # the document continues in the next chunk
+                buf = buf[match.start():]
+            elif eof:
                 return
-            pos = match.start()
-            decoder = json.JSONDecoder()
-            part, pos = decoder.raw_decode(content, pos)
-            yield part
+            else:
+                buf = ""
+            chunk = read(1 << 16)
+            eof = not chunk
+            buf += chunk
+            pos = 0
 
     def getExtraIterationCount(self, iterations):
         # We average over the last 2 out of 3 total iterations done by this suite.
@@ -1571,28 +2658,27 @@ class SparkSqlPerfBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.A
         perf_dir = next(file for file in os.listdir(self.workdir + "/performance/"))
         experiment_dir = self.workdir + "/performance/" + perf_dir + "/"
         results_filename = next(file for file in os.listdir(experiment_dir) if file.endswith("json"))
-        with open(experiment_dir + results_filename, "r") as results_file:
-            content = results_file.read()
         results = []
         iteration = 0
-        for part in self.decodeStackedJson(content):
-            for result in part["results"]:
-                if "queryExecution" in result:
-                    datapoint = {
-                        "benchmark": result["name"].replace(" ", "-"),
-                        "vm": "jvmci",
-                        "config.name": "default",
-                        "metric.name": "warmup",
-                        "metric.value": result["executionTime"],
-                        "metric.unit": "ms",
-                        "metric.type": "numeric",
-                        "metric.score-function": "id",
-                        "metric.better": "lower",
-                        "metric.iteration": iteration,
-                    }
-                    datapoint.update(dims)
-                    results.append(datapoint)
-            iteration += 1
+        with open(experiment_dir + results_filename, "r") as results_file:
+            for part in self.decodeStackedJson(results_file):
+                for result in part["results"]:
+                    if "queryExecution" in result:
+                        datapoint = {
+                            "benchmark": result["name"].replace(" ", "-"),
+                            "vm": "jvmci",
+                            "config.name": "default",
+                            "metric.name": "warmup",
+                            "metric.value": result["executionTime"],
+                            "metric.unit": "ms",
+                            "metric.type": "numeric",
+                            "metric.score-function": "id",
+                            "metric.better": "lower",
+                            "metric.iteration": iteration,
+                        }
+                        datapoint.update(dims)
+                        results.append(datapoint)
+                iteration += 1
         self.addAverageAcrossLatestResults(results)
         return results
 
@@ -1618,8 +2704,10 @@ _awfyConfig = {
     "Towers"     : 600
 }
 
-class AWFYBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin):
+class AWFYBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.AveragingBenchmarkMixin, ForkingBenchmarkMixin, SteadyStateBenchmarkMixin, TelemetryBenchmarkMixin, StreamingOutputMixin, TemporaryWorkdirMixin):
     """Are we fast yet? benchmark suite implementation.
+
+    All AWFY benchmarks are single-threaded, so their forks can run in parallel (--parallel-forks).
     """
     def name(self):
         return "awfy"
@@ -1701,10 +2789,19 @@ class AWFYBenchmarkSuite(mx_benchmark.JavaBenchmarkSuite, mx_benchmark.Averaging
             )
         ]
 
+    def threadFootprint(self, benchmarks, bmSuiteArgs):
+        return _singleThreadedFootprint
+
     def run(self, benchmarks, bmSuiteArgs):
-        results = super(AWFYBenchmarkSuite, self).run(benchmarks, bmSuiteArgs)
-        self.addAverageAcrossLatestResults(results)
-        return results
+        def _runOnce(benchmarks, bmSuiteArgs):
+            results = super(AWFYBenchmarkSuite, self).run(benchmarks, bmSuiteArgs)
+            self.addTelemetryResults(results, benchmarks, bmSuiteArgs)
+            if self.isSteadyState(bmSuiteArgs):
+                self.addSteadyStateResults(results, bmSuiteArgs)
+            else:
+                self.addAverageAcrossLatestResults(results)
+            return results
+        return self.runForks(_runOnce, benchmarks, bmSuiteArgs)
 
 
 mx_benchmark.add_bm_suite(AWFYBenchmarkSuite())
@@ -0,0 +1,146 @@
+/*
+ * Copyright (c) 2020, 2020, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.truffle.regex.util;
+
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.nio.charset.StandardCharsets;
+
+import org.graalvm.collections.EconomicMap;
+
+import com.oracle.truffle.api.CompilerDirectives;
+
+/**
+ * Loader for the generated tables stored in the compact binary format of
+ * {@code tools/unicode_tables.py}. All integers are unsigned LEB128 varints: the magic
+ * {@code 'TRUT'}, the format version, the number of tables, and for every table the length of its
+ * name, its UTF-8 encoded name, the number of values and the values. Every value is stored as the
+ * zigzag encoded difference to the previous value of its table.
+ */
+public final class BinaryTables {
+
+    private static final byte[] MAGIC = {'T', 'R', 'U', 'T'};
+    private static final int VERSION = 1;
+
+    private final String resourceName;
+    private final byte[] data;
+    private int pos;
+
+    private BinaryTables(String resourceName, byte[] data) {
+        this.resourceName = resourceName;
+        this.data = data;
+    }
+
+    /**
+     * Reads all tables of the resource {@code resourceName}, which is resolved relative to
+     * {@code owner}. The returned map preserves the order of the tables in the resource.
+     */
+    public static EconomicMap<String, int[]> load(Class<?> owner, String resourceName) {
+        byte[] data;
+        try (InputStream in = owner.getResourceAsStream(resourceName)) {
+            if (in == null) {
+                throw CompilerDirectives.shouldNotReachHere("table resource " + resourceName + " not found");
+            }
+            data = readFully(in);
+        } catch (IOException e) {
+            throw CompilerDirectives.shouldNotReachHere(e);
+        }
+        return new BinaryTables(resourceName, data).decode();
+    }
+
+    private static byte[] readFully(InputStream in) throws IOException {
+        ByteArrayOutputStream out = new ByteArrayOutputStream(1 << 14);
+        byte[] buffer = new byte[1 << 13];
+        int n;
+        while ((n = in.read(buffer)) >= 0) {
+            out.write(buffer, 0, n);
+        }
+        return out.toByteArray();
+    }
+
+    private EconomicMap<String, int[]> decode() {
+        for (byte b : MAGIC) {
+            if (pos >= data.length || data[pos++] != b) {
+                throw CompilerDirectives.shouldNotReachHere(resourceName + " is not a TRegex table file");
+            }
+        }
+        int version = readVarInt();
+        if (version != VERSION) {
+            throw CompilerDirectives.shouldNotReachHere(resourceName + ": unsupported table format version " + version);
+        }
+        int count = readVarInt();
+        EconomicMap<String, int[]> tables = EconomicMap.create(count);
+        for (int i = 0; i < count; i++) {
+            int nameLength = readVarInt();
+            String name = new String(data, pos, nameLength, StandardCharsets.UTF_8);
+            pos += nameLength;
+            int[] values = new int[readVarInt()];
+            int prev = 0;
+            for (int j = 0; j < values.length; j++) {
+                int delta = readVarInt();
+                prev += (delta >>> 1) ^ -(delta & 1);
+                values[j] = prev;
+            }
+            tables.put(name, values);
+        }
+        if (pos != data.length) {
+            throw CompilerDirectives.shouldNotReachHere(resourceName + ": trailing data after the last table");
+        }
+        return tables;
+    }
+
+    private int readVarInt() {
+        int value = 0;
+        int shift = 0;
+        while (true) {
+            if (pos >= data.length) {
+                throw CompilerDirectives.shouldNotReachHere(resourceName + ": unexpected end of table file");
+            }
+            int b = data[pos++] & 0xff;
+            value |= (b & 0x7f) << shift;
+            if (b < 0x80) {
+                return value;
+            }
+            shift += 7;
+        }
+    }
+}
@@ -50,10 +50,34 @@
 #   - PropertyAliases.txt
 #   - PropertyValueAliases.txt
 #   - emoji-data.txt (This is part of the Emoji data included in Unicode TR51)
-
+# The properties parsed from ucd.nounihan.flat.xml are cached in
+# $XDG_CACHE_HOME/truffle-regex (~/.cache/truffle-regex by default), keyed by the
+# digest of the file and of this script, so that repeated runs do not parse it again.
+# With --binary <file>, the property sets are also written to <file> in the
+# compact binary format of unicode_tables.py, after verifying that they decode
+# to exactly the sets of the generated Java source.
+
+import hashlib
+import json
 import re
+import sys
 import xml.etree.ElementTree as ET
 import os
+from collections import OrderedDict
+
+import unicode_tables
+
+binary_file = None
+if len(sys.argv) == 3 and sys.argv[1] == '--binary':
+    binary_file = os.path.abspath(sys.argv[2])
+elif len(sys.argv) != 1:
+    print('usage: generate_unicode_properties.py [--binary <file>]', file=sys.stderr)
+    sys.exit(1)
+
+# The version of the cached property data, increment it when its format changes.
+CACHE_FORMAT_VERSION = 1
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'truffle-regex')
+GENERATOR_FILE = os.path.abspath(__file__)
 
 os.chdir('dat')
 
@@ -119,37 +143,60 @@ bin_props_emoji = [
 
 tracked_props = bin_props_xml + bin_props_emoji + ['gc', 'sc', 'scx']
 
+MAX_CODE_POINT = 0x10ffff
+
+# The contents of the properties, as lists of inclusive (first, last) code point ranges.
 prop_contents = {}
 
 
-def add_code_points_to_property(code_points, prop_name):
-    if prop_name in prop_contents:
-        prop_contents[prop_name].extend(code_points)
+def add_range_to_property(first_code_point, last_code_point, prop_name):
+    ranges = prop_contents.setdefault(prop_name, [])
+    if ranges and ranges[-1][1] + 1 == first_code_point:
+        # the data files are mostly ordered by code point, so most ranges just extend the previous one
+        ranges[-1] = (ranges[-1][0], last_code_point)
     else:
-        prop_contents[prop_name] = code_points
+        ranges.append((first_code_point, last_code_point))
 
 
 def add_xml_entry_to_property(entry, prop_name):
     if entry.get('first-cp'):
-        first_code_point = int(entry.get('first-cp'), 16)
-        last_code_point = int(entry.get('last-cp'), 16)
-        add_code_points_to_property(list(range(first_code_point, last_code_point + 1)), prop_name)
+        add_range_to_property(int(entry.get('first-cp'), 16), int(entry.get('last-cp'), 16), prop_name)
     else:
         code_point = int(entry.get('cp'), 16)
-        add_code_points_to_property([code_point], prop_name)
+        add_range_to_property(code_point, code_point, prop_name)
 
 
 def add_txt_entry_to_property(code_points_str, prop_name):
     if '..' in code_points_str:
         [first_code_point, last_code_point] = [int(cps, 16) for cps in code_points_str.split('..')]
-        add_code_points_to_property(list(range(first_code_point, last_code_point + 1)), prop_name)
+        add_range_to_property(first_code_point, last_code_point, prop_name)
     else:
         code_point = int(code_points_str, 16)
-        add_code_points_to_property([code_point], prop_name)
+        add_range_to_property(code_point, code_point, prop_name)
+
 
+def normalize_ranges(ranges):
+    """Returns the sorted ranges covering the same code points as `ranges`, with overlapping and adjacent ranges merged."""
+    normalized = []
+    for (first, last) in sorted(ranges):
+        if normalized and first <= normalized[-1][1] + 1:
+            if last > normalized[-1][1]:
+                normalized[-1] = (normalized[-1][0], last)
+        else:
+            normalized.append((first, last))
+    return normalized
 
-def complement_property(prop):
-    return sorted(set(range(0, 0x110000)) - set(prop))
+
+def complement_ranges(ranges):
+    complement = []
+    next_code_point = 0
+    for (first, last) in normalize_ranges(ranges):
+        if first > next_code_point:
+            complement.append((next_code_point, first - 1))
+        next_code_point = last + 1
+    if next_code_point <= MAX_CODE_POINT:
+        complement.append((next_code_point, MAX_CODE_POINT))
+    return complement
 
 def unicode_file_lines_without_comments(file_name):
     lines = []
@@ -195,21 +242,59 @@ for line in unicode_file_lines_without_comments('PropertyValueAliases.txt'):
 
 # Parse XML
 
-tree = ET.parse('ucd.nounihan.flat.xml')
-root = tree.getroot()
-
-ns = {
-    'unicode': 'http://www.unicode.org/ns/2003/ucd/1.0'
-}
-
-for char_elem in root.find('unicode:repertoire', ns):
-    for bin_prop_name in bin_props_xml:
-        if char_elem.get(bin_prop_name) == 'Y':
-            add_xml_entry_to_property(char_elem, bin_prop_name)
-    add_xml_entry_to_property(char_elem, 'gc=' + char_elem.get('gc'))
-    add_xml_entry_to_property(char_elem, 'sc=' + char_elem.get('sc'))
-    for script in char_elem.get('scx').split():
-        add_xml_entry_to_property(char_elem, 'scx=' + script)
+UNICODE_NS = '{http://www.unicode.org/ns/2003/ucd/1.0}'
+
+
+def parse_ucd_xml(file_name):
+    # Stream the elements of the repertoire and drop each one once all tracked properties were taken from it.
+    repertoire = None
+    depth = 0
+    for event, elem in ET.iterparse(file_name, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 2 and elem.tag == UNICODE_NS + 'repertoire':
+                repertoire = elem
+            continue
+        depth -= 1
+        if depth == 2 and repertoire is not None:
+            for bin_prop_name in bin_props_xml:
+                if elem.get(bin_prop_name) == 'Y':
+                    add_xml_entry_to_property(elem, bin_prop_name)
+            add_xml_entry_to_property(elem, 'gc=' + elem.get('gc'))
+            add_xml_entry_to_property(elem, 'sc=' + elem.get('sc'))
+            for script in elem.get('scx').split():
+                add_xml_entry_to_property(elem, 'scx=' + script)
+            repertoire.clear()
+        elif depth == 1 and elem is repertoire:
+            repertoire = None
+
+
+def file_digest(file_name):
+    digest = hashlib.sha1()
+    with open(file_name, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_ucd_xml(file_name):
+    key = [str(CACHE_FORMAT_VERSION), file_digest(file_name), file_digest(GENERATOR_FILE)] + bin_props_xml
+    digest = hashlib.sha1(' '.join(key).encode('utf-8')).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, file_name + '.' + digest + '.json')
+    if os.path.exists(cache_file):
+        with open(cache_file) as f:
+            for (prop_name, ranges) in json.load(f).items():
+                prop_contents[prop_name] = [tuple(r) for r in ranges]
+        return
+    parse_ucd_xml(file_name)
+    if not os.path.isdir(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+    with open(cache_file + '.tmp', 'w') as f:
+        json.dump(prop_contents, f)
+    os.rename(cache_file + '.tmp', cache_file)
+
+
+load_ucd_xml('ucd.nounihan.flat.xml')
 
 
 # Parse Emoji data
@@ -226,9 +311,9 @@ for line in unicode_file_lines_without_comments('emoji-data.txt'):
 # The following properties are not defined in the Unicode character database. Their
 # definitions are given in Section 1.2.1. of Techinal Report 18
 # (http://www.unicode.org/reports/tr18/tr18-19.html#General_Category_Property).
-prop_contents['Any'] = range(0, 0x110000)
-prop_contents['ASCII'] = range(0, 0x80)
-prop_contents['Assigned'] = complement_property(prop_contents['gc=Cn'])
+prop_contents['Any'] = [(0, MAX_CODE_POINT)]
+prop_contents['ASCII'] = [(0, 0x7f)]
+prop_contents['Assigned'] = complement_ranges(prop_contents['gc=Cn'])
 
 
 # Generate Java source code
@@ -256,21 +341,8 @@ def int_to_java_hex_literal(i):
 
 
 def property_to_java_array_init(prop):
-    ranges = []
-    range_start = None
-    prev_cp = None
-    for cp in prop:
-        if range_start is None:
-            range_start = cp
-        elif cp > prev_cp + 1:
-            ranges.append((range_start, prev_cp))
-            range_start = cp
-        prev_cp = cp
-    if range_start is not None:
-        ranges.append((range_start, prev_cp))
-
     encoding = []
-    for (range_start, range_end) in ranges:
+    for (range_start, range_end) in normalize_ranges(prop):
         encoding.append(range_start)
         encoding.append(range_end)
 
@@ -300,7 +372,7 @@ POPULATE_DEFS = '\n\n'.join(['''private static void populate%s() {
 }''' % (mangle_prop_name(name), name, property_to_java_array_init(prop))
                            for (name, prop) in sorted(prop_contents.items())])
 
-print('''/*
+JAVA_SOURCE = ('''/*
  * Copyright (c) 2018, 2020, Oracle and/or its affiliates. All rights reserved.
  * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
  *
@@ -377,3 +449,10 @@ class UnicodePropertyData {
 }''' % (len(prop_aliases), len(gc_aliases), len(sc_aliases), len(prop_contents),
         indent(PROPERTY_ALIASES, 8), indent(GENERAL_CATEGORY_ALIASES, 8), indent(SCRIPT_ALIASES, 8), indent(POPULATE_CALLS, 8),
         indent(POPULATE_DEFS, 4)))
+
+print(JAVA_SOURCE)
+
+if binary_file:
+    tables = OrderedDict((name, unicode_tables.ranges_to_values(normalize_ranges(prop))) for (name, prop) in sorted(prop_contents.items()))
+    size = unicode_tables.write_verified(tables, binary_file, expected=unicode_tables.java_tables(JAVA_SOURCE))
+    print(f'wrote {len(tables)} property sets ({size} bytes) to {binary_file}', file=sys.stderr)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# This module converts the generated TRegex tables (the Unicode property sets of
+# UnicodePropertyData.java and the case fold tables of CaseFoldTable.bin) into a
+# compact binary form and back. TRegex reads this form with
+# com.oracle.truffle.regex.util.BinaryTables. Run as a script, it extracts the
+# tables of the given Java source file, writes them to the given binary file and
+# verifies that decoding the binary file yields exactly the tables of the Java
+# source:
+#
+#   ./unicode_tables.py ../src/com/oracle/truffle/regex/charset/UnicodePropertyData.java dat/unicode-properties.bin
+#
+# Binary format, all integers are unsigned LEB128 varints:
+#   magic 'TRUT', format version
+#   number of tables
+#   for each table: name length, UTF-8 name, number of values, values
+# Every value is stored as the zigzag encoded difference to the previous value
+# of its table (the first one to 0). The tables consist of sorted code point
+# ranges and (from, to, kind, delta) case fold entries, so most differences fit
+# into one or two bytes.
+
+import re
+import sys
+from collections import OrderedDict
+
+MAGIC = b'TRUT'
+VERSION = 1
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        value |= (b & 0x7f) << shift
+        if b < 0x80:
+            return value, pos
+        shift += 7
+
+
+def zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value >> 1 if value & 1 == 0 else -((value + 1) >> 1)
+
+
+def encode_tables(tables):
+    """Encodes an ordered mapping from table names to lists of ints."""
+    out = bytearray(MAGIC)
+    write_varint(out, VERSION)
+    write_varint(out, len(tables))
+    for (name, values) in tables.items():
+        encoded_name = name.encode('utf-8')
+        write_varint(out, len(encoded_name))
+        out.extend(encoded_name)
+        write_varint(out, len(values))
+        prev = 0
+        for value in values:
+            write_varint(out, zigzag(value - prev))
+            prev = value
+    return bytes(out)
+
+
+def decode_tables(data):
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('not a TRegex table file')
+    version, pos = read_varint(data, len(MAGIC))
+    if version != VERSION:
+        raise ValueError(f'unsupported table format version {version}')
+    count, pos = read_varint(data, pos)
+    tables = OrderedDict()
+    for _ in range(count):
+        name_length, pos = read_varint(data, pos)
+        name = data[pos:pos + name_length].decode('utf-8')
+        pos += name_length
+        length, pos = read_varint(data, pos)
+        values = []
+        prev = 0
+        for _ in range(length):
+            delta, pos = read_varint(data, pos)
+            prev += unzigzag(delta)
+            values.append(prev)
+        tables[name] = values
+    return tables
+
+
+def ranges_to_values(ranges):
+    return [cp for r in ranges for cp in r]
+
+
+def _parse_java_ints(text, constants):
+    values = []
+    for token in text.split(','):
+        token = token.strip()
+        if token:
+            values.append(constants[token] if token in constants else int(token, 0))
+    return values
+
+
+def java_constants(source):
+    return dict((m.group(1), int(m.group(2), 0))
+                for m in re.finditer(r'static final int (\w+) = (-?(?:0x)?[0-9a-fA-F]+);', source))
+
+
+def java_tables(source, constants=None):
+    """Extracts the generated tables from the source of UnicodePropertyData or from the
+    generated case fold tables. `constants` resolves symbolic table entries such as
+    INTEGER_OFFSET and defaults to the int constants declared in `source`."""
+    if constants is None:
+        constants = java_constants(source)
+    tables = OrderedDict()
+    for m in re.finditer(r'SET_ENCODINGS\.put\("([^"]+)",\s*CodePointSet\.createNoDedup\(([^)]*)\)\);', source):
+        tables[m.group(1)] = _parse_java_ints(m.group(2), constants)
+    m = re.search(r'CHARACTER_SET_TABLE = new CodePointSet\[\]\{(.*?)\};', source, re.DOTALL)
+    if m:
+        for (i, s) in enumerate(re.findall(r'rangeSet\(([^)]*)\)', m.group(1))):
+            tables[f'CHARACTER_SET_TABLE[{i}]'] = _parse_java_ints(s, constants)
+    for m in re.finditer(r'(\w+) = new CaseFoldTableImpl\(new int\[\]\{(.*?)\}\);', source, re.DOTALL):
+        tables[m.group(1)] = _parse_java_ints(m.group(2), constants)
+    return tables
+
+
+def write_verified(tables, file_name, expected=None):
+    """Writes `tables` to `file_name`, after checking that they decode to `expected`, which
+    defaults to `tables` themselves."""
+    if expected is None:
+        expected = tables
+    data = encode_tables(tables)
+    decoded = decode_tables(data)
+    if decoded != expected:
+        mismatches = [name for name in set(decoded) | set(expected) if decoded.get(name) != expected.get(name)]
+        raise ValueError('binary tables do not match the Java tables: ' + ', '.join(sorted(mismatches)))
+    with open(file_name, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def main(args):
+    if len(args) != 2:
+        print('usage: unicode_tables.py <Java source> <binary file>')
+        sys.exit(1)
+    with open(args[0]) as f:
+        tables = java_tables(f.read())
+    if not tables:
+        print(f'ERROR: no generated tables found in {args[0]}')
+        sys.exit(1)
+    size = write_verified(tables, args[1])
+    print(f'wrote {len(tables)} tables ({size} bytes) to {args[1]}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
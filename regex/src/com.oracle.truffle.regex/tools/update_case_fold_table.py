@@ -39,13 +39,26 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+# Converts the case fold tables generated by generate_case_fold_table.clj (the
+# Java initializers in dat/case-fold-table.txt) into the binary resource
+# CaseFoldTable.bin that CaseFoldTable.java loads at class initialization. The
+# entry kinds (INTEGER_OFFSET etc.) are resolved with the constants declared in
+# CaseFoldTable.java. Before the resource is replaced, the tables are checked
+# for the layout CaseFoldTable expects, and the tables that differ from the
+# previous resource are listed.
+
 import sys
 import os.path
 
+import unicode_tables
+
+PARSER_DIR = '../src/com/oracle/truffle/regex/tregex/parser/'
+TABLE_NAMES = ['NON_UNICODE_TABLE_ENTRIES', 'UNICODE_TABLE_ENTRIES', 'PYTHON_ASCII_TABLE_ENTRIES', 'PYTHON_UNICODE_TABLE_ENTRIES']
+
 
 def check_file_exists(path):
     if not os.path.exists(path):
-        error(f'file "${path}" not found')
+        error(f'file "{path}" not found')
 
 
 def error(msg):
@@ -53,28 +66,59 @@ def error(msg):
     sys.exit(1)
 
 
-def main():
-    file_name = 'CaseFoldTable.java'
-    file_path = '../src/com/oracle/truffle/regex/tregex/parser/' + file_name
+def check_tables(tables, constants):
+    character_sets = 0
+    while f'CHARACTER_SET_TABLE[{character_sets}]' in tables:
+        character_sets += 1
+    expected_names = [f'CHARACTER_SET_TABLE[{i}]' for i in range(character_sets)] + TABLE_NAMES
+    if list(tables) != expected_names:
+        error('unexpected tables: ' + ', '.join(sorted(set(tables) ^ set(expected_names))))
+    for i in range(character_sets):
+        ranges = tables[f'CHARACTER_SET_TABLE[{i}]']
+        if len(ranges) % 2 != 0 or any(ranges[j] > ranges[j + 1] for j in range(len(ranges) - 1)):
+            error(f'CHARACTER_SET_TABLE[{i}] is not a sorted list of ranges')
+    kinds = set(constants[k] for k in ('INTEGER_OFFSET', 'DIRECT_MAPPING', 'ALTERNATING_UL', 'ALTERNATING_AL'))
+    for name in TABLE_NAMES:
+        entries = tables[name]
+        if len(entries) % 4 != 0:
+            error(f'{name} does not consist of (from, to, kind, delta) entries')
+        prev_hi = -1
+        for j in range(0, len(entries), 4):
+            lo, hi, kind, delta = entries[j:j + 4]
+            if not prev_hi < lo <= hi:
+                error(f'{name}: entry {j // 4} is out of order')
+            if kind not in kinds:
+                error(f'{name}: entry {j // 4} has unknown kind {kind}')
+            if kind == constants['DIRECT_MAPPING'] and not 0 <= delta < character_sets:
+                error(f'{name}: entry {j // 4} refers to missing character set {delta}')
+            prev_hi = hi
+
+
+def main(args):
+    if args:
+        error('usage: update_case_fold_table.py')
+
+    java_file = PARSER_DIR + 'CaseFoldTable.java'
+    binary_file = PARSER_DIR + 'CaseFoldTable.bin'
     replacement_file = './dat/case-fold-table.txt'
-    marker_begin = 'GENERATED CODE BEGIN'
-    marker_end = 'GENERATED CODE END'
 
-    check_file_exists(file_path)
+    check_file_exists(java_file)
     check_file_exists(replacement_file)
 
-    with open(file_path, 'r') as f, open(replacement_file, 'r') as rf:
-        content = f.read()
-        i_begin = content.find(marker_begin)
-        i_end = content.find(marker_end)
-        if i_begin < 0:
-            error(f'could not find insertion marker "${marker_begin}" in ${file_name}')
-        if i_end < 0:
-            error(f'could not find end of insertion marker "${marker_begin}" in ${file_name}')
-        replacement = content[0:content.find('\n', i_begin) + 1] + '\n' + rf.read() + content[content.rfind('\n', i_begin, i_end):]
+    with open(java_file, 'r') as f:
+        constants = unicode_tables.java_constants(f.read())
+    with open(replacement_file, 'r') as rf:
+        tables = unicode_tables.java_tables(rf.read(), constants)
+    check_tables(tables, constants)
+
+    if os.path.exists(binary_file):
+        with open(binary_file, 'rb') as f:
+            previous = unicode_tables.decode_tables(f.read())
+        changed = [name for name in tables if previous.get(name) != tables[name]]
+        print(f'{len(changed)} of {len(tables)} tables changed: ' + ', '.join(changed) if changed else 'no tables changed')
 
-    with open(file_path, 'w') as f:
-        f.write(replacement)
+    size = unicode_tables.write_verified(tables, binary_file)
+    print(f'wrote {len(tables)} tables ({size} bytes) to {binary_file}')
 
 
-main()
+main(sys.argv[1:])
@@ -30,7 +30,7 @@ from __future__ import print_function
 
 import os
 import re
-from glob import glob
+import json
 
 import zipfile
 import mx
@@ -51,12 +51,59 @@ def extract_archive(path, extracted_name):
     return extracted_archive
 
 
+class ExtractedArchiveManifest(object):
+    """
+    Directory listings of an archive extracted by `extract_archive`, stored in `<extracted>.manifest.json`.
+
+    An extracted archive is never modified after extraction, so a listing computed once is valid for
+    all later configurations and runs of the benchmarks using it. Listings are keyed by the path of the
+    listed directory relative to the extracted directory, and their entries are relative to the listed
+    directory.
+    """
+    _manifests = {}
+
+    def __init__(self, extracted):
+        self.extracted = extracted
+        self.path = extracted + '.manifest.json'
+        self.listings = {}
+        if mx.exists(self.path):
+            try:
+                with open(self.path) as fp:
+                    self.listings = json.load(fp)
+            except ValueError:
+                mx.warn('Ignoring corrupt manifest ' + self.path)
+
+    @staticmethod
+    def listing(path, kind, compute):
+        """Returns `compute(path)`, cached in the manifest of the extracted archive containing `path`, if any."""
+        extracted = os.path.abspath(path)
+        while not extracted.endswith('.extracted'):
+            parent = os.path.dirname(extracted)
+            if parent == extracted:
+                return compute(path)
+            extracted = parent
+        manifest = ExtractedArchiveManifest._manifests.get(extracted)
+        if manifest is None:
+            manifest = ExtractedArchiveManifest(extracted)
+            ExtractedArchiveManifest._manifests[extracted] = manifest
+        return manifest.get(kind + ':' + os.path.relpath(os.path.abspath(path), extracted), lambda: compute(path))
+
+    def get(self, key, compute):
+        if key not in self.listings:
+            self.listings[key] = compute()
+            # other processes may extend the manifest concurrently, losing an entry only means recomputing it
+            with mx.SafeFileCreation(self.path) as sfc:
+                with open(sfc.tmpPath, 'w') as fp:
+                    json.dump(self.listings, fp, indent=1, sort_keys=True)
+        return list(self.listings[key])
+
+
+def _list_jars(path):
+    return sorted(f for f in os.listdir(path) if f.endswith('.jar') and os.path.isfile(mx.join(path, f)))
+
+
 def list_jars(path):
-    jars = []
-    for f in os.listdir(path):
-        if os.path.isfile(mx.join(path, f)) and f.endswith('.jar'):
-            jars.append(f)
-    return jars
+    return ExtractedArchiveManifest.listing(path, 'jars', _list_jars)
 
 
 _RENAISSANCE_EXTRA_AGENT_ARGS = [
@@ -291,10 +338,20 @@ class BaseDaCapoNativeImageBenchmarkSuite():
 
     @staticmethod
     def collect_nested_dependencies(path):
-        deps = []
-        deps += [y for x in os.walk(path) for y in glob(os.path.join(x[0], '*.jar'))]
-        deps += [y for x in os.walk(path) for y in glob(os.path.join(x[0], 'classes'))]
-        return deps
+        return [mx.join(path, p) for p in ExtractedArchiveManifest.listing(path, 'nested', BaseDaCapoNativeImageBenchmarkSuite._walk_nested_dependencies)]
+
+    @staticmethod
+    def _walk_nested_dependencies(path):
+        # jar files first, then classes directories, each relative to path
+        jars = []
+        classes = []
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            relroot = os.path.relpath(root, path)
+            jars += [os.path.normpath(mx.join(relroot, f)) for f in sorted(files) if f.endswith('.jar') and not f.startswith('.')]
+            if 'classes' in dirs or 'classes' in files:
+                classes.append(os.path.normpath(mx.join(relroot, 'classes')))
+        return jars + classes
 
     @staticmethod
     def extract_dacapo(dacapo_path):
@@ -28,14 +28,19 @@
 # OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 import sys
+import atexit
+import json
+import hashlib
 import tarfile
 import os
 import pipes
 import tempfile
+import threading
 from os.path import join, exists, basename
 import shutil
 import subprocess
 from argparse import ArgumentParser
+from multiprocessing.pool import ThreadPool
 
 import mx
 import mx_gate
@@ -225,6 +230,8 @@ def _sulong_gate_runner(args, tasks):
 add_gate_runner(_suite, _sulong_gate_runner)
 add_gate_argument('--extra-llvm-argument', dest='extra_llvm_arguments', action='append',
                   help='add extra llvm arguments to gate tasks', default=[])
+add_gate_argument('--test-shards', dest='test_shards', type=int, default=None,
+                  help='run Sulong test suites in the given number of parallel JVMs (default: $SULONG_TEST_SHARDS or 1)')
 
 
 
@@ -394,23 +401,151 @@ def dragonEggGPP(args=None):
     executeCommand = [getGPP(), "-fplugin=" + dragonEggPath(), '-fplugin-arg-dragonegg-emit-ir']
     return mx.run(executeCommand + args)
 
-def which(program, searchPath=None):
-    def is_exe(fpath):
+class ToolRegistry(object):
+    """Discovers toolchain programs (clang, opt, gcc, ...) and caches the results.
+
+    Program lookups and ``<program> --version`` probes are memoized for the lifetime of the mx process.
+    Version strings are additionally persisted in a JSON file so that subsequent mx invocations do not
+    spawn the probes again. A cached version is only reused if the binary (resolved through symlinks)
+    still has the same device, inode, size and modification time. Cached lookups of a program name
+    on a search path are only reused if the modification times of all search path entries are unchanged.
+    New results are written to the file once, when mx exits.
+    """
+
+    _FORMAT = 1
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self._versions = None
+        self._lookups = None
+        self._which = {}
+        self._installed = {}
+        self._dirty = False
+
+    @staticmethod
+    def _is_exe(fpath):
         return os.path.isfile(fpath) and os.access(fpath, os.X_OK)
 
-    fpath, _ = os.path.split(program)
-    if fpath:
-        if is_exe(program):
-            return program
-    else:
+    @staticmethod
+    def _identity(fpath):
+        st = os.stat(os.path.realpath(fpath))
+        return [st.st_dev, st.st_ino, st.st_size, st.st_mtime]
+
+    @staticmethod
+    def _dir_stamp(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _load(self):
+        if self._versions is not None:
+            return
+        self._versions = {}
+        self._lookups = {}
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as fp:
+                    data = json.load(fp)
+                if data.get('format') == ToolRegistry._FORMAT:
+                    self._versions = data.get('versions', {})
+                    self._lookups = data.get('lookups', {})
+            except (IOError, ValueError) as e:
+                mx.logv('Ignoring corrupt tool cache {}: {}'.format(self.cache_file, e))
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            mx.ensure_dir_exists(os.path.dirname(self.cache_file))
+            with mx.SafeFileCreation(self.cache_file) as sfc:
+                with open(sfc.tmpPath, 'w') as fp:
+                    json.dump({'format': ToolRegistry._FORMAT, 'versions': self._versions, 'lookups': self._lookups}, fp, indent=1, sort_keys=True)
+            self._dirty = False
+        except (IOError, OSError) as e:
+            mx.logv('Could not write tool cache {}: {}'.format(self.cache_file, e))
+
+    def which(self, program, searchPath=None):
+        """returns the path of the executable `program` on `searchPath` (defaults to PATH) or None"""
+        fpath, _ = os.path.split(program)
+        if fpath:
+            return program if ToolRegistry._is_exe(program) else None
         if searchPath is None:
             searchPath = os.environ["PATH"].split(os.pathsep)
-        for path in searchPath:
-            path = path.strip('"')
-            exe_file = os.path.join(path, program)
-            if is_exe(exe_file):
-                return exe_file
-    return None
+        searchPath = [path.strip('"') for path in searchPath]
+        key = program + '@' + os.pathsep.join(searchPath)
+        if key in self._which:
+            return self._which[key]
+        self._load()
+        stamps = [ToolRegistry._dir_stamp(path) for path in searchPath]
+        cached = self._lookups.get(key)
+        if cached is not None and cached[0] == stamps and (cached[1] is None or ToolRegistry._is_exe(cached[1])):
+            result = cached[1]
+        else:
+            result = None
+            for path in searchPath:
+                exe_file = os.path.join(path, program)
+                if ToolRegistry._is_exe(exe_file):
+                    result = exe_file
+                    break
+            self._lookups[key] = [stamps, result]
+            self._dirty = True
+        self._which[key] = result
+        return result
+
+    def version(self, program):
+        """returns the output of `program --version`; raises OSError if the program cannot be executed"""
+        assert program is not None
+        resolved = self.which(program) or program
+        try:
+            identity = ToolRegistry._identity(resolved)
+        except OSError:
+            # not a file we can track, e.g., a missing program -> do not cache
+            return ToolRegistry._probe_version(program)
+        self._load()
+        key = os.path.realpath(resolved)
+        cached = self._versions.get(key)
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        versionString = ToolRegistry._probe_version(program)
+        self._versions[key] = [identity, versionString]
+        self._dirty = True
+        return versionString
+
+    @staticmethod
+    def _probe_version(program):
+        mx.logv('Probing version of ' + program)
+        try:
+            versionString = _decode(subprocess.check_output([program, '--version']))
+        except subprocess.CalledProcessError as e:
+            # on my machine, e.g., opt returns a non-zero opcode even on success
+            versionString = _decode(e.output)
+        return versionString
+
+    def find_installed(self, program, supportedVersions, testSupportedVersion, searchPath=None):
+        """memoized variant of :func:`findInstalledProgram`"""
+        key = (program, tuple(supportedVersions), testSupportedVersion.__name__, tuple(searchPath) if searchPath else None)
+        if key not in self._installed:
+            self._installed[key] = _findInstalledProgram(program, supportedVersions, testSupportedVersion, searchPath=searchPath)
+        return self._installed[key]
+
+    def clear(self):
+        """drops all in-memory and persisted results"""
+        self._versions = {}
+        self._lookups = {}
+        self._which = {}
+        self._installed = {}
+        self._dirty = False
+        if os.path.exists(self.cache_file):
+            os.remove(self.cache_file)
+
+
+tool_registry = ToolRegistry(join(_suite.get_output_root(), 'tool-cache.json'))
+atexit.register(tool_registry.save)
+
+
+def which(program, searchPath=None):
+    return tool_registry.which(program, searchPath=searchPath)
 
 def getCommand(envVariable):
     """gets an environment variable and checks that it is an executable program"""
@@ -459,53 +594,110 @@ def findLLVMProgramForDragonegg(program):
     else:
         return installedProgram
 
+class ExtractionManifest(object):
+    """Records which archive members have been extracted into a directory.
+
+    Each entry maps the (stripped) destination path relative to the extraction directory to the size and
+    modification time of the archive member. A member is only written again if its entry changed or the
+    file on disk no longer matches.
+    """
+
+    FILE_NAME = '.mx-extract-manifest.json'
+
+    def __init__(self, directory):
+        self.path = join(directory, ExtractionManifest.FILE_NAME)
+        self.old = {}
+        self.new = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as fp:
+                    self.old = json.load(fp)
+            except (IOError, ValueError) as e:
+                mx.logv('Ignoring corrupt extraction manifest {}: {}'.format(self.path, e))
+
+    def is_current(self, relPath, tarinfo, dest):
+        entry = [tarinfo.size, int(tarinfo.mtime)]
+        self.new[relPath] = entry
+        if self.old.get(relPath) != entry:
+            return False
+        try:
+            st = os.lstat(dest)
+        except OSError:
+            return False
+        return tarinfo.issym() or (st.st_size == tarinfo.size and int(st.st_mtime) == int(tarinfo.mtime))
+
+    def remove_stale(self, directory):
+        """removes files that were extracted previously but are no longer part of the archive"""
+        for relPath in self.old:
+            if relPath not in self.new:
+                stale = join(directory, relPath)
+                if os.path.lexists(stale) and not os.path.isdir(stale):
+                    mx.logv('Removing stale file ' + stale)
+                    os.remove(stale)
+
+    def save(self):
+        with mx.SafeFileCreation(self.path) as sfc:
+            with open(sfc.tmpPath, 'w') as fp:
+                json.dump(self.new, fp, sort_keys=True)
+
+
+def _strip_member_path(name, stripLevels):
+    components = [c for c in name.split('/') if c and c != '.']
+    if stripLevels:
+        components = components[stripLevels:]
+    return '/'.join(components)
+
 def tar(tarFile, currentDir, subDirInsideTar=None, stripLevels=None):
-    with tarfile.open(tarFile) as tar:
-        if subDirInsideTar is None:
-            files = tar.getmembers()
-        else:
-            files = []
-            for tarinfo in tar.getmembers():
-                for curDir in subDirInsideTar:
-                    if tarinfo.name.startswith(curDir):
-                        files.append(tarinfo)
-        tar.extractall(members=files, path=currentDir)
-    if not stripLevels is None:
-        if subDirInsideTar is None:
-            implicitPathComponents = files[0].name.split(os.sep)[:stripLevels]
-            implicitPath = ""
-            for comp in implicitPathComponents:
-                implicitPath += comp + os.sep
-            implicitPath = implicitPath.rstrip('/')
-            stripDirectoryList = [implicitPath]
-        else:
-            stripDirectoryList = subDirInsideTar
-        for currentSubDir in stripDirectoryList:
-            stripDir(currentDir, currentSubDir, stripLevels)
-        toDelete = os.path.join(currentDir, files[0].name.split(os.sep)[0])
-        shutil.rmtree(toDelete)
-
-def stripDir(dirPath, dirToStrip, nrLevels):
-    cleanedDirPath = dirToStrip.rstrip('/')
-    pathComponents = cleanedDirPath.split(os.sep)[nrLevels:]
-    strippedPath = ""
-    for component in pathComponents:
-        strippedPath += component + os.sep
-    srcPath = os.path.join(dirPath, dirToStrip)
-    destPath = os.path.join(dirPath, strippedPath)
-    copytree(srcPath, destPath)
-
-def copytree(src, dst, symlinks=False, ignore=None):
-    if not os.path.exists(dst):
-        os.makedirs(dst)
-    for item in os.listdir(src):
-        s = os.path.join(src, item)
-        d = os.path.join(dst, item)
-        if os.path.isdir(s):
-            copytree(s, d, symlinks, ignore)
-        else:
-            if not os.path.exists(d) or os.stat(s).st_mtime - os.stat(d).st_mtime > 1:
-                shutil.copy2(s, d)
+    """extracts a tar archive into `currentDir`
+
+    The archive is read as a stream and every member is written directly to its final location, i.e., the
+    first `stripLevels` path components are removed while extracting. If `subDirInsideTar` is given, only
+    members below one of the listed prefixes are extracted. An extraction manifest is kept in `currentDir` so
+    that extracting a new version of an archive only rewrites the members that changed and removes the
+    members that disappeared.
+    """
+    manifest = ExtractionManifest(currentDir)
+    root = os.path.realpath(currentDir)
+    written = 0
+    with tarfile.open(tarFile, 'r|*') as tf:
+        for tarinfo in tf:
+            if subDirInsideTar is not None and not any(tarinfo.name.startswith(d) for d in subDirInsideTar):
+                continue
+            relPath = _strip_member_path(tarinfo.name, stripLevels)
+            if not relPath:
+                continue
+            dest = os.path.normpath(join(root, relPath))
+            if not dest.startswith(root + os.sep):
+                mx.abort('Refusing to extract {} outside of {}'.format(tarinfo.name, currentDir))
+            if tarinfo.isdir():
+                mx.ensure_dir_exists(dest)
+                continue
+            if manifest.is_current(relPath, tarinfo, dest):
+                continue
+            mx.ensure_dir_exists(os.path.dirname(dest))
+            if os.path.lexists(dest):
+                os.remove(dest)
+            if tarinfo.isfile():
+                src = tf.extractfile(tarinfo)
+                with open(dest, 'wb') as fp:
+                    shutil.copyfileobj(src, fp)
+                os.chmod(dest, tarinfo.mode & 0o7777)
+                os.utime(dest, (tarinfo.mtime, tarinfo.mtime))
+            elif tarinfo.issym():
+                os.symlink(tarinfo.linkname, dest)
+            elif tarinfo.islnk():
+                target = join(root, _strip_member_path(tarinfo.linkname, stripLevels))
+                if not os.path.exists(target):
+                    mx.warn('Skipping hard link {} to {}, which was not extracted'.format(tarinfo.name, tarinfo.linkname))
+                    continue
+                shutil.copy2(target, dest)
+            else:
+                mx.logv('Skipping special file ' + tarinfo.name)
+                continue
+            written += 1
+    manifest.remove_stale(currentDir)
+    manifest.save()
+    mx.logv('Extracted {} changed files from {} into {}'.format(written, tarFile, currentDir))
 
 def pullTestSuite(library, destDir, **kwargs):
     """downloads and unpacks a test suite"""
@@ -579,13 +771,7 @@ def isSupportedGCCVersion(gccProgram, supportedVersions=None):
 
 def getVersion(program):
     """executes --version on the supplied program and returns the version string"""
-    assert program is not None
-    try:
-        versionString = _decode(subprocess.check_output([program, '--version']))
-    except subprocess.CalledProcessError as e:
-        # on my machine, e.g., opt returns a non-zero opcode even on success
-        versionString = _decode(e.output)
-    return versionString
+    return tool_registry.version(program)
 
 def getLLVMMajorVersion(llvmProgram):
     """executes the program with --version and extracts the LLVM version string"""
@@ -606,10 +792,13 @@ def getLLVMExplicitArgs(mainLLVMVersion):
     return [] if no_optnone else ["-Xclang", "-disable-O0-optnone"]
 
 
-def get_mx_exe():
+def get_mx_command():
     mxpy = join(mx._mx_home, 'mx.py')
-    commands = [sys.executable, '-u', mxpy, '--java-home=' + mx.get_jdk().home]
-    return ' '.join(commands)
+    return [sys.executable, '-u', mxpy, '--java-home=' + mx.get_jdk().home]
+
+
+def get_mx_exe():
+    return ' '.join(get_mx_command())
 
 
 mx_subst.path_substitutions.register_no_arg('mx_exe', get_mx_exe)
@@ -664,6 +853,10 @@ def findInstalledGCCProgram(gccProgram):
     return findInstalledProgram(gccProgram, supportedGCCVersions, isSupportedGCCVersion, searchPath=path)
 
 def findInstalledProgram(program, supportedVersions, testSupportedVersion, searchPath=None):
+    """tries to find a supported version of a program (see :func:`_findInstalledProgram`); results are memoized by the tool registry"""
+    return tool_registry.find_installed(program, supportedVersions, testSupportedVersion, searchPath=searchPath)
+
+def _findInstalledProgram(program, supportedVersions, testSupportedVersion, searchPath=None):
     """tries to find a supported version of a program
 
     The function takes program argument, and checks if it has the supported version.
@@ -773,53 +966,190 @@ def extract_bitcode(args=None, out=None):
     return mx.run_java(mx.get_runtime_jvm_args(["com.oracle.truffle.llvm.tools"]) + ["com.oracle.truffle.llvm.tools.ExtractBitcode"] + args, out=out)
 
 
+def _extract_bitcode(in_file):
+    """starts extract-bitcode with output to stdout and returns the process"""
+    jdk = mx.get_jdk()
+    cmd = jdk.generate_java_command(mx.get_runtime_jvm_args(["com.oracle.truffle.llvm.tools"]) + ["com.oracle.truffle.llvm.tools.ExtractBitcode", in_file, "-"])
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE)
+
+
+def _read_bitcode(stream, digest):
+    """reads at most about _BITCODE_BUFFER_SIZE bytes of bitcode from `stream` and hashes them into `digest`
+
+    Returns the bytes read and whether the stream was read completely.
+    """
+    chunks = []
+    size = 0
+    while size <= _BITCODE_BUFFER_SIZE:
+        chunk = stream.read(_BITCODE_CHUNK_SIZE)
+        if not chunk:
+            return b''.join(chunks), True
+        digest.update(chunk)
+        chunks.append(chunk)
+        size += len(chunk)
+    return b''.join(chunks), False
+
+
+_BITCODE_CHUNK_SIZE = 1 << 16
+_BITCODE_BUFFER_SIZE = 1 << 25
+
+
+def _llvm_dis_cache_dir():
+    return join(_suite.get_output_root(), 'llvm-dis-cache')
+
+
+def _llvm_dis_tool():
+    """returns the bundled llvm-dis and its version, which identify the disassembler in cache keys"""
+    llvm_dis = findBundledLLVMProgram('llvm-dis')
+    return llvm_dis, getVersion(llvm_dis)
+
+
+def _disassemble_bitcode(in_file, ll_path, llvm_dis_args, use_cache=False, tool=None):
+    """disassembles the bitcode embedded in `in_file` into `ll_path`
+
+    The extracted bitcode is piped into llvm-dis and the module identifier (``<stdin>``) is replaced by
+    `in_file` while streaming the output. With `use_cache`, results are cached by the digest of the
+    llvm-dis version, the llvm-dis arguments and the bitcode, so disassembling the same bitcode again
+    does not run llvm-dis. Computing the digest first needs the bitcode in memory, so bitcode larger
+    than _BITCODE_BUFFER_SIZE is streamed into llvm-dis and not cached.
+    `tool` is the result of :func:`_llvm_dis_tool`, it is computed if not given.
+    """
+    llvm_dis, llvm_dis_version = tool or _llvm_dis_tool()
+    extract = _extract_bitcode(in_file)
+    try:
+        prefix = None
+        cache_file = None
+        if use_cache:
+            digest = hashlib.sha1()
+            digest.update(llvm_dis_version.encode())
+            digest.update(b'\0'.join(a.encode() for a in llvm_dis_args) + b'\0\0')
+            prefix, complete = _read_bitcode(extract.stdout, digest)
+            if complete:
+                cache_file = join(_llvm_dis_cache_dir(), digest.hexdigest() + '.ll')
+            else:
+                mx.logv("Not caching the disassembly of '{}', its bitcode is too large".format(in_file))
+        _disassemble_bitcode_file(in_file, extract, prefix, ll_path, llvm_dis, llvm_dis_args, cache_file)
+    except BaseException:
+        if extract.poll() is None:
+            extract.kill()
+        raise
+    finally:
+        extract.stdout.close()
+        extract.wait()
+
+
+def _disassemble_bitcode_file(in_file, extract, prefix, ll_path, llvm_dis, llvm_dis_args, cache_file):
+    """runs llvm-dis on the output of the `extract` process
+
+    If `prefix` is None, the output of `extract` is piped directly into llvm-dis. Otherwise, `prefix`
+    holds the bitcode already read from it, which is fed to llvm-dis before the rest of the output.
+    """
+    def _rewrite(l):
+        if l.startswith('; ModuleID = '):
+            return l.replace("'<stdin>'", "'{}'".format(in_file))
+        return l
+
+    def _open_for_writing(path):
+        if path == "-":
+            return sys.stdout
+        return open(path, 'w')
+
+    def _check_extract():
+        if extract.wait() != 0:
+            mx.abort("Could not extract bitcode from '{}'".format(in_file))
+
+    if cache_file and exists(cache_file):
+        _check_extract()
+        mx.logv('Using cached disassembly ' + cache_file)
+        with open(cache_file, 'r') as cached_f, _open_for_writing(ll_path) as ll_f:
+            ll_f.writelines(_rewrite(l) for l in cached_f)
+        return
+
+    feeder = None
+    if prefix is None:
+        proc = subprocess.Popen([llvm_dis, '-', '-o', '-'] + llvm_dis_args, stdin=extract.stdout, stdout=subprocess.PIPE)
+        # only llvm-dis reads the pipe, so that extract-bitcode does not block if llvm-dis exits early
+        extract.stdout.close()
+    else:
+        proc = subprocess.Popen([llvm_dis, '-', '-o', '-'] + llvm_dis_args, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+        def _feed():
+            try:
+                proc.stdin.write(prefix)
+                shutil.copyfileobj(extract.stdout, proc.stdin, _BITCODE_CHUNK_SIZE)
+            except (IOError, OSError):
+                # llvm-dis exited early, its exit code is checked below
+                extract.stdout.close()
+            finally:
+                proc.stdin.close()
+
+        feeder = threading.Thread(target=_feed)
+        feeder.start()
+    cache_tmp = None
+    cache_f = None
+    if cache_file:
+        mx.ensure_dir_exists(_llvm_dis_cache_dir())
+        cache_fd, cache_tmp = tempfile.mkstemp(dir=_llvm_dis_cache_dir(), suffix='.tmp')
+        cache_f = os.fdopen(cache_fd, 'w')
+    try:
+        with _open_for_writing(ll_path) as ll_f:
+            for raw in proc.stdout:
+                l = _decode(raw)
+                if cache_f:
+                    # the cache stores the unmodified output
+                    cache_f.write(l)
+                ll_f.write(_rewrite(l))
+        if feeder:
+            feeder.join()
+        dis_ret = proc.wait()
+        if dis_ret != 0 and extract.wait() != 0:
+            mx.abort("Could not disassemble bitcode from '{}', extract-bitcode and llvm-dis failed".format(in_file))
+        _check_extract()
+        if dis_ret != 0:
+            mx.abort("llvm-dis failed for '{}'".format(in_file))
+        if cache_f:
+            cache_f.close()
+            os.rename(cache_tmp, cache_file)
+    except BaseException:
+        if proc.poll() is None:
+            proc.kill()
+        if cache_f:
+            cache_f.close()
+            os.remove(cache_tmp)
+        raise
+
+
 def llvm_dis(args=None, out=None):
     parser = ArgumentParser(prog='mx llvm-dis', description='Disassemble (embedded) LLVM bitcode to LLVM assembly.')
+    parser.add_argument('--batch', action='store_true', help='Treat all positional arguments as input files, except those starting with "-", which are forwarded to llvm-dis (pass them after "--"). The output files are derived from the input names.')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Number of inputs to disassemble in parallel in --batch mode (default: number of CPUs).')
+    parser.add_argument('--cache', action='store_true', dest='use_cache', help='Reuse and store disassembly results in the llvm-dis-cache directory of the sulong output root. Bitcode larger than 32 MB is not cached.')
     parser.add_argument('input', help='The input file.', metavar='<input>')
     parser.add_argument('output', help='The output file. If omitted, <input>.ll is used. If <input> ends with ".bc", the ".bc" part is replaced with ".ll".', metavar='<output>', default=None, nargs='?')
     parser.add_argument('llvm_dis_args', help='Additional arguments forwarded to the llvm-dis command', metavar='<arg>', nargs='*')
     parsed_args = parser.parse_args(args)
 
-    def get_bc_filename(orig_path):
-        filename, ext = os.path.splitext(orig_path)
-        return orig_path if ext == ".bc" else filename + ".bc"
-
     def get_ll_filename(orig_path):
         filename, ext = os.path.splitext(orig_path)
         return filename + ".ll" if ext == ".bc" else orig_path + ".ll"
 
-    tmp_dir = None
-    try:
-        # create temp dir
-        tmp_dir = tempfile.mkdtemp()
-        in_file = parsed_args.input
-        tmp_path = os.path.join(tmp_dir, os.path.basename(get_bc_filename(in_file)))
-
-        extract_bitcode([in_file, tmp_path])
-
-        # disassemble into temporary file
-        ll_tmp_path = get_ll_filename(tmp_path)
-        llvm_tool(["llvm-dis", tmp_path, "-o", ll_tmp_path] + parsed_args.llvm_dis_args)
-
-        # write output file and patch paths
-        ll_path = parsed_args.output or get_ll_filename(in_file)
-
-        def _open_for_writing(path):
-            if path == "-":
-                return sys.stdout
-            return open(path, 'w')
-
-        def _open_for_reading(path):
-            if path == "-":
-                return sys.stdin
-            return open(path, 'r')
-
-        with _open_for_reading(ll_tmp_path) as ll_tmp_f, _open_for_writing(ll_path) as ll_f:
-            ll_f.writelines((l.replace(tmp_path, in_file) for l in ll_tmp_f))
+    if not parsed_args.batch:
+        ll_path = parsed_args.output or get_ll_filename(parsed_args.input)
+        _disassemble_bitcode(parsed_args.input, ll_path, parsed_args.llvm_dis_args, use_cache=parsed_args.use_cache)
+        return
 
+    positional = [parsed_args.input] + ([parsed_args.output] if parsed_args.output else []) + parsed_args.llvm_dis_args
+    inputs = [a for a in positional if not a.startswith('-')]
+    llvm_dis_args = [a for a in positional if a.startswith('-')]
+    if not inputs:
+        mx.abort('No input files given')
+    tool = _llvm_dis_tool()
+    pool = ThreadPool(parsed_args.jobs or mx.cpu_count())
+    try:
+        pool.map(lambda in_file: _disassemble_bitcode(in_file, get_ll_filename(in_file), llvm_dis_args, use_cache=parsed_args.use_cache, tool=tool), inputs)
     finally:
-        if tmp_dir:
-            shutil.rmtree(tmp_dir)
+        pool.close()
+        pool.join()
 
 
 _env_flags = []
@@ -1017,12 +1347,35 @@ class BootstrapToolchainLauncherBuildTask(mx.BuildTask):
 
 
 class CMakeBuildTask(mx.NativeBuildTask):
+    """Configures and builds a :class:`CMakeProject`.
+
+    The configuration inputs are recorded in a guard file. Changes to the source directory, the generator,
+    the CMake version or the toolchain (compilers and compiler flags from the environment) invalidate the
+    CMake cache. Other changes to the project's CMake config only rerun the configure step on the existing
+    cache. With the Ninja generator, source changes are detected by a dry run of ``ninja``.
+    """
+
+    # environment variables that are only considered by CMake when the cache is created
+    _toolchain_env = ['CC', 'CXX', 'CFLAGS', 'CXXFLAGS', 'CPPFLAGS', 'LDFLAGS']
+    _toolchain_config = ['-DCMAKE_C_COMPILER=', '-DCMAKE_CXX_COMPILER=']
 
     def __str__(self):
         return 'Building {} with CMake'.format(self.subject.name)
 
+    def _use_ninja(self):
+        return self.subject.cmake_generator() == 'Ninja'
+
+    def _targets(self):
+        targets = getattr(self.subject, 'makeTarget', None) or []
+        return targets if isinstance(targets, list) else [targets]
+
     def _build_run_args(self):
         cmdline, cwd, env = super(CMakeBuildTask, self)._build_run_args()
+        if self._use_ninja():
+            cmdline = [self._ninja(), '-j', str(self.parallelism)]
+            if mx._opts.verbose:
+                cmdline += ['-v']
+            return cmdline + self._targets(), cwd, env
 
         def _flatten(lst):
             for e in lst:
@@ -1035,6 +1388,12 @@ class CMakeBuildTask(mx.NativeBuildTask):
         # flatten cmdline to support for multiple make targets
         return list(_flatten(cmdline)), cwd, env
 
+    def _ninja(self):
+        ninja = which('ninja') or which('ninja-build')
+        if ninja is None:
+            mx.abort("{} uses the Ninja generator but 'ninja' is not on the PATH".format(self.subject.name))
+        return ninja
+
     def build(self):
         # get cwd and env
         self._configure()
@@ -1049,55 +1408,94 @@ class CMakeBuildTask(mx.NativeBuildTask):
                 mx.run(cmdline, cwd=cwd, env=env, out=fnull)
         self._newestOutput = None
         # END super(CMakeBuildTask, self).build()
-        source_dir = self.subject.source_dirs()[0]
-        self._write_guard(self.guard_file(), source_dir, self.subject.cmake_config())
+        self._write_guard(self.guard_file(), self._guard_data())
 
     def needsBuild(self, newestInput):
         mx.logv('Checking whether to build {} with CMake'.format(self.subject.name))
         need_configure, reason = self._need_configure()
-        return need_configure, "rebuild needed by CMake ({})".format(reason)
+        if need_configure:
+            return need_configure, "rebuild needed by CMake ({})".format(reason)
+        if self._use_ninja():
+            _, cwd, env = self._build_run_args()
+            out = mx.OutputCapture()
+            if mx.run([self._ninja(), '-n'], cwd=cwd, env=env, out=out, nonZeroIsFatal=False) != 0 or 'no work to do' not in out.data:
+                return True, "rebuild needed by Ninja"
+        return False, None
 
-    def _write_guard(self, guard_file, source_dir, cmake_config):
+    def _write_guard(self, guard_file, guard_data):
         with open(guard_file, 'w') as fp:
-            fp.write(self._guard_data(source_dir, cmake_config))
-
-    def _guard_data(self, source_dir, cmake_config):
-        return source_dir + '\n' + '\n'.join(cmake_config)
+            json.dump(guard_data, fp, indent=1, sort_keys=True)
 
-    def _check_cmake(self):
+    def _guard_data(self):
+        _, _, env = self._build_run_args()
+        cmake_config = self.subject.cmake_config()
+        toolchain = [c for c in cmake_config if any(c.startswith(p) for p in CMakeBuildTask._toolchain_config)]
+        toolchain += ['{}={}'.format(k, env[k]) for k in CMakeBuildTask._toolchain_env if k in env]
+        return {
+            'cache': {
+                'source_dir': self.subject.source_dirs()[0],
+                'generator': self.subject.cmake_generator(),
+                'cmake': self._cmake_version(),
+                'toolchain': toolchain,
+            },
+            'config': cmake_config,
+        }
+
+    def _cmake_version(self):
         try:
-            self.run_cmake(["--version"], silent=False, nonZeroIsFatal=False)
+            return getVersion('cmake').strip()
         except OSError as e:
             mx.abort(str(e) + "\nError executing 'cmake --version'. Are you sure 'cmake' is installed? ")
 
     def _need_configure(self):
-        source_dir = self.subject.source_dirs()[0]
+        """returns (need_configure, reason); reason is None if the existing CMake cache can be reused"""
         guard_file = self.guard_file()
-        if not os.path.exists(os.path.join(self.subject.dir, 'Makefile')):
-            return True, "No existing Makefile - reconfigure"
-        cmake_config = self.subject.cmake_config()
+        build_file = 'build.ninja' if self._use_ninja() else 'Makefile'
+        if not os.path.exists(os.path.join(self.subject.dir, build_file)):
+            return True, "No existing {} - reconfigure".format(build_file)
         if not os.path.exists(guard_file):
             return True, "No guard file - reconfigure"
-        with open(guard_file, 'r') as fp:
-            if fp.read() != self._guard_data(source_dir, cmake_config):
-                return True, "Guard file changed - reconfigure"
-            return False, None
+        try:
+            with open(guard_file, 'r') as fp:
+                old = json.load(fp)
+        except ValueError:
+            return True, "Guard file format changed - reconfigure"
+        new = self._guard_data()
+        if old.get('cache') != new['cache']:
+            return True, "Toolchain or generator changed - reconfigure"
+        if old.get('config') != new['config']:
+            return True, "CMake config changed - reconfigure"
+        return False, None
+
+    def _need_fresh_cache(self):
+        try:
+            with open(self.guard_file(), 'r') as fp:
+                return json.load(fp).get('cache') != self._guard_data()['cache']
+        except (IOError, ValueError):
+            return True
 
     def _configure(self, silent=False):
-        need_configure, _ = self._need_configure()
+        need_configure, reason = self._need_configure()
         if not need_configure:
             return
+        mx.logv('{}: {}'.format(self.subject.name, reason))
         _, cwd, env = self._build_run_args()
         source_dir = self.subject.source_dirs()[0]
         cmakefile = os.path.join(self.subject.dir, 'CMakeCache.txt')
-        if os.path.exists(cmakefile):
+        if os.path.exists(cmakefile) and self._need_fresh_cache():
             # remove cache file if it exist
             os.remove(cmakefile)
-        cmdline = ["-G", "Unix Makefiles", source_dir] + self.subject.cmake_config()
+        cmdline = ["-G", self.subject.cmake_generator(), source_dir] + self.subject.cmake_config()
         self._check_cmake()
         self.run_cmake(cmdline, silent=silent, cwd=cwd, env=env)
         return True
 
+    def _check_cmake(self):
+        try:
+            self.run_cmake(["--version"], silent=False, nonZeroIsFatal=False)
+        except OSError as e:
+            mx.abort(str(e) + "\nError executing 'cmake --version'. Are you sure 'cmake' is installed? ")
+
     def run_cmake(self, cmdline, silent, *args, **kwargs):
         if mx._opts.verbose:
             mx.run(["cmake"] + cmdline, *args, **kwargs)
@@ -1131,6 +1529,9 @@ class CMakeProject(AbstractSulongNativeProject):  # pylint: disable=too-many-anc
         super(CMakeProject, self).__init__(suite, name, deps, workingSets, subDir, results=results, output=output, **args)
         cmake_config = args.pop('cmakeConfig', {})
         self.cmake_config = lambda: ['-D{}={}'.format(k, mx_subst.path_substitutions.substitute(v).replace('{{}}', '$')) for k, v in sorted(cmake_config.items())]
+        generator = args.pop('cmakeGenerator', 'Unix Makefiles')
+        # CMAKE_GENERATOR is also the variable CMake itself uses to select the default generator
+        self.cmake_generator = lambda: mx.get_env('CMAKE_GENERATOR', generator)
         self.dir = self.getOutput()
 
     def getBuildTask(self, args):
@@ -1340,20 +1741,22 @@ COPYRIGHT_HEADER_BSD_HASH = """\
 """
 
 
+_asm_grammar = mx.suite("truffle").extensions.register_antlr_grammar("com.oracle.truffle.llvm.asm.amd64", "com.oracle.truffle.llvm.asm.amd64", "InlineAssembly", COPYRIGHT_HEADER_BSD)
+_debugexpr_grammar = mx.suite("truffle").extensions.register_antlr_grammar(grammar_project="com.oracle.truffle.llvm.runtime",
+                                                                           grammar_package="com.oracle.truffle.llvm.runtime.debug.debugexpr.parser.antlr",
+                                                                           grammar_name="DebugExpression",
+                                                                           copyright_template=COPYRIGHT_HEADER_BSD)
+
 def create_asm_parser(args=None, out=None):
     """create the inline assembly parser using antlr"""
-    mx.suite("truffle").extensions.create_parser("com.oracle.truffle.llvm.asm.amd64", "com.oracle.truffle.llvm.asm.amd64", "InlineAssembly", COPYRIGHT_HEADER_BSD, args, out)
+    mx.suite("truffle").extensions.generate_parsers([_asm_grammar], args, out)
 
 def create_debugexpr_parser(args=None, out=None):
     """create the debug expression parser using antlr"""
-    mx.suite("truffle").extensions.create_parser(grammar_project="com.oracle.truffle.llvm.runtime",
-                                                 grammar_package="com.oracle.truffle.llvm.runtime.debug.debugexpr.parser.antlr",
-                                                 grammar_name="DebugExpression",
-                                                 copyright_template=COPYRIGHT_HEADER_BSD, args=args, out=out)
+    mx.suite("truffle").extensions.generate_parsers([_debugexpr_grammar], args, out)
 
 def create_parsers(args=None, out=None):
-    create_asm_parser(args, out)
-    create_debugexpr_parser(args, out)
+    mx.suite("truffle").extensions.generate_parsers([_asm_grammar, _debugexpr_grammar], args, out)
 
 
 def _write_llvm_config_java(constants, file_comment=None):
@@ -1434,6 +1837,11 @@ def create_generated_sources(args=None, out=None):
     generate_llvm_config(args, out=out)
 
 
+def clear_tool_cache(args=None):
+    """drops the cached toolchain program lookups and versions, so that they are probed again"""
+    tool_registry.clear()
+
+
 def llirtestgen(args=None, out=None):
     return mx.run_java(mx.get_runtime_jvm_args(["LLIR_TEST_GEN"]) + ["com.oracle.truffle.llvm.tests.llirtestgen.LLIRTestGen"] + args, out=out)
 
@@ -1445,4 +1853,5 @@ mx.update_commands(_suite, {
     'create-parsers' : [create_parsers, 'create the debug expression and the inline assembly parser using antlr'],
     'extract-bitcode' : [extract_bitcode, 'Extract embedded LLVM bitcode from object files'],
     'llvm-dis' : [llvm_dis, 'Disassemble (embedded) LLVM bitcode to LLVM assembly'],
+    'sulong-clear-tool-cache' : [clear_tool_cache, 'drop cached toolchain program lookups and versions'],
 })
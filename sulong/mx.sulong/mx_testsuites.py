@@ -30,6 +30,13 @@
 from __future__ import print_function
 
 import fnmatch
+import heapq
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+from multiprocessing.pool import ThreadPool
 
 import mx
 import mx_unittest
@@ -49,18 +56,159 @@ else:
 _basestring = (str, _unicode)
 
 
-def run(vmArgs, unittests, extraOption=None, extraLibs=None):
+def _unittest_command(vmArgs, unittests, extraOption=None, extraLibs=None):
     if not isinstance(unittests, list):
         unittests = [unittests]
     if extraOption is None:
         extraOption = []
+    command = mx_sulong.getCommonOptions(True, extraLibs) + extraOption + vmArgs
+    if mx.get_opts().verbose:
+        command += ['--very-verbose']
+    return command + unittests
+
+
+def run(vmArgs, unittests, extraOption=None, extraLibs=None):
+    command = _unittest_command(vmArgs, unittests, extraOption, extraLibs)
     if mx.get_opts().verbose:
-        command = mx_sulong.getCommonOptions(True, extraLibs) + extraOption + vmArgs + ['--very-verbose'] + unittests
         print('Running mx unittests ' + ' '.join(command))
-        return mx_unittest.unittest(command)
-    else:
-        command = mx_sulong.getCommonOptions(True, extraLibs) + extraOption + vmArgs + unittests
-        return mx_unittest.unittest(command)
+    return mx_unittest.unittest(command)
+
+
+class TestTimings(object):
+    """Historical per-test durations (in seconds) of Sulong test suites, used to balance test shards.
+
+    The durations are stored per project in a JSON file. New measurements are blended with the
+    previous value so that a single outlier does not dominate the shard assignment.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as fp:
+                    self.data = json.load(fp)
+            except (IOError, ValueError) as e:
+                mx.logv('Ignoring corrupt test timing database {}: {}'.format(path, e))
+
+    def durations(self, project):
+        return self.data.get(project, {})
+
+    def update(self, project, durations):
+        known = self.data.setdefault(project, {})
+        for test, duration in durations.items():
+            old = known.get(test)
+            known[test] = duration if old is None else 0.5 * (old + duration)
+
+    def save(self):
+        mx.ensure_dir_exists(os.path.dirname(self.path))
+        with mx.SafeFileCreation(self.path) as sfc:
+            with open(sfc.tmpPath, 'w') as fp:
+                json.dump(self.data, fp, indent=1, sort_keys=True)
+
+
+def _test_timings():
+    return TestTimings(os.path.join(mx_sulong._suite.get_output_root(), 'sulong-test-timings.json'))
+
+
+def shardTests(tests, shards, durations):
+    """Partitions `tests` into `shards` lists with roughly equal total duration.
+
+    Uses the longest-processing-time-first heuristic. Tests without a known duration are assumed to
+    take the average of the known durations. The result is deterministic for the same inputs.
+    """
+    default = sum(durations.values()) / len(durations) if durations else 1.0
+    weighted = sorted(((durations.get(t, default), t) for t in set(tests)), key=lambda e: (-e[0], e[1]))
+    heap = [(0.0, i) for i in range(shards)]
+    partitions = [[] for _ in range(shards)]
+    for duration, test in weighted:
+        load, i = heapq.heappop(heap)
+        partitions[i].append(test)
+        heapq.heappush(heap, (load + duration, i))
+    return partitions
+
+
+def _shard_mx_args():
+    """Returns the global mx options that select the suite configuration of this mx invocation.
+
+    The shards run `mx unittest` with these options in the primary suite, so that they see the same
+    suites as the parent, e.g., when it runs from vm/ or with dynamic imports. The variables of the
+    env files are inherited through the environment.
+    """
+    args = []
+    dynamic_imports = [('/' + name) if in_subdir else name for name, in_subdir in mx.get_dynamic_imports()]
+    if dynamic_imports:
+        args += ['--dynamicimports', ','.join(dynamic_imports)]
+    additional_env = getattr(mx.get_opts(), 'additional_env', None)
+    if additional_env:
+        args += ['--env', additional_env]
+    if mx.get_opts().strict_compliance:
+        args += ['--strict-compliance']
+    return args
+
+
+def runSharded(project, vmArgs, unittests, shards, extraLibs=None):
+    """Runs the tests of a Sulong test suite project in `shards` parallel unittest JVMs.
+
+    The tests are assigned to the shards based on their historical durations. Each shard records the
+    duration of its tests, which are merged into the timing database afterwards. The output of failing
+    shards is replayed and the run aborts if any shard failed.
+    """
+    tests = project.getShardableTests()
+    timings = _test_timings()
+    partitions = shardTests(tests, shards, timings.durations(project.name))
+    tmp_dir = tempfile.mkdtemp(prefix='sulong-shards-')
+    try:
+        shard_file = os.path.join(tmp_dir, 'shards.txt')
+        with open(shard_file, 'w') as fp:
+            for i, partition in enumerate(partitions):
+                for test in partition:
+                    fp.write('{}\t{}\n'.format(i, test))
+
+        def _run_shard(i):
+            timing_file = os.path.join(tmp_dir, 'timing-{}.txt'.format(i))
+            log_file = os.path.join(tmp_dir, 'shard-{}.log'.format(i))
+            shard_args = vmArgs + [
+                '-Dsulongtest.testShardFile=' + shard_file,
+                '-Dsulongtest.testShardIndex=' + str(i),
+                '-Dsulongtest.testShardCount=' + str(shards),
+                '-Dsulongtest.testTimingFile=' + timing_file,
+            ]
+            command = _shard_mx_args() + ['unittest'] + _unittest_command(shard_args, unittests, extraLibs=extraLibs)
+            start = time.time()
+            with open(log_file, 'w') as log:
+                ret = mx.run_mx(command, suite=mx.primary_suite(), nonZeroIsFatal=False, out=log, err=subprocess.STDOUT)
+            return i, ret, time.time() - start, log_file, timing_file
+
+        mx.log('Running {} tests of {} in {} shards'.format(len(tests), project.name, shards))
+        pool = ThreadPool(shards)
+        try:
+            results = pool.map(_run_shard, range(shards))
+        finally:
+            pool.close()
+            pool.join()
+
+        measured = {}
+        failed = []
+        for i, ret, elapsed, log_file, timing_file in results:
+            mx.log('Shard {}/{}: {} tests, {:.1f}s, exit code {}'.format(i + 1, shards, len(partitions[i]), elapsed, ret))
+            if ret != 0 or mx.get_opts().verbose:
+                with open(log_file, 'r') as log:
+                    mx.log(log.read())
+            if ret != 0:
+                failed.append(i + 1)
+            if os.path.exists(timing_file):
+                with open(timing_file, 'r') as fp:
+                    for line in fp:
+                        name, millis = line.rstrip('\n').split('\t', 1)
+                        measured[name] = int(millis) / 1000.0
+        timings.update(project.name, measured)
+        timings.save()
+        if failed:
+            mx.abort('Test shards {} of {} failed'.format(', '.join(str(f) for f in failed), project.name))
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir)
 
 
 def compileTestSuite(testsuiteproject, extra_build_args):
@@ -72,7 +220,8 @@ def runTestSuite(testsuiteproject, args, testClasses=None, vmArgs=None):
     """compile and run external testsuite projects"""
     project = mx.project(testsuiteproject)
     assert isinstance(project, SulongTestSuite)
-    project.runTestSuite(testClasses, vmArgs)
+    shards = getattr(args, 'test_shards', None) or int(mx.get_env('SULONG_TEST_SHARDS', '1'))
+    project.runTestSuite(testClasses, vmArgs, shards=shards)
 
 
 class SulongTestSuiteBuildTask(mx.NativeBuildTask):
@@ -135,7 +284,7 @@ class SulongTestSuite(SulongTestSuiteBase):  # pylint: disable=too-many-ancestor
     def defaultTestClasses(self):
         return ["SulongSuite"]
 
-    def runTestSuite(self, testClasses=None, vmArgs=None):
+    def runTestSuite(self, testClasses=None, vmArgs=None, shards=1):
         if vmArgs is None:
             vmArgs = []
         if hasattr(self, 'extraLibs'):
@@ -144,8 +293,14 @@ class SulongTestSuite(SulongTestSuiteBase):  # pylint: disable=too-many-ancestor
             vmArgs += ['-Dsulongtest.fileExtensionFilter=' + ':'.join(self.fileExts)]
         if testClasses is None:
             testClasses = self.testClasses
+        if shards > 1:
+            return runSharded(self, vmArgs, testClasses, shards)
         return run(vmArgs, testClasses)
 
+    def getShardableTests(self):
+        """the test names as reported by the unittest harness, used for sharding"""
+        return self.getTests()
+
     @staticmethod
     def haveDragonegg():
         if not hasattr(SulongTestSuite, '_haveDragonegg'):
@@ -254,7 +409,7 @@ class ExternalTestSuite(SulongTestSuite):  # pylint: disable=too-many-ancestors
         if not hasattr(self, 'configDir'):
             self.configDir = 'configs'
 
-    def runTestSuite(self, testClasses=None, vmArgs=None):
+    def runTestSuite(self, testClasses=None, vmArgs=None, shards=1):
         if vmArgs is None:
             vmArgs = []
         vmArgs += [
@@ -268,8 +423,20 @@ class ExternalTestSuite(SulongTestSuite):  # pylint: disable=too-many-ancestors
             vmArgs += ['-Dsulongtest.fileExtensionFilter=' + ':'.join(self.fileExts)]
         if testClasses is None:
             testClasses = self.testClasses
+        if shards > 1:
+            return runSharded(self, vmArgs, testClasses, shards)
         return run(vmArgs, testClasses)
 
+    def getShardableTests(self):
+        """the whitelist entries of the config directory, which the unittest harness uses as test names"""
+        tests = []
+        for path, _, files in os.walk(os.path.join(self.dir, "..", self.configDir)):
+            for f in files:
+                if f.endswith('.include'):
+                    with open(os.path.join(path, f)) as fp:
+                        tests += [t for t in (l.rstrip('\r\n') for l in fp) if t and t.endswith(tuple(self.fileExts))]
+        return tests
+
     def defaultTestClasses(self):
         return ["com.oracle.truffle.llvm.tests.GCCSuite"]
 
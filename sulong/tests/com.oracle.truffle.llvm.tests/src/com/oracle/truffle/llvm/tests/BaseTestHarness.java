@@ -31,12 +31,15 @@ package com.oracle.truffle.llvm.tests;
 
 import java.io.IOException;
 import java.net.URI;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.nio.file.StandardOpenOption;
 import java.util.Arrays;
 import java.util.Collection;
 import java.util.Collections;
+import java.util.HashMap;
 import java.util.HashSet;
 import java.util.List;
 import java.util.Map;
@@ -45,7 +48,10 @@ import java.util.function.Predicate;
 import java.util.stream.Collectors;
 import java.util.stream.Stream;
 
+import org.junit.Rule;
 import org.junit.Test;
+import org.junit.rules.TestRule;
+import org.junit.runners.model.Statement;
 
 import com.oracle.truffle.llvm.tests.options.TestOptions;
 
@@ -68,6 +74,63 @@ public abstract class BaseTestHarness {
     @Test
     public abstract void test() throws IOException;
 
+    /**
+     * Appends the duration of every test to {@link TestOptions#TEST_TIMING_FILE} (if set). The
+     * timings are used by {@code mx_testsuites} to balance test shards.
+     */
+    @Rule public final TestRule timing = (base, description) -> new Statement() {
+        @Override
+        public void evaluate() throws Throwable {
+            long start = System.nanoTime();
+            try {
+                base.evaluate();
+            } finally {
+                recordTiming(getTestName(), System.nanoTime() - start);
+            }
+        }
+    };
+
+    private static synchronized void recordTiming(String testName, long nanos) {
+        if (TestOptions.TEST_TIMING_FILE == null) {
+            return;
+        }
+        String line = testName + "\t" + (nanos / 1000000) + "\n";
+        try {
+            Files.write(Paths.get(TestOptions.TEST_TIMING_FILE), line.getBytes(StandardCharsets.UTF_8), StandardOpenOption.CREATE, StandardOpenOption.APPEND);
+        } catch (IOException e) {
+            throw new AssertionError("Error writing test timing.", e);
+        }
+    }
+
+    /**
+     * Restricts the test cases to the current shard if {@link TestOptions#TEST_SHARD_FILE} is set.
+     * The shard file maps test names (parameter 1) to shard indices ({@code <index>\t<name>} per
+     * line). Tests that are not listed are distributed by the hash of their name, so that no test
+     * is lost if the shard file is incomplete.
+     */
+    public static Collection<Object[]> filterShard(Collection<Object[]> testCases) {
+        if (TestOptions.TEST_SHARD_FILE == null) {
+            return testCases;
+        }
+        Map<String, Integer> assignment = new HashMap<>();
+        try (Stream<String> lines = Files.lines(Paths.get(TestOptions.TEST_SHARD_FILE))) {
+            lines.filter(l -> !l.isEmpty()).forEach(l -> {
+                String[] parts = l.split("\t", 2);
+                assignment.put(parts[1], Integer.parseInt(parts[0]));
+            });
+        } catch (IOException e) {
+            throw new AssertionError("Error reading shard file.", e);
+        }
+        testCases.removeIf(t -> {
+            String name = t[1].toString();
+            Integer shard = assignment.get(name);
+            int index = shard != null ? shard : Math.floorMod(name.hashCode(), TestOptions.TEST_SHARD_COUNT);
+            return index != TestOptions.TEST_SHARD_INDEX;
+        });
+        System.err.println(String.format("Running %d test folders in shard %d/%d.", testCases.size(), TestOptions.TEST_SHARD_INDEX + 1, TestOptions.TEST_SHARD_COUNT));
+        return testCases;
+    }
+
     protected Map<String, String> getContextOptions() {
         return Collections.emptyMap();
     }
@@ -107,7 +170,7 @@ public abstract class BaseTestHarness {
             System.err.println(String.format("Collected %d test folders.", tests.size()));
         }
 
-        return tests.keySet().stream().sorted().map(f -> new Object[]{tests.get(f), f.toString()}).collect(Collectors.toList());
+        return filterShard(tests.keySet().stream().sorted().map(f -> new Object[]{tests.get(f), f.toString()}).collect(Collectors.toList()));
     }
 
     private static Collection<Object[]> collectDiscoverRun(Path configPath, Path suiteDir, Path sourceDir, String testDiscoveryPath) throws AssertionError {
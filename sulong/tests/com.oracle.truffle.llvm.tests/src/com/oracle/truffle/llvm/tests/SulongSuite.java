@@ -189,7 +189,7 @@ public class SulongSuite extends BaseSuiteHarness {
             Stream<Path> destDirs = files.filter(SulongSuite::isReference).map(Path::getParent);
             Collection<Object[]> collection = destDirs.map(testPath -> new Object[]{testPath, suitesPath.relativize(testPath).toString()}).collect(Collectors.toList());
             collection.removeIf(d -> blacklist.contains(d[1]));
-            return collection;
+            return filterShard(collection);
         } catch (IOException e) {
             throw new AssertionError("Test cases not found", e);
         }
@@ -41,6 +41,10 @@ public final class TestOptions {
     public static final String EXTERNAL_TEST_SUITE_PATH = System.getProperty("sulongtest.externalTestSuitePath");
     public static final String TEST_SOURCE_PATH = System.getProperty("sulongtest.testSourcePath");
     public static final String TEST_CONFIG_PATH = System.getProperty("sulongtest.testConfigPath");
+    public static final String TEST_SHARD_FILE = System.getProperty("sulongtest.testShardFile");
+    public static final int TEST_SHARD_INDEX = Integer.getInteger("sulongtest.testShardIndex", 0);
+    public static final int TEST_SHARD_COUNT = Integer.getInteger("sulongtest.testShardCount", 1);
+    public static final String TEST_TIMING_FILE = System.getProperty("sulongtest.testTimingFile");
 
     private static String[] getFileExtensions() {
         String property = System.getProperty("sulongtest.fileExtensionFilter");
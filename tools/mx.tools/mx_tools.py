@@ -30,7 +30,6 @@
 
 import os
 from os.path import exists, join
-import re
 import tempfile
 import shutil
 import glob
@@ -45,13 +44,7 @@ import mx_gate
 import mx_unittest
 import mx_benchmark
 import mx_sdk_vm
-
-import sys
-
-if sys.version_info[0] < 3:
-    from urlparse import urljoin
-else:
-    from urllib.parse import urljoin # pylint: disable=no-name-in-module
+import mx_truffle
 
 
 _suite = mx.suite('tools')
@@ -88,55 +81,7 @@ def javadoc(args):
         indexContent = open(index, 'r').read()
         new_file = open(index, "w")
         new_file.write(indexContent)
-    checkLinks(javadocDir)
-
-def checkLinks(javadocDir):
-    href = re.compile('(?<=href=").*?(?=")')
-    filesToCheck = {}
-    for root, _, files in os.walk(javadocDir):
-        for f in files:
-            if f.endswith('.html'):
-                html = os.path.join(root, f)
-                content = open(html, 'r').read()
-                for url in href.findall(content):
-                    full = urljoin(html, url)
-                    sectionIndex = full.find('#')
-                    questionIndex = full.find('?')
-                    minIndex = sectionIndex
-                    if minIndex < 0:
-                        minIndex = len(full)
-                    if 0 <= questionIndex < minIndex:
-                        minIndex = questionIndex
-                    path = full[0:minIndex]
-
-                    sectionNames = filesToCheck.get(path, [])
-                    if sectionIndex >= 0:
-                        s = full[sectionIndex + 1:]
-                        sectionNames = sectionNames + [(html, s)]
-                    else:
-                        sectionNames = sectionNames + [(html, None)]
-
-                    filesToCheck[path] = sectionNames
-
-    err = False
-    for referencedfile, sections in filesToCheck.items():
-        if referencedfile.startswith('javascript:') or referencedfile.startswith('http:') or referencedfile.startswith('https:') or referencedfile.startswith('mailto:'):
-            continue
-        if not exists(referencedfile):
-            mx.warn('Referenced file ' + referencedfile + ' does not exist. Referenced from ' + sections[0][0])
-            err = True
-        else:
-            content = open(referencedfile, 'r').read()
-            for path, s in sections:
-                if not s is None:
-                    whereName = content.find('name="' + s + '"')
-                    whereId = content.find('id="' + s + '"')
-                    if whereName == -1 and whereId == -1:
-                        mx.warn('There should be section ' + s + ' in ' + referencedfile + ". Referenced from " + path)
-                        err = True
-
-    if err:
-        mx.abort('There are wrong references in Javadoc')
+    mx_truffle.checkLinks(javadocDir, join(_suite.get_output_root(), 'javadoc-links.json'))
 
 def lsp_types_gen(args):
     """generate Language Server Protocol types"""
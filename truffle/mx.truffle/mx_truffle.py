@@ -38,6 +38,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 #
+import hashlib
+import json
 import os
 import re
 import tempfile
@@ -45,7 +47,12 @@ import sys
 import zipfile
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 from os.path import exists
+try:
+    from shutil import which
+except ImportError:
+    from distutils.spawn import find_executable as which  # pylint: disable=deprecated-module
 
 import mx
 import mx_benchmark
@@ -100,52 +107,96 @@ def javadoc(args, vm=None):
     extraArgs = mx_sdk.build_oracle_compliant_javadoc_args(_suite, 'GraalVM', 'Truffle')
     mx.javadoc(['--unified', '--exclude-packages', 'com.oracle.truffle.tck,com.oracle.truffle.tck.impl'] + extraArgs + args)
     javadoc_dir = os.sep.join([_suite.dir, 'javadoc'])
-    checkLinks(javadoc_dir)
+    checkLinks(javadoc_dir, os.path.join(_suite.get_output_root(), 'javadoc-links.json'))
+
+_javadoc_href = re.compile('(?<=href=").*?(?=")')
+_javadoc_anchor = re.compile('(?:name|id)="(.*?)"')
+
+def _scan_javadoc_page(html):
+    """Returns the distinct links and anchors of a Javadoc page."""
+    with open(html, 'r') as fp:
+        content = fp.read()
+    return sorted(set(_javadoc_href.findall(content))), sorted(set(_javadoc_anchor.findall(content)))
+
+def _split_javadoc_link(full):
+    sectionIndex = full.find('#')
+    questionIndex = full.find('?')
+    minIndex = sectionIndex
+    if minIndex < 0:
+        minIndex = len(full)
+    if 0 <= questionIndex < minIndex:
+        minIndex = questionIndex
+    return full[0:minIndex], full[sectionIndex + 1:] if sectionIndex >= 0 else None
+
+def checkLinks(javadocDir, indexFile=None):
+    """
+    Checks that the links of the pages in `javadocDir` refer to existing files and sections.
+
+    Each page is read once, in parallel, to index its links and anchors, and all links are resolved
+    against that index. If `indexFile` is given, the index is saved there and only pages that changed
+    since it was written are read again.
+    """
+    javadocDir = os.path.abspath(javadocDir)
+    index = {}
+    if indexFile and exists(indexFile):
+        try:
+            with open(indexFile, 'r') as fp:
+                index = json.load(fp)
+        except ValueError:
+            index = {}
 
-def checkLinks(javadocDir):
-    href = re.compile('(?<=href=").*?(?=")')
-    filesToCheck = {}
+    pages = {}
+    changed = []
     for root, _, files in os.walk(javadocDir):
         for f in files:
             if f.endswith('.html'):
                 html = os.path.join(root, f)
-                content = open(html, 'r').read()
-                for url in href.findall(content):
-                    full = _urllib_urljoin(html, url)
-                    sectionIndex = full.find('#')
-                    questionIndex = full.find('?')
-                    minIndex = sectionIndex
-                    if minIndex < 0:
-                        minIndex = len(full)
-                    if 0 <= questionIndex < minIndex:
-                        minIndex = questionIndex
-                    path = full[0:minIndex]
-
-                    sectionNames = filesToCheck.get(path, [])
-                    if sectionIndex >= 0:
-                        s = full[sectionIndex + 1:]
-                        sectionNames = sectionNames + [(html, s)]
-                    else:
-                        sectionNames = sectionNames + [(html, None)]
-
-                    filesToCheck[path] = sectionNames
+                stat = os.stat(html)
+                entry = index.get(os.path.relpath(html, javadocDir))
+                if entry and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+                    pages[html] = entry
+                else:
+                    changed.append((html, stat))
+    if changed:
+        mx.logv('Indexing {} of {} Javadoc pages'.format(len(changed), len(pages) + len(changed)))
+        pool = ThreadPool(mx.cpu_count())
+        try:
+            scanned = pool.map(_scan_javadoc_page, [html for html, _ in changed])
+        finally:
+            pool.close()
+            pool.join()
+        for (html, stat), (links, anchors) in zip(changed, scanned):
+            pages[html] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'links': links, 'anchors': anchors}
+        if indexFile:
+            mx.ensure_dir_exists(os.path.dirname(indexFile))
+            with open(indexFile, 'w') as fp:
+                json.dump(dict((os.path.relpath(html, javadocDir), entry) for html, entry in pages.items()), fp)
+
+    filesToCheck = OrderedDict()
+    for html in sorted(pages):
+        for url in pages[html]['links']:
+            path, section = _split_javadoc_link(_urllib_urljoin(html, url))
+            filesToCheck.setdefault(path, []).append((html, section))
 
     err = False
     for referencedfile, sections in filesToCheck.items():
         if referencedfile.startswith('javascript:') or referencedfile.startswith('http:') or referencedfile.startswith('https:') or referencedfile.startswith('mailto:'):
             continue
-        if not exists(referencedfile):
+        if referencedfile in pages:
+            anchors = pages[referencedfile]['anchors']
+        elif not exists(referencedfile):
             mx.warn('Referenced file ' + referencedfile + ' does not exist. Referenced from ' + sections[0][0])
             err = True
+            continue
+        elif all(s is None for _, s in sections):
+            continue
         else:
-            content = open(referencedfile, 'r').read()
-            for path, s in sections:
-                if not s is None:
-                    whereName = content.find('name="' + s + '"')
-                    whereId = content.find('id="' + s + '"')
-                    if whereName == -1 and whereId == -1:
-                        mx.warn('There should be section ' + s + ' in ' + referencedfile + ". Referenced from " + path)
-                        err = True
+            anchors = _scan_javadoc_page(referencedfile)[1]
+        anchors = frozenset(anchors)
+        for path, s in sections:
+            if not s is None and s not in anchors:
+                mx.warn('There should be section ' + s + ' in ' + referencedfile + ". Referenced from " + path)
+                err = True
 
     if err:
         mx.abort('There are wrong references in Javadoc')
@@ -293,6 +344,69 @@ def _collect_class_path_entries(cp_entries_filter, entries_collector, properties
                         collector[cpPath] = None
     suite_collector(mx.primary_suite(), cp_entries_filter, entries_collector, properties_collector, set())
 
+class _JarResourceIndex(object):
+    """
+    Persistent index of the provider resources (META-INF/truffle and META-INF/services entries) in jar files.
+
+    A jar is only opened if it is not in the index yet or if its size or modification time changed
+    since it was indexed.
+    """
+
+    _FORMAT = 1
+    _PREFIXES = ('META-INF/truffle/', 'META-INF/services/')
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self._jars = None
+        self._dirty = False
+
+    def _load(self):
+        self._jars = {}
+        if exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as fp:
+                    data = json.load(fp)
+                if data.get('format') == _JarResourceIndex._FORMAT:
+                    self._jars = data.get('jars', {})
+            except (IOError, ValueError) as e:
+                mx.logv('Ignoring corrupt jar resource index {}: {}'.format(self.cache_file, e))
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            mx.ensure_dir_exists(os.path.dirname(self.cache_file))
+            with mx.SafeFileCreation(self.cache_file) as sfc:
+                with open(sfc.tmpPath, 'w') as fp:
+                    json.dump({'format': _JarResourceIndex._FORMAT, 'jars': self._jars}, fp, indent=1, sort_keys=True)
+            self._dirty = False
+        except (IOError, OSError) as e:
+            mx.logv('Could not write jar resource index {}: {}'.format(self.cache_file, e))
+
+    def resources(self, jar):
+        """Returns the provider resources in `jar`."""
+        if self._jars is None:
+            self._load()
+        stat = os.stat(jar)
+        entry = self._jars.get(jar)
+        if entry is None or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+            with zipfile.ZipFile(jar, "r") as zf:
+                resources = sorted(n for n in zf.namelist() if n.startswith(_JarResourceIndex._PREFIXES))
+            entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'resources': resources}
+            self._jars[jar] = entry
+            self._dirty = True
+        return entry['resources']
+
+    def has_any(self, jar, requiredResources):
+        if all(r.startswith(_JarResourceIndex._PREFIXES) for r in requiredResources):
+            resources = self.resources(jar)
+            return any(r in resources for r in requiredResources)
+        with zipfile.ZipFile(jar, "r") as zf:
+            names = set(zf.namelist())
+        return any(r in names for r in requiredResources)
+
+_jar_resource_index = _JarResourceIndex(os.path.join(_suite.get_output_root(), 'jar-resources.json'))
+
 def _collect_class_path_entries_by_resource(requiredResources, entries_collector, properties_collector):
     """
     Collects class path for JAR distributions containing any resource from requiredResources.
@@ -302,20 +416,13 @@ def _collect_class_path_entries_by_resource(requiredResources, entries_collector
     :param entries_collector: the list to add the class paths entries into.
     :properties_collector: the list to add the distribution Java properties into.
     """
+    requiredResources = list(requiredResources)
     def has_resource(dist):
-        if dist.isJARDistribution() and exists(dist.path):
-            with zipfile.ZipFile(dist.path, "r") as zf:
-                for requiredResource in requiredResources:
-                    try:
-                        zf.getinfo(requiredResource)
-                    except KeyError:
-                        pass
-                    else:
-                        return True
-                return False
-        else:
-            return False
-    _collect_class_path_entries(has_resource, entries_collector, properties_collector)
+        return dist.isJARDistribution() and exists(dist.path) and _jar_resource_index.has_any(dist.path, requiredResources)
+    try:
+        _collect_class_path_entries(has_resource, entries_collector, properties_collector)
+    finally:
+        _jar_resource_index.save()
 
 def _collect_class_path_entries_by_name(distributionName, entries_collector, properties_collector):
     cp_filter = lambda dist: dist.isJARDistribution() and  dist.name == distributionName and exists(dist.path)
@@ -479,7 +586,7 @@ def _execute_debugger_test(testFilter, logFile, testEvaluation=False, unitTestOp
     args = args + testFilter
     unittest(args)
 
-def execute_tck(graalvm_home, mode='default', language_filter=None, values_filter=None, tests_filter=None, vm_args=None):
+def execute_tck(graalvm_home, mode='default', language_filter=None, values_filter=None, tests_filter=None, vm_args=None, jobs=1):
     """
     Executes Truffle TCK with all TCK providers reachable from the primary suite and all languages installed in the given GraalVM.
 
@@ -487,10 +594,11 @@ def execute_tck(graalvm_home, mode='default', language_filter=None, values_filte
     :param mode: a name of TCK mode,
         'default' - executes the test with default GraalVM configuration,
         'compile' - compiles the tests before execution
-    :param language_filter: the language id, limits TCK tests to certain language
+    :param language_filter: the language id or an iterable of language ids, limits TCK tests to certain language(s)
     :param values_filter: an iterable of value constructors language ids, limits TCK values to certain language(s)
     :param tests_filter: a substring of TCK test name or an iterable of substrings of TCK test names
     :param vm_args: iterable containing additional Java VM args
+    :param jobs: the number of JVMs running TCK shards in parallel
     """
     cp = OrderedDict()
     _collect_tck_providers(cp, dict())
@@ -500,7 +608,7 @@ def execute_tck(graalvm_home, mode='default', language_filter=None, values_filte
     boot_cp = OrderedDict()
     _collect_class_path_entries_by_name("TRUFFLE_TCK_COMMON", boot_cp, dict())
     return tck.execute_tck(graalvm_home, mode=tck.Mode.for_name(mode), language_filter=language_filter, values_filter=values_filter,
-        tests_filter=tests_filter, cp=cp.keys(), truffle_cp=truffle_cp.keys(), boot_cp=boot_cp, vm_args=vm_args)
+        tests_filter=tests_filter, cp=cp.keys(), truffle_cp=truffle_cp.keys(), boot_cp=boot_cp, vm_args=vm_args, jobs=jobs)
 
 
 def _tck(args):
@@ -508,6 +616,7 @@ def _tck(args):
 
     parser = ArgumentParser(prog="mx tck", description="run the TCK tests", formatter_class=RawDescriptionHelpFormatter, epilog=_debuggertestHelpSuffix)
     parser.add_argument("--tck-configuration", help="TCK configuration", choices=["compile", "debugger", "default"], default="default")
+    parser.add_argument("--jobs", type=int, default=1, help="run the TCK in this many JVMs in parallel, sharded by language (-Dtck.language=<id>,<id>...) and test class (requires graalvm execution)")
     parsed_args, args = parser.parse_known_args(args)
     tckConfiguration = parsed_args.tck_configuration
     index = len(args)
@@ -529,7 +638,9 @@ def _tck(args):
         index = index - 1
     unitTestOptions = args_no_tests[0:max(index - (1 if has_separator_arg else 0), 0)]
     jvmOptions = args_no_tests[index:len(args_no_tests)]
-    if tckConfiguration == "default":
+    if parsed_args.jobs > 1:
+        _tck_sharded(tckConfiguration, parsed_args.jobs, unitTestOptions, jvmOptions, tests)
+    elif tckConfiguration == "default":
         unittest(unitTestOptions + ["--"] + jvmOptions + tests)
     elif tckConfiguration == "debugger":
         with mx.SafeFileCreation(os.path.join(tempfile.gettempdir(), "debugalot")) as sfc:
@@ -540,26 +651,67 @@ def _tck(args):
         unittest(unitTestOptions + ["--"] + jvmOptions + ["-Dgraal.TruffleCompileImmediately=true", "-Dgraal.TruffleCompilationExceptionsAreThrown=true"] + tests)
 
 
+def _tck_sharded(tckConfiguration, jobs, unitTestOptions, jvmOptions, tests):
+    if tckConfiguration == "debugger":
+        mx.abort("The 'debugger' TCK configuration cannot be run with --jobs.")
+    if unitTestOptions:
+        mx.abort("Unittest options are not supported with --jobs: " + " ".join(unitTestOptions))
+    if not _is_graalvm(mx.get_jdk()):
+        mx.abort("Running the TCK with --jobs requires graalvm execution, run with --java-home=<path_to_graalvm>.")
+    languages = None
+    vmArgs = []
+    for option in jvmOptions:
+        if option.startswith("-Dtck.language="):
+            languages = option[len("-Dtck.language="):].split(",")
+        else:
+            vmArgs.append(option)
+    ret_code = execute_tck(mx.get_jdk().home, mode="compile" if tckConfiguration == "compile" else "default", language_filter=languages,
+                           tests_filter=tests, vm_args=vmArgs, jobs=jobs)
+    if ret_code != 0:
+        mx.abort(ret_code)
+
+
 mx.update_commands(_suite, {
-    'tck': [_tck, "[--tck-configuration {default|debugger}] [unittest options] [--] [VM options] [filters...]", _debuggertestHelpSuffix]
+    'tck': [_tck, "[--tck-configuration {default|debugger}] [--jobs <n>] [unittest options] [--] [VM options] [filters...]", _debuggertestHelpSuffix]
 })
 
 
+_filename_length_pruned_dirs = frozenset(['.git', '.hg', 'mxbuild', 'node_modules'])
+
+def _versioned_files(root):
+    """Returns the files of the git working tree at `root` that are tracked or not ignored, or None if `root` is not in a git working tree."""
+    if not which('git'):
+        mx.logv('Cannot list the files of {} with git: git is not on the PATH'.format(root))
+        return None
+    out = mx.OutputCapture()
+    err = mx.OutputCapture()
+    if mx.run(['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'], out=out, err=err, cwd=root, nonZeroIsFatal=False) != 0:
+        mx.logv('Cannot list the files of {} with git: {}'.format(root, err.data.strip()))
+        return None
+    return [f for f in out.data.split('\0') if f]
+
+def _walked_files(root):
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _filename_length_pruned_dirs]
+        files.extend(os.path.relpath(os.path.join(dirpath, f), root) for f in filenames)
+    return files
+
 def check_filename_length(args):
     """check that all file name lengths are short enough for eCryptfs"""
     # For eCryptfs, see https://bugs.launchpad.net/ecryptfs/+bug/344878
     parser = ArgumentParser(prog="mx check-filename-length", description="Check file name length")
-    parser.parse_known_args(args)
+    parser.add_argument('--walk', action='store_true', help='walk the directory tree, skipping VCS and build output directories, instead of listing the files known to git')
+    parsed_args, _ = parser.parse_known_args(args)
     max_length = 143
-    too_long = []
-    for _, _, filenames in os.walk('.'):
-        for filename in filenames:
-            if len(filename) > max_length:
-                too_long.append(filename)
+    files = None if parsed_args.walk else _versioned_files('.')
+    if files is None:
+        files = _walked_files('.')
+    too_long = [f for f in files if len(os.path.basename(f)) > max_length]
     if too_long:
         mx.log_error("The following file names are too long for eCryptfs: ")
         for x in too_long:
-            mx.log_error(x)
+            mx.log_error("%s (%d characters)" % (x, len(os.path.basename(x))))
         mx.abort("File names that are too long where found. Ensure all file names are under %d characters long." % max_length)
 
 COPYRIGHT_HEADER_UPL = """\
@@ -611,35 +763,141 @@ PTRN_SUPPRESS_WARNINGS = re.compile("^@SuppressWarnings.*$", re.MULTILINE)
 PTRN_LOCALCTXT_CAST = re.compile(r"\(\([a-zA-Z_]*Context\)_localctx\)")
 PTRN_TOKEN_CAST = re.compile(r"\(Token\)_errHandler.recoverInline\(this\)")
 
+class AntlrGrammar(object):
+    """
+    An ANTLR grammar whose generated lexer and parser are checked in next to it.
+
+    A digest of the grammar, the ANTLR jar and the copyright template is kept together with a digest
+    of each generated file in the output root of the suite defining the grammar project, so that a
+    grammar is only regenerated if one of them changed.
+    """
+
+    def __init__(self, grammar_project, grammar_package, grammar_name, copyright_template, postprocess=None):
+        self.grammar_project = grammar_project
+        self.grammar_package = grammar_package
+        self.grammar_name = grammar_name
+        self.copyright_template = copyright_template
+        self.postprocess = postprocess
+
+    def __str__(self):
+        return self.grammar_package + '.' + self.grammar_name
+
+    @property
+    def grammar_dir(self):
+        return os.path.join(mx.project(self.grammar_project).source_dirs()[0], *self.grammar_package.split("."))
+
+    @property
+    def grammar_file(self):
+        return os.path.join(self.grammar_dir, self.grammar_name + ".g4")
+
+    @property
+    def generated_files(self):
+        return [os.path.join(self.grammar_dir, self.grammar_name + suffix + ".java") for suffix in ("Lexer", "Parser")]
+
+    @property
+    def stamp_file(self):
+        return os.path.join(mx.project(self.grammar_project).suite.get_output_root(), 'antlr', str(self) + '.sha1')
+
+    @staticmethod
+    def _digest(path):
+        with open(path, 'rb') as fp:
+            return hashlib.sha1(fp.read()).hexdigest()
+
+    def _stamp(self):
+        digest = hashlib.sha1()
+        digest.update(_encode(self._digest(self.grammar_file)))
+        digest.update(_encode(' '.join(mx.get_runtime_jvm_args(['ANTLR4_COMPLETE']))))
+        digest.update(_encode(self.copyright_template))
+        return [digest.hexdigest()] + [self._digest(f) if exists(f) else '' for f in self.generated_files]
+
+    def is_up_to_date(self):
+        if not exists(self.stamp_file):
+            return False
+        with open(self.stamp_file, 'r') as fp:
+            return fp.read().split() == self._stamp()
+
+    def postprocess_generated_files(self):
+        for filename in self.generated_files:
+            with open(filename, 'r') as content_file:
+                content = content_file.read()
+            # remove first line
+            content = "\n".join(content.split("\n")[1:])
+            # modify SuppressWarnings to remove useless entries
+            content = PTRN_SUPPRESS_WARNINGS.sub('@SuppressWarnings("all")', content)
+            # remove useless casts
+            content = PTRN_LOCALCTXT_CAST.sub('_localctx', content)
+            content = PTRN_TOKEN_CAST.sub('_errHandler.recoverInline(this)', content)
+            # add copyright header
+            content = self.copyright_template.format(content)
+            # user provided post-processing hook:
+            if self.postprocess is not None:
+                content = self.postprocess(content)
+            with open(filename, 'w') as content_file:
+                content_file.write(content)
+        mx.ensure_dir_exists(os.path.dirname(self.stamp_file))
+        with open(self.stamp_file, 'w') as fp:
+            fp.write('\n'.join(self._stamp()) + '\n')
+
+_antlr_grammars = []
+
+def register_antlr_grammar(grammar_project, grammar_package, grammar_name, copyright_template, postprocess=None):
+    """Registers a grammar to be generated by `mx create-antlr-parsers`."""
+    grammar = AntlrGrammar(grammar_project, grammar_package, grammar_name, copyright_template, postprocess)
+    _antlr_grammars.append(grammar)
+    return grammar
+
+def generate_parsers(grammars, args=None, out=None, force=False):
+    """
+    Generates the lexers and parsers of `grammars` whose inputs changed, or of all of them if `force`
+    is true or extra ANTLR `args` are given. All grammars of a package are generated by a single ANTLR
+    invocation and the invocations for different packages run in parallel.
+    """
+    args = args or []
+    stale = [g for g in grammars if force or args or not g.is_up_to_date()]
+    for grammar in grammars:
+        if grammar not in stale:
+            mx.logv('{} is up to date'.format(grammar))
+    if not stale:
+        return
+    by_package = OrderedDict()
+    for grammar in stale:
+        by_package.setdefault(grammar.grammar_package, []).append(grammar)
+
+    def generate(package_grammars):
+        mx.log('Generating parsers for ' + ', '.join(str(g) for g in package_grammars))
+        mx.run_java(mx.get_runtime_jvm_args(['ANTLR4_COMPLETE']) + ["org.antlr.v4.Tool", "-package", package_grammars[0].grammar_package, "-no-listener"] + args +
+                    [g.grammar_file for g in package_grammars], out=out)
+        for grammar in package_grammars:
+            grammar.postprocess_generated_files()
+
+    pool = ThreadPool(min(len(by_package), mx.cpu_count()))
+    try:
+        pool.map(generate, list(by_package.values()))
+    finally:
+        pool.close()
+        pool.join()
+
+def create_antlr_parsers(args=None):
+    """create the parsers of all registered grammars using antlr"""
+    parser = ArgumentParser(prog="mx create-antlr-parsers", description="Regenerate the ANTLR parsers of all registered grammars whose grammar changed.")
+    parser.add_argument('--force', action='store_true', help='regenerate all parsers, even if they are up to date')
+    parsed_args, antlr_args = parser.parse_known_args(args or [])
+    generate_parsers(_antlr_grammars, antlr_args, force=parsed_args.force)
+
+_dsl_grammar = register_antlr_grammar("com.oracle.truffle.dsl.processor", "com.oracle.truffle.dsl.processor.expression", "Expression", COPYRIGHT_HEADER_UPL)
+_sl_grammar = register_antlr_grammar("com.oracle.truffle.sl", "com.oracle.truffle.sl.parser", "SimpleLanguage", COPYRIGHT_HEADER_UPL)
+
 def create_dsl_parser(args=None, out=None):
     """create the DSL expression parser using antlr"""
-    create_parser("com.oracle.truffle.dsl.processor", "com.oracle.truffle.dsl.processor.expression", "Expression", COPYRIGHT_HEADER_UPL, args, out)
+    generate_parsers([_dsl_grammar], args, out)
 
 def create_sl_parser(args=None, out=None):
     """create the SimpleLanguage parser using antlr"""
-    create_parser("com.oracle.truffle.sl", "com.oracle.truffle.sl.parser", "SimpleLanguage", COPYRIGHT_HEADER_UPL, args, out)
+    generate_parsers([_sl_grammar], args, out)
 
 def create_parser(grammar_project, grammar_package, grammar_name, copyright_template, args=None, out=None, postprocess=None):
     """create the DSL expression parser using antlr"""
-    grammar_dir = os.path.join(mx.project(grammar_project).source_dirs()[0], *grammar_package.split(".")) + os.path.sep
-    mx.run_java(mx.get_runtime_jvm_args(['ANTLR4_COMPLETE']) + ["org.antlr.v4.Tool", "-package", grammar_package, "-no-listener"] + args + [grammar_dir + grammar_name + ".g4"], out=out)
-    for filename in [grammar_dir + grammar_name + "Lexer.java", grammar_dir + grammar_name + "Parser.java"]:
-        with open(filename, 'r') as content_file:
-            content = content_file.read()
-        # remove first line
-        content = "\n".join(content.split("\n")[1:])
-        # modify SuppressWarnings to remove useless entries
-        content = PTRN_SUPPRESS_WARNINGS.sub('@SuppressWarnings("all")', content)
-        # remove useless casts
-        content = PTRN_LOCALCTXT_CAST.sub('_localctx', content)
-        content = PTRN_TOKEN_CAST.sub('_errHandler.recoverInline(this)', content)
-        # add copyright header
-        content = copyright_template.format(content)
-        # user provided post-processing hook:
-        if postprocess is not None:
-            content = postprocess(content)
-        with open(filename, 'w') as content_file:
-            content_file.write(content)
+    generate_parsers([AntlrGrammar(grammar_project, grammar_package, grammar_name, copyright_template, postprocess)], args, out)
 
 
 class LibffiBuilderProject(mx.AbstractNativeProject, mx_native.NativeDependency):  # pylint: disable=too-many-ancestors
@@ -831,6 +1089,7 @@ mx.update_commands(_suite, {
     'check-filename-length' : [check_filename_length, ""],
     'create-dsl-parser' : [create_dsl_parser, "create the DSL expression parser using antlr"],
     'create-sl-parser' : [create_sl_parser, "create the SimpleLanguage parser using antlr"],
+    'create-antlr-parsers' : [create_antlr_parsers, "[--force] [antlr options]"],
 })
 
 mx_gate.add_jacoco_includes(['org.graalvm.*', 'com.oracle.truffle.*'])
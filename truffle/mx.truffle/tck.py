@@ -41,12 +41,18 @@
 from __future__ import print_function
 
 import argparse
+import hashlib
 import os
 import os.path
+import json
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
 import zipfile
+from multiprocessing.pool import ThreadPool
 
 class Abort(RuntimeError):
     def __init__(self, message, retCode=-1):
@@ -113,56 +119,216 @@ class _ClassPathEntry:
     def __init__(self, path):
         self.path = path
 
-    def install(self, folder):
-        pass
+    def install(self, folder, store=None):
+        return True
 
     def __str__(self):
         return self.path
 
+class _ArtifactStore:
+    """
+    Persistent content addressed store of the jars of Maven artifacts.
+
+    Jars are kept under their SHA-1 digest in the objects folder, and for every installed
+    artifact a listing of its jar names and digests is kept under its coordinates.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def _listing(self, entry):
+        return os.path.join(self.folder, 'artifacts', entry.groupId.replace('/', '.'), entry.artifactId, entry.version + '.json')
+
+    def _object(self, digest):
+        return os.path.join(self.folder, 'objects', digest[:2], digest)
+
+    @staticmethod
+    def _write_atomically(path, write):
+        folder = os.path.dirname(path)
+        if not os.path.isdir(folder):
+            try:
+                os.makedirs(folder)
+            except OSError:
+                if not os.path.isdir(folder):
+                    raise
+        fd, tmp = tempfile.mkstemp(dir=folder)
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.rename(tmp, path)
+
+    def get(self, entry, folder):
+        """
+        Copies the jars of `entry` to `folder` and returns their paths, or returns None if `entry`
+        is not in the store.
+        """
+        listing = self._listing(entry)
+        if not os.path.isfile(listing):
+            return None
+        with open(listing) as f:
+            jars = json.load(f)
+        if not all(os.path.isfile(self._object(digest)) for _, digest in jars):
+            return None
+        paths = []
+        for name, digest in jars:
+            path = os.path.join(folder, name)
+            try:
+                os.link(self._object(digest), path)
+            except OSError:
+                shutil.copyfile(self._object(digest), path)
+            paths.append(path)
+        return paths
+
+    def put(self, entry, paths):
+        jars = []
+        for path in paths:
+            digest = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(chunk)
+            digest = digest.hexdigest()
+            if not os.path.isfile(self._object(digest)):
+                with open(path, 'rb') as src:
+                    _ArtifactStore._write_atomically(self._object(digest), lambda dst: shutil.copyfileobj(src, dst))
+            jars.append((os.path.basename(path), digest))
+        _ArtifactStore._write_atomically(self._listing(entry), lambda f: f.write(json.dumps(jars).encode('utf-8')))
+
 class _MvnClassPathEntry(_ClassPathEntry):
 
-    def __init__(self, groupId, artifactId, version, required=True, repository=None):
+    def __init__(self, groupId, artifactId, version, required=True, repository=None, offline=False):
         self.repository = repository
+        self.offline = offline
         self.groupId = groupId
         self.artifactId = artifactId
         self.version = version
         self.required = required
         _ClassPathEntry.__init__(self, None)
 
-    def install(self, folder):
-        _log(LogLevel.INFO, 'Installing {0}'.format(self))
-        if self.pull():
-            install_folder = os.path.join(folder, self.artifactId)
-            os.mkdir(install_folder)
-            self.copy(install_folder)
-            self.path = os.pathsep.join([os.path.join(install_folder, f) for f in os.listdir(install_folder) if f.endswith('.jar')])
-        else:
-            self.path = ''
-
-    def pull(self):
-        process = _MvnClassPathEntry._run_maven(['dependency:get', '-DgroupId=' + self.groupId, '-DartifactId=' + self.artifactId, '-Dversion=' + self.version], self.repository)
-        ret_code = process.wait()
-        if ret_code != 0:
-            if self.required:
-                raise Abort('Cannot download artifact {0} '.format(self))
-            else:
-                return False
-        else:
-            return True
+    def is_resolved(self):
+        return not (self.version == 'LATEST' or self.version.endswith('-SNAPSHOT'))
 
-    def copy(self, folder):
-        process = _MvnClassPathEntry._run_maven(['dependency:copy', '-Dartifact=' + self.groupId + ':' + self.artifactId + ':' + self.version, '-DoutputDirectory=' + folder], self.repository)
-        ret_code = process.wait()
-        if ret_code != 0:
-            raise Abort('Cannot copy artifact {0}'.format(self))
+    def install(self, folder, store=None):
+        install_folder = os.path.join(folder, self.artifactId)
+        os.mkdir(install_folder)
+        jars = store.get(self, install_folder) if store and self.is_resolved() else None
+        if jars is None:
+            return False
+        _log(LogLevel.INFO, 'Installing {0} from {1}'.format(self, store.folder))
+        self.path = os.pathsep.join(jars)
+        return True
+
+    def jar_version(self, file_name):
+        """
+        Returns the version of the artifact whose jar Maven copied to `file_name`, or None if the jar
+        belongs to another artifact. Snapshots are copied under their timestamped version.
+        """
+        prefix = self.artifactId + '-'
+        if not file_name.startswith(prefix) or not file_name.endswith('.jar'):
+            return None
+        version = file_name[len(prefix):-len('.jar')]
+        if self.version == 'LATEST':
+            return version if re.match(r'^[0-9]', version) else None
+        base_version = self.version[:-len('SNAPSHOT')] if self.version.endswith('-SNAPSHOT') else self.version
+        return version if version == self.version or version.startswith(base_version) else None
+
+    def coordinates(self):
+        return self.groupId + ':' + self.artifactId + ':' + self.version
 
     def __str__(self):
         return '{0}:{1}:{2}'.format(self.groupId, self.artifactId, self.version)
 
     @staticmethod
-    def _run_maven(args, repository=None):
+    def resolve_latest(entries, folder):
+        """
+        Replaces the LATEST version of `entries` with the concrete version of the latest release, so
+        that the entries can be looked up in the artifact store. The TCK artifacts are released
+        together, so Maven is run once, for the first required artifact, and its version is used for
+        all of them.
+        """
+        latest = [e for e in entries if e.version == 'LATEST']
+        probe = next((e for e in latest if e.required), None)
+        if not probe:
+            return
+        probe_folder = tempfile.mkdtemp(dir=folder)
+        try:
+            process = _MvnClassPathEntry._run_maven(['dependency:copy', '-Dartifact=' + probe.coordinates(), '-Dmdep.useBaseVersion=false',
+                                                     '-DoutputDirectory=' + probe_folder], probe.repository, probe.offline)
+            if process.wait() != 0:
+                raise Abort('Cannot resolve the latest version of {0}'.format(probe))
+            versions = [v for v in (probe.jar_version(f) for f in os.listdir(probe_folder)) if v]
+        finally:
+            _rmdir_recursive(probe_folder)
+        if len(versions) != 1:
+            raise Abort('Cannot determine the latest version of {0}'.format(probe))
+        _log(LogLevel.INFO, 'Resolved LATEST to {0}'.format(versions[0]))
+        for e in latest:
+            e.version = versions[0]
+
+    @staticmethod
+    def install_all(entries, folder, store=None):
+        """
+        Installs `entries`, which were not found in `store`, with a single Maven run that resolves
+        them together, and adds them to `store`. If the run fails, it is repeated without the
+        artifacts that are not required, which are then left out of the class path.
+        """
+        _log(LogLevel.INFO, 'Installing {0}'.format(', '.join(str(e) for e in entries)))
+        installed = entries
+        if not _MvnClassPathEntry._copy_all(entries, folder):
+            installed = [e for e in entries if e.required]
+            if len(installed) == len(entries) or (installed and not _MvnClassPathEntry._copy_all(installed, folder)):
+                raise Abort('Cannot download artifacts {0}'.format(', '.join(str(e) for e in installed)))
+        for entry in entries:
+            install_folder = os.path.join(folder, entry.artifactId)
+            jars = [os.path.join(install_folder, f) for f in os.listdir(install_folder) if f.endswith('.jar')] if entry in installed else []
+            if jars and store:
+                # snapshots are stored under the timestamped version Maven resolved them to
+                versions = set(entry.jar_version(os.path.basename(jar)) for jar in jars)
+                if len(versions) == 1:
+                    entry.version = versions.pop()
+                    store.put(entry, jars)
+            entry.path = os.pathsep.join(jars)
+
+    @staticmethod
+    def _copy_all(entries, folder):
+        """
+        Copies the jars of `entries` to their install folders with one Maven run on a generated pom.
+        Returns whether Maven succeeded.
+        """
+        work_folder = tempfile.mkdtemp(dir=folder)
+        try:
+            pom = os.path.join(work_folder, 'pom.xml')
+            with open(pom, 'w') as f:
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                        '<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+                        '  <modelVersion>4.0.0</modelVersion>\n'
+                        '  <groupId>org.graalvm.truffle.tck</groupId>\n'
+                        '  <artifactId>tck-runner-artifacts</artifactId>\n'
+                        '  <version>1</version>\n'
+                        '  <dependencies>\n')
+                for e in entries:
+                    f.write('    <dependency><groupId>{0}</groupId><artifactId>{1}</artifactId><version>{2}</version></dependency>\n'.format(
+                        e.groupId, e.artifactId, e.version))
+                f.write('  </dependencies>\n'
+                        '</project>\n')
+            jars_folder = os.path.join(work_folder, 'jars')
+            process = _MvnClassPathEntry._run_maven(['-f', pom, 'dependency:copy-dependencies', '-DexcludeTransitive=true', '-Dmdep.useBaseVersion=false',
+                                                     '-DoutputDirectory=' + jars_folder], entries[0].repository, entries[0].offline)
+            if process.wait() != 0:
+                return False
+            jars = os.listdir(jars_folder)
+            for entry in entries:
+                for jar in jars:
+                    if entry.jar_version(jar):
+                        shutil.move(os.path.join(jars_folder, jar), os.path.join(folder, entry.artifactId, jar))
+            return True
+        finally:
+            _rmdir_recursive(work_folder)
+
+    @staticmethod
+    def _run_maven(args, repository=None, offline=False):
         extra_args = ['-Dmaven.repo.local=' + repository] if repository else []
         extra_args.append('-q')
+        if offline:
+            extra_args.append('--offline')
         host, port = _MvnClassPathEntry._parse_http_proxy(['HTTP_PROXY', 'http_proxy'])
         if host:
             extra_args.append('-DproxyHost=' + host)
@@ -210,11 +376,11 @@ def _rmdir_recursive(to_delete):
     else:
         os.unlink(to_delete)
 
-def _run(args, log_level=False):
+def _run(args, log_level=False, stdout=None):
     _log(LogLevel.FINE, "exec({0})", ', '.join(['"' + a + '"' for a in args]))
-    return subprocess.Popen(args)
+    return subprocess.Popen(args, stdout=stdout, stderr=subprocess.STDOUT if stdout else None)
 
-def _run_java(javaHome, mainClass, cp=None, truffleCp=None, bootCp=None, vmArgs=None, args=None, dbgPort=None):
+def _run_java(javaHome, mainClass, cp=None, truffleCp=None, bootCp=None, vmArgs=None, args=None, dbgPort=None, stdout=None):
     if not vmArgs:
         vmArgs = []
     if not args:
@@ -232,7 +398,18 @@ def _run_java(javaHome, mainClass, cp=None, truffleCp=None, bootCp=None, vmArgs=
     if dbgPort:
         vmArgs.append('-Xdebug')
         vmArgs.append('-Xrunjdwp:transport=dt_socket,server=y,address={0},suspend=y'.format(dbgPort))
-    return _run([java_cmd] + vmArgs + [mainClass] + args)
+    return _run([java_cmd] + vmArgs + [mainClass] + args, stdout=stdout)
+
+def _install(entries, folder, store=None):
+    """
+    Installs the class path entries into `folder`. LATEST versions are resolved first, so that Maven
+    artifacts found in `store` are installed from there without running Maven. The remaining
+    artifacts are resolved by a single Maven run.
+    """
+    _MvnClassPathEntry.resolve_latest([e for e in entries if isinstance(e, _MvnClassPathEntry)], folder)
+    missing = [e for e in entries if not e.install(folder, store)]
+    if missing:
+        _MvnClassPathEntry.install_all(missing, folder, store)
 
 def _split_VM_args_and_filters(args):
     jvm_space_separated_args = ['-cp', '-classpath', '-mp', '-modulepath', '-limitmods', '-addmods', '-upgrademodulepath', '-m',
@@ -244,7 +421,41 @@ def _split_VM_args_and_filters(args):
             return args[:i], args[i:]
     return args, []
 
+def _cache_dir():
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'truffle-tck')
+
+def _unit_tests_cache_file(cp, pkgs):
+    """
+    Returns the file caching the unit tests found on `cp`. The name is a digest of the path, size and
+    modification time of the class path entries, which is cheaper to compute than scanning the jars.
+    """
+    digest = hashlib.sha1()
+    digest.update(','.join(pkgs or []).encode('utf-8'))
+    for e in cp:
+        path = os.path.abspath(e.path)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            digest.update('\0{0}\0{1}\0{2}'.format(path, stat.st_size, stat.st_mtime).encode('utf-8'))
+    return os.path.join(_cache_dir(), digest.hexdigest() + '.tests')
+
 def _find_unit_tests(cp, pkgs=None):
+    cache_file = _unit_tests_cache_file(cp, pkgs)
+    if os.path.isfile(cache_file):
+        with open(cache_file) as f:
+            return [l for l in f.read().splitlines() if l]
+    tests = _scan_unit_tests(cp, pkgs)
+    try:
+        if not os.path.isdir(os.path.dirname(cache_file)):
+            os.makedirs(os.path.dirname(cache_file))
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cache_file))
+        with os.fdopen(fd, 'w') as f:
+            f.write(''.join(test + '\n' for test in tests))
+        os.rename(tmp, cache_file)
+    except OSError as e:
+        _log(LogLevel.FINE, 'Cannot cache the TCK test list: {0}', e)
+    return tests
+
+def _scan_unit_tests(cp, pkgs=None):
     def includes(n):
         if not pkgs:
             return True
@@ -271,11 +482,71 @@ def _find_unit_tests(cp, pkgs=None):
     tests.sort(reverse=True)
     return tests
 
-def _execute_tck_impl(graalvm_home, mode, language_filter, values_filter, tests_filter, cp, truffle_cp, boot_cp, vm_args, debug_port):
+def _plan_shards(tests, languages, jobs):
+    """
+    Splits the TCK run into (language, test classes) shards, each executed by its own JVM. The test
+    classes of a language are dealt out to as many shards as there are jobs for the language.
+    """
+    shards_per_language = max(1, jobs // len(languages))
+    shards = []
+    for language in languages:
+        for i in range(min(shards_per_language, len(tests))):
+            shards.append((language, tests[i::shards_per_language]))
+    return shards
+
+_junit_ok = re.compile(r'^OK \((\d+) tests?\)', re.MULTILINE)
+_junit_failures = re.compile(r'^Tests run: (\d+),\s+Failures: (\d+)', re.MULTILINE)
+
+def _execute_shards(graalvm_home, shards, jobs, cp, truffle_cp, boot_cp, vm_args):
+    def execute(index):
+        language, tests = shards[index]
+        shard_vm_args = list(vm_args)
+        if language:
+            shard_vm_args.append('-Dtck.language={0}'.format(language))
+        fd, log = tempfile.mkstemp(prefix='tck-shard-', suffix='.log')
+        try:
+            start = time.time()
+            with os.fdopen(fd, 'w') as out:
+                p = _run_java(graalvm_home, 'org.junit.runner.JUnitCore', cp=cp, truffleCp=truffle_cp, bootCp=boot_cp, vmArgs=shard_vm_args, args=tests, stdout=out)
+                ret_code = p.wait()
+            duration = time.time() - start
+            with open(log) as f:
+                output = f.read()
+        finally:
+            os.unlink(log)
+        return ret_code, duration, output
+
+    _log(LogLevel.INFO, 'Running {0} TCK shards in {1} parallel JVMs'.format(len(shards), jobs))
+    pool = ThreadPool(jobs)
+    start = time.time()
+    results = []
+    try:
+        for index, (ret_code, duration, output) in enumerate(pool.imap(execute, range(len(shards)))):
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            ok = _junit_ok.search(output)
+            failed = _junit_failures.search(output)
+            run, failures = (int(ok.group(1)), 0) if ok else (int(failed.group(1)), int(failed.group(2))) if failed else (0, 0)
+            results.append((ret_code, duration, run, failures))
+    finally:
+        pool.close()
+        pool.join()
+    elapsed = time.time() - start
+
+    _log(LogLevel.INFO, 'TCK shard results:')
+    _log(LogLevel.INFO, '  {0:>5}  {1:<12}  {2:>7}  {3:>6}  {4:>8}  {5:>9}  {6}'.format('shard', 'language', 'classes', 'tests', 'failures', 'time', 'exit code'))
+    for index, ((language, tests), (ret_code, duration, run, failures)) in enumerate(zip(shards, results)):
+        _log(LogLevel.INFO, '  {0:>5}  {1:<12}  {2:>7}  {3:>6}  {4:>8}  {5:>8.1f}s  {6}'.format(index, language or '*', len(tests), run, failures, duration, ret_code))
+    _log(LogLevel.INFO, '{0} tests run, {1} failures in {2:.1f}s ({3:.1f}s in all shards)'.format(
+        sum(r[2] for r in results), sum(r[3] for r in results), elapsed, sum(r[1] for r in results)))
+    return next((r[0] for r in results if r[0] != 0), 0)
+
+def _execute_tck_impl(graalvm_home, mode, language_filter, values_filter, tests_filter, cp, truffle_cp, boot_cp, vm_args, debug_port, jobs=1):
     tests = _find_unit_tests(cp, pkgs=['com.oracle.truffle.tck.tests'])
     vm_args.extend(mode.vm_args)
-    if language_filter:
-        vm_args.append('-Dtck.language={0}'.format(language_filter))
+    languages = [language_filter] if not language_filter or isinstance(language_filter, str) else list(language_filter)
+    if debug_port and (jobs > 1 or len(languages) > 1):
+        raise Abort('A debugger can only be attached to a single TCK JVM, run one language without parallel jobs')
     if values_filter:
         vm_args.append('-Dtck.values={0}'.format(','.join(values_filter)))
     if tests_filter:
@@ -285,18 +556,22 @@ def _execute_tck_impl(graalvm_home, mode, language_filter, values_filter, tests_
                     return True
             return False
         tests = [test for test in tests if includes(test)]
+    if jobs > 1 or len(languages) > 1:
+        return _execute_shards(graalvm_home, _plan_shards(tests, languages, jobs), jobs, cp, truffle_cp, boot_cp, vm_args)
+    if languages[0]:
+        vm_args.append('-Dtck.language={0}'.format(languages[0]))
     p = _run_java(graalvm_home, 'org.junit.runner.JUnitCore', cp=cp, truffleCp=truffle_cp, bootCp=boot_cp, vmArgs=vm_args, args=tests, dbgPort=debug_port)
     ret_code = p.wait()
     return ret_code
 
 
-def execute_tck(graalvm_home, mode=Mode.default(), language_filter=None, values_filter=None, tests_filter=None, cp=None, truffle_cp=None, boot_cp=None, vm_args=None, debug_port=None):
+def execute_tck(graalvm_home, mode=Mode.default(), language_filter=None, values_filter=None, tests_filter=None, cp=None, truffle_cp=None, boot_cp=None, vm_args=None, debug_port=None, jobs=1):
     """
     Executes Truffle TCK with given TCK providers and languages using GraalVM installed in graalvm_home
 
     :param graalvm_home: a path to GraalVM
     :param mode: the TCK mode
-    :param language_filter: the language id, limits TCK tests to certain language
+    :param language_filter: the language id or an iterable of language ids, limits TCK tests to certain language(s)
     :param values_filter: an iterable of value constructors language ids, limits TCK values to certain language(s)
     :param tests_filter: a substring of TCK test name or an iterable of substrings of TCK test names
     :param cp: an iterable of paths to add on the Java classpath, the classpath must contain the TCK providers and dependencies
@@ -304,6 +579,7 @@ def execute_tck(graalvm_home, mode=Mode.default(), language_filter=None, values_
     :param boot_cp: an iterable of paths to add to Java boot path
     :param vm_args: an iterable containing additional Java VM args
     :param debug_port: a port the Java VM should listen on for debugger connection
+    :param jobs: the number of JVMs running TCK shards in parallel, the tests are sharded by language and test class
     """
     if not cp:
         cp = []
@@ -322,7 +598,7 @@ def execute_tck(graalvm_home, mode=Mode.default(), language_filter=None, values_
         [_ClassPathEntry(os.path.abspath(e)) for e in truffle_cp],
         [_ClassPathEntry(os.path.abspath(e)) for e in boot_cp],
         vm_args if isinstance(vm_args, list) else list(vm_args),
-        debug_port)
+        debug_port, jobs)
 
 def set_log_level(log_level):
     """
@@ -336,7 +612,7 @@ def set_log_level(log_level):
 _MVN_DEPENDENCIES = {
     'TESTS' : [
         {'groupId':'junit', 'artifactId':'junit', 'version':'4.12', 'required':True},
-        {'groupId':'org/hamcrest', 'artifactId':'hamcrest-all', 'version':'1.3', 'required':True},
+        {'groupId':'org.hamcrest', 'artifactId':'hamcrest-all', 'version':'1.3', 'required':True},
         {'groupId':'org.graalvm.truffle', 'artifactId':'truffle-tck-tests', 'required':False},
     ],
     'TCK' : [
@@ -377,6 +653,10 @@ def _main(argv):
        python tck.py js default ExpressionTest
 
     will run TCK ExpressionTest for JavaScript language in a default mode.
+
+    Several languages can be given separated by ','. With -j <jobs>,
+    the tests are sharded by language and test class and run in <jobs>
+    JVMs in parallel.
     """
 
     parser = argparse.ArgumentParser(description='Truffle TCK Runner',
@@ -392,6 +672,10 @@ def _main(argv):
     parser.add_argument('--tck-values', type=str, dest='tck_values', help="language ids of value providers to use, separated by ','", metavar='<value providers>')
     parser.add_argument('-cp', '--class-path', type=str, dest='class_path', help='classpath containing additional TCK provider(s)', metavar='<classpath>')
     parser.add_argument('-lp', '--language-path', type=str, dest='truffle_path', help='classpath containing additinal language jar(s)', metavar='<classpath>')
+    parser.add_argument('--mvn-repository', type=str, dest='mvn_repository', help='local Maven repository to resolve the TCK artifacts in', metavar='<folder>')
+    parser.add_argument('--offline', action='store_true', dest='offline', help='resolve the TCK artifacts from the artifact cache and the local Maven repository only')
+    parser.add_argument('--no-artifact-cache', action='store_false', dest='artifact_cache', help='do not reuse the TCK artifacts installed by previous runs')
+    parser.add_argument('-j', '--jobs', type=int, dest='jobs', help='number of JVMs running TCK shards in parallel', default=1, metavar='<jobs>')
 
     usage = parser.format_usage().strip()
     if usage.startswith('usage: '):
@@ -412,7 +696,7 @@ def _main(argv):
         mode = Mode.default()
         tests_filter = []
         if len(other_args) > 0:
-            language = other_args[0]
+            language = other_args[0].split(',')
         if len(other_args) > 1:
             mode = Mode.for_name(other_args[1])
         if len(other_args) > 2:
@@ -420,10 +704,13 @@ def _main(argv):
         if parsed_args.tck_values:
             values = parsed_args.tck_values.split(',')
         os.mkdir(cache_folder)
-        boot = [_MvnClassPathEntry(e['groupId'], e['artifactId'], e['version'] if 'version' in e else parsed_args.tck_version, e['required']) for e in _MVN_DEPENDENCIES['COMMON']]
-        cp = [_MvnClassPathEntry(e['groupId'], e['artifactId'], e['version'] if 'version' in e else parsed_args.tck_version, e['required']) for e in _MVN_DEPENDENCIES['TESTS']]
-        truffle_cp = [_MvnClassPathEntry(e['groupId'], e['artifactId'], e['version'] if 'version' in e else parsed_args.tck_version, e['required']) for e in _MVN_DEPENDENCIES['INSTRUMENTS']]
-        tck = [_MvnClassPathEntry(e['groupId'], e['artifactId'], e['version'] if 'version' in e else parsed_args.tck_version, e['required']) for e in _MVN_DEPENDENCIES['TCK']]
+        def mvn_entries(key):
+            return [_MvnClassPathEntry(e['groupId'], e['artifactId'], e['version'] if 'version' in e else parsed_args.tck_version, e['required'],
+                                       parsed_args.mvn_repository, parsed_args.offline) for e in _MVN_DEPENDENCIES[key]]
+        boot = mvn_entries('COMMON')
+        cp = mvn_entries('TESTS')
+        truffle_cp = mvn_entries('INSTRUMENTS')
+        tck = mvn_entries('TCK')
         if _is_modular_jvm(parsed_args.graalvm_home):
             cp.extend(tck)
         else:
@@ -434,9 +721,8 @@ def _main(argv):
         if parsed_args.truffle_path:
             for e in parsed_args.truffle_path.split(os.pathsep):
                 truffle_cp.append(_ClassPathEntry(os.path.abspath(e)))
-        for entry in boot + cp + truffle_cp:
-            entry.install(cache_folder)
-        ret_code = _execute_tck_impl(parsed_args.graalvm_home, mode, language, values, tests_filter, cp, truffle_cp, boot, vm_args, parsed_args.dbg_port)
+        _install(boot + cp + truffle_cp, cache_folder, _ArtifactStore(os.path.join(_cache_dir(), 'mvn')) if parsed_args.artifact_cache else None)
+        ret_code = _execute_tck_impl(parsed_args.graalvm_home, mode, language, values, tests_filter, cp, truffle_cp, boot, vm_args, parsed_args.dbg_port, parsed_args.jobs)
         sys.exit(ret_code)
     except Abort as abort:
         sys.stderr.write(abort.message)
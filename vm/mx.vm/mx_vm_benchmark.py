@@ -27,6 +27,7 @@
 # ----------------------------------------------------------------------------------------------------
 import os
 import re
+import hashlib
 from os.path import dirname, join
 from traceback import print_tb
 
@@ -118,10 +119,11 @@ class NativeImageVM(GraalVm):
             self.log_dir = None
             self.pgo_iteration_num = None
             self.params = ['extra-image-build-argument', 'extra-run-arg', 'extra-agent-run-arg', 'extra-profile-run-arg',
-                           'extra-agent-profile-run-arg', 'benchmark-output-dir', 'stages', 'skip-agent-assertions']
+                           'extra-agent-profile-run-arg', 'benchmark-output-dir', 'stages', 'skip-agent-assertions', 'reuse-image']
             self.stages = {'agent', 'instrument-image', 'instrument-run', 'image', 'run'}
             self.last_stage = 'run'
             self.skip_agent_assertions = False
+            self.reuse_image = False
 
         def parse(self, args):
             def add_to_list(arg, name, arg_list):
@@ -156,6 +158,10 @@ class NativeImageVM(GraalVm):
                         self.skip_agent_assertions = trimmed_arg[len(self.params[7] + '='):] == 'true'
                         found = True
 
+                    if trimmed_arg.startswith(self.params[8] + '='):
+                        self.reuse_image = trimmed_arg[len(self.params[8] + '='):] == 'true'
+                        found = True
+
                     # not for end-users
                     if trimmed_arg.startswith('benchmark-name='):
                         self.benchmark_name = trimmed_arg[len('benchmark-name='):]
@@ -234,6 +240,47 @@ class NativeImageVM(GraalVm):
 
         return executable, classpath_arguments, system_properties, image_vm_args + image_run_args
 
+    @staticmethod
+    def _digest_path(digest, path):
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    digest.update(os.path.relpath(os.path.join(root, name), path).encode('utf-8'))
+                    NativeImageVM._digest_path(digest, os.path.join(root, name))
+        elif os.path.isfile(path):
+            with open(path, 'rb') as fp:
+                for chunk in iter(lambda: fp.read(1 << 16), b''):
+                    digest.update(chunk)
+
+    def image_digest(self, config, executable, classpath_arguments, system_properties):
+        """
+            Computes a digest of everything that goes into the image of a benchmark: the jars and directories of its
+            class path, the arguments of the image build, the VM configuration and the native-image launcher.
+            Images whose benchmark is selected with run-time arguments only, like JMH benchmarks, can thus be reused
+            for every selection as long as the digest does not change.
+        """
+        digest = hashlib.sha1()
+        native_image = os.path.join(mx_sdk_vm_impl.graalvm_home(fatalIfMissing=True), 'bin', 'native-image')
+        stat = os.stat(native_image)
+        settings = [native_image, str(stat.st_size), str(stat.st_mtime), self.config_name(), str(self.is_gate), str(self.is_llvm),
+                    str(self.hotspot_pgo), str(self.pgo_instrumented_iterations), str(config.pgo_iteration_num),
+                    str(self.pgo_inline_explored), str(self.pgo_context_sensitive)]
+        # class path entries are digested by content, so that their location does not matter
+        settings += system_properties + (executable if executable[0] != '-jar' else []) + config.extra_image_build_arguments
+        settings += config.extra_agent_run_args + config.extra_agent_profile_run_args + config.extra_profile_run_args
+        digest.update('\0'.join(settings).encode('utf-8'))
+        paths = [executable[1]] if executable[0] == '-jar' else []
+        for i, arg in enumerate(classpath_arguments):
+            if arg.startswith('--class-path='):
+                paths += arg[len('--class-path='):].split(os.pathsep)
+            elif arg in ('-cp', '-classpath', '--class-path') and i + 1 < len(classpath_arguments):
+                paths += classpath_arguments[i + 1].split(os.pathsep)
+        for path in paths:
+            digest.update(b'\0')
+            NativeImageVM._digest_path(digest, path)
+        return digest.hexdigest()
+
     class Stages:
         def __init__(self, config, bench_out, bench_err, final_image_name, is_gate, non_zero_is_fatal, cwd):
             self.stages_till_now = []
@@ -423,6 +470,18 @@ class NativeImageVM(GraalVm):
                 os.makedirs(config.config_dir)
             config.log_dir = config.output_dir
 
+            image_digest = None
+            image_digest_path = os.path.join(config.output_dir, final_image_name + '.digest')
+            if config.reuse_image and 'run' in config.stages:
+                image_digest = self.image_digest(config, executable, classpath_arguments, system_properties)
+                if os.path.exists(os.path.join(config.output_dir, final_image_name)) and os.path.exists(image_digest_path):
+                    with open(image_digest_path) as fp:
+                        if fp.read().strip() == image_digest:
+                            mx.log('Reusing the image ' + final_image_name + ' built from the same inputs')
+                            config.stages = {'run'}
+            if 'image' in config.stages and os.path.exists(image_digest_path):
+                os.remove(image_digest_path)
+
             if stages.change_stage('agent'):
                 profile_path = profile_path_no_extension + '-agent' + profile_file_extension
                 hotspot_vm_args = ['-ea', '-esa'] if self.is_gate and not config.skip_agent_assertions else []
@@ -508,6 +567,9 @@ class NativeImageVM(GraalVm):
                 final_image_command = base_image_build_args + executable_name_args + pgo_args
                 with stages.set_command(final_image_command) as s:
                     s.execute_command()
+                    if s.exit_code == 0 and image_digest:
+                        with open(image_digest_path, 'w') as fp:
+                            fp.write(image_digest)
 
             # Execute the benchmark
             if stages.change_stage('run'):